@@ -0,0 +1,34 @@
+"""Shared pytest fixtures for the script-style tests in the repository root"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path once for every test module in the root
+SRC_PATH = str(Path(__file__).parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+CONFIG_PATH = Path("config/config.yaml")
+
+
+@pytest.fixture(scope="session")
+def bot():
+    """
+    One TradingBot shared by every test in the session.
+    
+    Construction parses the config, builds the clients and opens the
+    WebSocket, so it is done once rather than per test module.
+    """
+    if not CONFIG_PATH.exists():
+        pytest.skip("config/config.yaml not found")
+    
+    from src.bot import TradingBot
+    
+    trading_bot = TradingBot(config_path=str(CONFIG_PATH))
+    yield trading_bot
+    
+    if trading_bot.telegram:
+        trading_bot.telegram.close()
+    trading_bot.market_cache.close()
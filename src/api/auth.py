@@ -36,6 +36,20 @@ class AuthManager:
             'private_key': private_key
         }
     
+    @staticmethod
+    def get_polymarket_user_channel_credentials() -> dict:
+        """
+        Get Polymarket CLOB L2 credentials for the authenticated USER channel.
+        
+        Returns:
+            Dict with api_key, api_secret and api_passphrase (values may be None)
+        """
+        return {
+            'api_key': os.getenv('POLYMARKET_API_KEY'),
+            'api_secret': os.getenv('POLYMARKET_API_SECRET'),
+            'api_passphrase': os.getenv('POLYMARKET_API_PASSPHRASE')
+        }
+    
     @staticmethod
     def get_perpdex_credentials() -> dict:
         """
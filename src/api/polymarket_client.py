@@ -1,7 +1,9 @@
 """Polymarket API client wrapper"""
 
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
 from decimal import Decimal
 from ..api.auth import AuthManager
@@ -61,6 +63,13 @@ class PolymarketClient:
         # Market data validator
         self.validator = MarketDataValidator()
         self.verbose_validation = False  # Set to True for detailed logging
+        
+        # Short-lived cache for get_account_state()
+        self._account_state: Optional[Dict[str, List[Dict]]] = None
+        self._account_state_at: float = 0.0
+        self._account_state_lock = threading.Lock()
+        # Reused by every get_account_state() miss instead of a pool per call
+        self._account_state_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='account-state')
     
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """
@@ -354,6 +363,7 @@ class PolymarketClient:
         }
         
         response = self._request('POST', endpoint, json=data)
+        self._account_state = None  # open orders changed
         
         # Register with order coordinator if provided
         if order_coordinator and 'order_id' in response:
@@ -387,7 +397,9 @@ class PolymarketClient:
             return {'status': 'cancelled', 'paper_trading': True}
         
         endpoint = f"/orders/{order_id}"
-        return self._request('DELETE', endpoint)
+        response = self._request('DELETE', endpoint)
+        self._account_state = None  # open orders changed
+        return response
     
     def get_orders(self, market_id: Optional[str] = None, status: str = "open") -> List[Dict]:
         """
@@ -430,6 +442,34 @@ class PolymarketClient:
         
         return self._request('GET', endpoint, params=params)
     
+    def get_account_state(self, ttl: float = 2.0) -> Dict[str, List[Dict]]:
+        """
+        Get positions and open orders in one call, cached for a short window.
+        
+        Both requests are issued in parallel and the result is shared by every
+        caller (e.g. several strategies) until it is older than `ttl` or an
+        order is placed or cancelled. Each caller gets its own copy of the lists.
+        
+        Args:
+            ttl: Maximum age of the cached state in seconds
+            
+        Returns:
+            Dict with 'positions' and 'open_orders' lists
+        """
+        with self._account_state_lock:
+            state = self._account_state
+            if state is None or time.monotonic() - self._account_state_at >= ttl:
+                positions_future = self._account_state_executor.submit(self.get_positions)
+                orders_future = self._account_state_executor.submit(self.get_orders, status='open')
+                state = {
+                    'positions': positions_future.result() or [],
+                    'open_orders': orders_future.result() or []
+                }
+                self._account_state = state
+                self._account_state_at = time.monotonic()
+        
+        return {key: list(value) for key, value in state.items()}
+    
     def get_balance(self) -> Dict:
         """
         Get account balance.
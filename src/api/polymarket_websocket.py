@@ -2,14 +2,54 @@
 
 import json
 import time
+import socket
 import threading
 import websocket
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
+from urllib.parse import urlparse
 from ..utils.logger import setup_logger
 
 
 logger = setup_logger(__name__)
 
+# Endpoint reachability verdicts: (host, port) -> (reachable, monotonic time checked)
+_probe_cache: Dict[Tuple[str, int], Tuple[bool, float]] = {}
+_probe_lock = threading.Lock()
+
+
+def probe_endpoint(url: str, ttl: float = 60.0, timeout: float = 1.0) -> bool:
+    """
+    Check whether a WebSocket endpoint accepts TCP connections.
+    
+    The verdict is cached per host and port for ttl seconds, so callers that
+    share an endpoint (e.g. the MARKET and USER channels) pay the timeout once.
+    
+    Args:
+        url: ws:// or wss:// endpoint URL
+        ttl: Seconds to reuse a cached verdict
+        timeout: TCP connect timeout in seconds
+        
+    Returns:
+        True if the endpoint accepted a connection
+    """
+    parsed = urlparse(url)
+    key = (parsed.hostname, parsed.port or (443 if parsed.scheme == 'wss' else 80))
+    
+    with _probe_lock:
+        cached = _probe_cache.get(key)
+    if cached and time.monotonic() - cached[1] < ttl:
+        return cached[0]
+    
+    try:
+        with socket.create_connection(key, timeout=timeout):
+            reachable = True
+    except OSError:
+        reachable = False
+    
+    with _probe_lock:
+        _probe_cache[key] = (reachable, time.monotonic())
+    return reachable
+
 
 class PolymarketWebSocketClient:
     """WebSocket client for real-time Polymarket orderbook updates"""
@@ -39,6 +79,7 @@ class PolymarketWebSocketClient:
         self.subscriptions: Dict[str, set] = {}  # market_id -> set of outcomes
         self.asset_id_map: Dict[str, tuple] = {}  # asset_id -> (market_id, outcome)
         self.orderbook_cache: Dict[str, Dict] = {}  # (market_id, outcome) -> orderbook
+        self._update_events: Dict[tuple, threading.Event] = {}  # (market_id, outcome) -> set on each book update
         self.pending_subscriptions: List[tuple] = []  # List of (market_id, outcome) to subscribe
         self.rest_client = None  # Will be set by adapter to fetch market data
         
@@ -49,6 +90,7 @@ class PolymarketWebSocketClient:
         
         # Threading
         self.lock = threading.Lock()
+        self._connected_event = threading.Event()  # set in _on_open, cleared on error/close
         self.ws_thread = None
         self.running = False
     
@@ -135,6 +177,9 @@ class PolymarketWebSocketClient:
                     'asks': asks,
                     'timestamp': time.time()
                 }
+                update_event = self._update_events.get(key)
+            if update_event is not None:
+                update_event.set()
             
             # Call callback if set
             if self.on_orderbook_update:
@@ -177,6 +222,7 @@ class PolymarketWebSocketClient:
         """Handle WebSocket errors"""
         logger.error(f"WebSocket error: {error}")
         self.connected = False
+        self._connected_event.clear()
         
         if self.on_error:
             try:
@@ -188,6 +234,7 @@ class PolymarketWebSocketClient:
         """Handle WebSocket close"""
         logger.info(f"WebSocket closed: {close_status_code} - {close_msg}")
         self.connected = False
+        self._connected_event.clear()
         
         # Attempt reconnection if running
         if self.running:
@@ -204,6 +251,7 @@ class PolymarketWebSocketClient:
         """
         logger.info("WebSocket connected")
         self.connected = True
+        self._connected_event.set()
         self.reconnect_attempts = 0
         
         # Don't subscribe with empty array - wait until we have asset_ids
@@ -397,15 +445,13 @@ class PolymarketWebSocketClient:
             )
             
             # Start WebSocket in a separate thread
+            self._connected_event.clear()
             self.running = True
             self.ws_thread = threading.Thread(target=self.ws.run_forever, daemon=True)
             self.ws_thread.start()
             
-            # Wait for connection
-            timeout = 10.0
-            start_time = time.time()
-            while not self.connected and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
+            # Wait for connection (woken by _on_open as soon as the handshake completes)
+            self._connected_event.wait(timeout=10.0)
             
             return self.connected
         
@@ -483,6 +529,48 @@ class PolymarketWebSocketClient:
         with self.lock:
             return self.orderbook_cache.get(key)
     
+    def get_update_event(self, market_id: str, outcome: str = "YES") -> threading.Event:
+        """
+        Get the event set whenever a new orderbook arrives for a market/outcome.
+        
+        Callers clear() it, then wait() for the next update instead of sleeping.
+        
+        Args:
+            market_id: Market identifier
+            outcome: Outcome type
+            
+        Returns:
+            Event shared by all waiters on this market/outcome
+        """
+        key = (market_id, outcome)
+        
+        with self.lock:
+            update_event = self._update_events.get(key)
+            if update_event is None:
+                update_event = self._update_events[key] = threading.Event()
+                # An orderbook already received counts as the first update
+                if key in self.orderbook_cache:
+                    update_event.set()
+            return update_event
+    
+    def wait_for_orderbook(self, market_id: str, outcome: str = "YES", timeout: float = 5.0) -> Optional[Dict]:
+        """
+        Wait for the next orderbook update for a market/outcome.
+        
+        Args:
+            market_id: Market identifier
+            outcome: Outcome type
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            The updated orderbook, or None if none arrived in time
+        """
+        update_event = self.get_update_event(market_id, outcome)
+        update_event.clear()
+        if not update_event.wait(timeout):
+            return None
+        return self.get_orderbook(market_id, outcome)
+    
     def disconnect(self) -> None:
         """Disconnect WebSocket"""
         self.running = False
@@ -500,3 +588,95 @@ class PolymarketWebSocketClient:
         """Check if WebSocket is connected"""
         return self.connected
 
+
+
+class PolymarketUserWebSocketClient(PolymarketWebSocketClient):
+    """WebSocket client for the authenticated USER channel (own orders and trades)"""
+    
+    WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        api_passphrase: Optional[str] = None
+    ):
+        """
+        Initialize USER channel client.
+        
+        Args:
+            api_key: CLOB API key
+            api_secret: CLOB API secret
+            api_passphrase: CLOB API passphrase
+        """
+        super().__init__(api_key=api_key)
+        self.api_secret = api_secret
+        self.api_passphrase = api_passphrase
+        
+        # Callbacks
+        self.on_order: Optional[Callable] = None
+        self.on_trade: Optional[Callable] = None
+    
+    def _on_open(self, ws):
+        """Handle WebSocket open - authenticate and subscribe to all own markets"""
+        logger.info("User channel WebSocket connected")
+        self.connected = True
+        self._connected_event.set()
+        self.reconnect_attempts = 0
+        
+        try:
+            subscribe_msg = {
+                "type": "user",
+                "markets": [],
+                "auth": {
+                    "apiKey": self.api_key,
+                    "secret": self.api_secret,
+                    "passphrase": self.api_passphrase
+                }
+            }
+            ws.send(json.dumps(subscribe_msg))
+        except Exception as e:
+            logger.error(f"Failed to subscribe to user channel: {e}")
+        
+        if self.on_connect:
+            try:
+                self.on_connect()
+            except Exception as e:
+                logger.error(f"Error in connect callback: {e}")
+    
+    def _on_message(self, ws, message):
+        """
+        Handle incoming USER channel messages.
+        
+        Messages have event_type "order" (placement/update/cancellation) or
+        "trade" (fill status changes).
+        """
+        try:
+            data = json.loads(message)
+            
+            # The server may batch events into a list
+            events = data if isinstance(data, list) else [data]
+            
+            for event in events:
+                if not isinstance(event, dict):
+                    continue
+                
+                event_type = event.get('event_type', '').lower()
+                callback = None
+                if event_type == 'order':
+                    callback = self.on_order
+                elif event_type == 'trade':
+                    callback = self.on_trade
+                else:
+                    logger.debug(f"Unknown user channel message type: {event_type}")
+                
+                if callback:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        logger.error(f"Error in {event_type} callback: {e}")
+        
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse user channel message: {e}")
+        except Exception as e:
+            logger.error(f"Error handling user channel message: {e}")
@@ -3,7 +3,9 @@
 import os
 import time
 import signal
+import threading
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -111,7 +113,11 @@ class TradingBot:
         
         # Initialize market cache for parallel fetching
         cache_ttl = self.config.get('market_cache_ttl', 5.0)
-        self.market_cache = MarketCache(self.polymarket_client, cache_ttl=cache_ttl)
+        self.market_cache = MarketCache(
+            self.polymarket_client,
+            cache_ttl=cache_ttl,
+            async_prices=self.config.get('market_cache_async_prices', False)
+        )
         
         # Initialize strategies
         self.strategies: Dict[str, BaseStrategy] = {}
@@ -122,6 +128,12 @@ class TradingBot:
         
         # Bot state
         self.running = False
+        # Set by stop(); the main loop waits on it between iterations so it wakes immediately
+        self.stop_event = threading.Event()
+        # Long-lived workers for the per-iteration strategy prescan
+        self._scan_executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.strategies)), thread_name_prefix="strategy-scan"
+        )
         self.iteration_count = 0
         self.total_trades = 0
         
@@ -149,7 +161,13 @@ class TradingBot:
             self.config.get('telegram_bot_token')
         )
         telegram_chat_id = telegram_config.get('chat_id')
-        self.telegram = TelegramNotifier(telegram_token, telegram_chat_id) if telegram_token else None
+        self.telegram = TelegramNotifier(
+            telegram_token,
+            telegram_chat_id,
+            batch_flush_interval=telegram_config.get('batch_flush_interval', 3.0),
+            batch_quiet_interval=telegram_config.get('batch_quiet_interval', 0.5),
+            notify_timeout=telegram_config.get('notify_timeout', 1.5)
+        ) if telegram_token else None
         
         # Try to detect chat_id if not set
         if self.telegram and not self.telegram.chat_id:
@@ -305,7 +323,10 @@ class TradingBot:
         """Run API health check on startup"""
         try:
             logger.info("Running startup API health check...")
-            health_check = APIHealthCheck(self.polymarket_client)
+            health_check = APIHealthCheck(
+                self.polymarket_client,
+                probe_timeout_s=self.config_loader.get('health.probe_timeout_s', 2.0)
+            )
             results = health_check.run_full_check()
             
             if results['overall_status'] != 'healthy':
@@ -349,17 +370,31 @@ class TradingBot:
         
         logger.debug(f"=== Iteration {self.iteration_count + 1} ===")
         
-        # Run each strategy
+        enabled_strategies = {}
         for strategy_name, strategy in self.strategies.items():
             if not strategy.is_enabled():
                 logger.debug(f"Strategy {strategy_name} is disabled, skipping")
                 continue
-            
+            enabled_strategies[strategy_name] = strategy
+        
+        # Scan all strategies concurrently so their network waits overlap
+        scan_start = time.time()
+        scan_results = self._scan_strategies(enabled_strategies)
+        logger.debug(f"Scanned {len(scan_results)} strategies concurrently in {time.time() - scan_start:.2f}s")
+        
+        # Run each strategy (trades are executed one strategy at a time)
+        for strategy_name, strategy in enabled_strategies.items():
             try:
                 strategy_start = time.time()
                 logger.debug(f"Running strategy: {strategy_name}")
                 
-                trades = strategy.run()
+                if strategy_name in scan_results:
+                    opportunities = scan_results[strategy_name]
+                    if isinstance(opportunities, Exception):
+                        raise opportunities
+                    trades = strategy.run(opportunities)
+                else:
+                    trades = strategy.run()
                 trades_executed += len(trades)
                 self.total_trades += len(trades)
                 
@@ -421,23 +456,61 @@ class TradingBot:
         self.iteration_count += 1
         return trades_executed
     
+    def _scan_strategies(self, strategies: Dict[str, BaseStrategy]) -> Dict[str, object]:
+        """
+        Scan strategies concurrently on the bot's scan workers.
+        
+        Strategies that override run() manage their own scan/execute cycle,
+        and strategies that override iter_opportunities() execute while they
+        scan (their position caps and signal latency depend on it), so both
+        are left out and run normally.
+        
+        Args:
+            strategies: Strategy name -> strategy
+            
+        Returns:
+            Strategy name -> list of opportunities, or the exception raised by its scan
+        """
+        futures = {
+            name: self._scan_executor.submit(strategy.scan_opportunities)
+            for name, strategy in strategies.items()
+            if type(strategy).run is BaseStrategy.run
+            and type(strategy).iter_opportunities is BaseStrategy.iter_opportunities
+        }
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+        return results
+    
     def _check_stop_losses(self) -> None:
         """Check all positions for stop loss triggers"""
-        for position_id, position in list(self.risk_manager.position_tracker.positions.items()):
+        positions = dict(self.risk_manager.position_tracker.positions)
+        
+        # Get current prices, then check every position in one pass
+        current_prices = {}
+        for position_id, position in positions.items():
             try:
-                # Get current price
                 prices = self.polymarket_client.get_best_price(position.market_id, outcome="YES")
                 current_price = prices.get('bid') or prices.get('ask')
+                if current_price:
+                    current_prices[position_id] = current_price
+            except Exception as e:
+                logger.debug(f"Error checking stop loss for {position_id}: {e}")
+        
+        for position_id in self.risk_manager.check_stop_losses(current_prices):
+            position = positions[position_id]
+            try:
+                # Close position
+                closed_position = self.risk_manager.close_position(position_id, current_prices[position_id])
+                logger.warning(f"Stop loss triggered for position {position_id}")
                 
-                if current_price and self.risk_manager.check_stop_loss(position_id, current_price):
-                    # Close position
-                    closed_position = self.risk_manager.close_position(position_id, current_price)
-                    logger.warning(f"Stop loss triggered for position {position_id}")
-                    
-                    # Send Telegram notification
-                    if self.telegram and closed_position:
-                        profit = closed_position.pnl if hasattr(closed_position, 'pnl') else 0.0
-                        self.telegram.trade_completed(position.strategy, position.market_id, profit)
+                # Send Telegram notification
+                if self.telegram and closed_position:
+                    profit = closed_position.pnl if hasattr(closed_position, 'pnl') else 0.0
+                    self.telegram.trade_completed(position.strategy, position.market_id, profit)
             
             except Exception as e:
                 logger.debug(f"Error checking stop loss for {position_id}: {e}")
@@ -508,6 +581,7 @@ class TradingBot:
         trade_logger.info("🤖 Bot is running...")
         
         self.running = True
+        self.stop_event.clear()
         
         # Send Telegram notification (after running is set and chat_id is detected)
         if self.telegram:
@@ -558,7 +632,7 @@ class TradingBot:
                 
                 if sleep_time > 0:
                     logger.debug(f"Sleeping for {sleep_time:.2f}s until next iteration")
-                    time.sleep(sleep_time)
+                    self.stop_event.wait(sleep_time)
                 else:
                     error_logger.warning(f"Iteration took {elapsed:.2f}s, longer than polling interval of {polling_interval}s")
         
@@ -577,6 +651,7 @@ class TradingBot:
         
         logger.info("Stopping trading bot...")
         self.running = False
+        self.stop_event.set()
         
         # Log final statistics
         metrics = self.risk_manager.get_risk_metrics()
@@ -591,6 +666,7 @@ class TradingBot:
         # Send Telegram notification
         if self.telegram:
             self.telegram.bot_stopped(self.total_trades, metrics['total_pnl'])
+            self.telegram.close()
         
         # Print profitability summary
         if profit_stats['total_trades'] > 0:
@@ -598,6 +674,9 @@ class TradingBot:
         
         # Save final state
         self._save_state()
+        
+        self._scan_executor.shutdown(wait=False, cancel_futures=True)
+        self.market_cache.close()
     
     def get_status(self) -> Dict:
         """
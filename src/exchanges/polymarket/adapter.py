@@ -1,9 +1,14 @@
 """Unified Polymarket exchange adapter"""
 
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from ...exchanges.base_exchange import BaseExchange
 from .rest_client import PolymarketRESTClient
-from ...api.polymarket_websocket import PolymarketWebSocketClient
+from ...api.polymarket_websocket import PolymarketWebSocketClient, PolymarketUserWebSocketClient
+from ...api.auth import AuthManager
+from ...risk.account_tracker import AccountTracker
 from ...utils.logger import setup_logger
 
 
@@ -40,11 +45,26 @@ class PolymarketAdapter(BaseExchange):
         self.ws_client: Optional[PolymarketWebSocketClient] = None
         self.use_websocket = False
         
-        if use_websocket:
-            self._enable_websocket()
-        
         # Order coordinator reference (set by bot)
         self._order_coordinator = None
+        
+        # Account state for get_account_state(): fed by USER channel events when
+        # available, reconciled with REST at most every account_reconcile_interval
+        self.account_tracker = AccountTracker(owner=self.rest_client.api_key)
+        self.account_reconcile_interval = 60.0
+        self.user_ws_client: Optional[PolymarketUserWebSocketClient] = None
+        self._account_state_lock = threading.Lock()
+        # Reused by every REST reconcile instead of a pool per call
+        self._account_state_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='account-state')
+        
+        if use_websocket and not paper_trading:
+            # The market and USER channel handshakes are independent; wait for both at once
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='ws-connect') as pool:
+                market_ws = pool.submit(self._enable_websocket)
+                self._enable_user_channel()
+                market_ws.result()
+        elif use_websocket:
+            self._enable_websocket()
     
     def _enable_websocket(self) -> bool:
         """Enable WebSocket client"""
@@ -77,6 +97,28 @@ class PolymarketAdapter(BaseExchange):
             logger.error(f"Error enabling WebSocket: {e}")
             return False
     
+    def _enable_user_channel(self) -> bool:
+        """Subscribe to own order/trade events so account state is updated on fills"""
+        creds = AuthManager.get_polymarket_user_channel_credentials()
+        if not creds['api_secret'] or not creds['api_passphrase']:
+            logger.info("USER channel credentials not set, account state will be polled via REST")
+            return False
+        
+        try:
+            self.user_ws_client = PolymarketUserWebSocketClient(**creds)
+            self.user_ws_client.on_order = self.account_tracker.apply_order_event
+            self.user_ws_client.on_trade = self.account_tracker.apply_trade_event
+            
+            if self.user_ws_client.connect():
+                logger.info("✅ USER channel enabled for event-driven positions")
+                return True
+            
+            logger.warning("⚠️  Failed to connect USER channel, account state will be polled via REST")
+            return False
+        except Exception as e:
+            logger.error(f"Error enabling USER channel: {e}")
+            return False
+    
     def is_connected(self) -> bool:
         """Check if exchange is connected"""
         # REST is always available, WebSocket is optional
@@ -167,6 +209,7 @@ class PolymarketAdapter(BaseExchange):
     ) -> Dict:
         """Place order"""
         result = self.rest_client.place_order(market_id, outcome, side, size, price)
+        self._invalidate_account_state()
         
         # Register with order coordinator if provided
         if order_coordinator and 'order_id' in result:
@@ -187,7 +230,15 @@ class PolymarketAdapter(BaseExchange):
     
     def cancel_order(self, order_id: str) -> Dict:
         """Cancel order"""
-        return self.rest_client.cancel_order(order_id)
+        result = self.rest_client.cancel_order(order_id)
+        self._invalidate_account_state()
+        return result
+    
+    def _invalidate_account_state(self) -> None:
+        """Refetch account state on the next get_account_state() after an order change"""
+        # The USER channel reports our own order changes, so only polled state goes stale
+        if not (self.user_ws_client and self.user_ws_client.is_connected()):
+            self.account_tracker.last_reconcile = 0.0
     
     def get_orders(self, market_id: Optional[str] = None, status: str = "open") -> List[Dict]:
         """Get orders"""
@@ -197,6 +248,39 @@ class PolymarketAdapter(BaseExchange):
         """Get positions"""
         return self.rest_client.get_positions(market_id=market_id)
     
+    def get_account_state(self, ttl: float = 2.0) -> Dict[str, List[Dict]]:
+        """
+        Get positions and open orders in one call.
+        
+        While the USER channel is connected, state is served from memory and
+        only reconciled with REST every `account_reconcile_interval` seconds.
+        Otherwise it is refetched once older than `ttl` or after an order is
+        placed or cancelled. REST requests are issued in parallel and the
+        result is shared by every caller.
+        
+        Args:
+            ttl: Maximum age of polled state in seconds (without USER channel)
+            
+        Returns:
+            Dict with 'positions' and 'open_orders' lists
+        """
+        if self.user_ws_client and self.user_ws_client.is_connected():
+            max_age = self.account_reconcile_interval
+        else:
+            max_age = ttl
+        
+        with self._account_state_lock:
+            if self.account_tracker.seconds_since_reconcile() < max_age:
+                return self.account_tracker.snapshot()
+            
+            positions_future = self._account_state_executor.submit(self.get_positions)
+            orders_future = self._account_state_executor.submit(self.get_orders, status='open')
+            positions = positions_future.result() or []
+            open_orders = orders_future.result() or []
+            
+            self.account_tracker.reconcile(positions, open_orders)
+            return self.account_tracker.snapshot()
+    
     def get_balance(self) -> Dict:
         """Get balance"""
         return self.rest_client.get_balance()
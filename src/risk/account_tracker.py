@@ -0,0 +1,180 @@
+"""Event-driven exchange account state (positions and open orders)"""
+
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+from ..utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class AccountTracker:
+    """
+    In-memory mirror of the exchange account.
+    
+    Updated from CLOB user-channel `order` and `trade` events, and periodically
+    reconciled against REST snapshots as a safety net. Reads never touch the
+    network.
+    """
+    
+    def __init__(self, owner: Optional[str] = None):
+        """
+        Initialize account tracker.
+        
+        Args:
+            owner: API key the exchange reports as `owner` on our maker orders
+                (optional; maker fills are also recognised by tracked order ID)
+        """
+        self.owner = owner
+        self.positions: Dict[Tuple[str, str], Dict] = {}  # (market_id, outcome) -> position
+        self.open_orders: Dict[str, Dict] = {}  # order_id -> order
+        # trade id -> position deltas applied on MATCHED, undone if the trade FAILS
+        self._pending_fills: Dict[str, List[Tuple[Tuple[str, str], float]]] = {}
+        self.last_reconcile: float = 0.0  # time.monotonic() of last REST reconcile
+        self.lock = threading.Lock()
+    
+    def reconcile(self, positions: List[Dict], open_orders: List[Dict]) -> None:
+        """
+        Replace tracked state with a REST snapshot.
+        
+        Args:
+            positions: Positions as returned by get_positions()
+            open_orders: Open orders as returned by get_orders(status='open')
+        """
+        with self.lock:
+            self.positions = {
+                (pos.get('market_id'), pos.get('outcome')): dict(pos) for pos in positions
+            }
+            self.open_orders = {
+                order.get('order_id') or order.get('id') or str(i): dict(order)
+                for i, order in enumerate(open_orders)
+            }
+            self.last_reconcile = time.monotonic()
+    
+    def seconds_since_reconcile(self) -> float:
+        """Seconds elapsed since the last REST reconcile"""
+        if not self.last_reconcile:
+            return float('inf')
+        return time.monotonic() - self.last_reconcile
+    
+    def apply_order_event(self, event: Dict) -> None:
+        """
+        Apply a user-channel `order` event.
+        
+        PLACEMENT and UPDATE keep the order open until it is fully matched;
+        CANCELLATION removes it.
+        
+        Args:
+            event: Raw user-channel message
+        """
+        order_id = event.get('id')
+        if not order_id:
+            return
+        
+        event_type = (event.get('type') or '').upper()
+        original_size = float(event.get('original_size') or 0)
+        size_matched = float(event.get('size_matched') or 0)
+        
+        with self.lock:
+            if event_type == 'CANCELLATION' or (original_size and size_matched >= original_size):
+                self.open_orders.pop(order_id, None)
+                return
+            
+            self.open_orders[order_id] = {
+                'order_id': order_id,
+                'market_id': event.get('market'),
+                'outcome': event.get('outcome'),
+                'side': (event.get('side') or '').lower(),
+                'price': float(event.get('price') or 0),
+                'size': original_size - size_matched
+            }
+    
+    def apply_trade_event(self, event: Dict) -> None:
+        """
+        Apply a user-channel `trade` event to the positions it fills.
+        
+        The initial MATCHED status moves the position. When we are the maker the
+        top-level side and size are the taker's, so our own entries in
+        `maker_orders` are used instead. A fill that later reports FAILED is
+        reverted; other transitions (MINED, CONFIRMED, ...) refer to the same fill.
+        
+        Args:
+            event: Raw user-channel message
+        """
+        status = (event.get('status') or '').upper()
+        trade_id = event.get('id')
+        
+        if status == 'FAILED':
+            with self.lock:
+                fills = self._pending_fills.pop(trade_id, [])
+                for key, size in fills:
+                    self._add_to_position(key, -size)
+            if fills:
+                logger.debug(f"Reverted failed trade {trade_id}")
+            return
+        if status == 'CONFIRMED':
+            with self.lock:
+                self._pending_fills.pop(trade_id, None)
+            return
+        if status != 'MATCHED':
+            return
+        
+        market_id = event.get('market')
+        if not market_id:
+            return
+        
+        with self.lock:
+            fills = [((market_id, outcome), size) for outcome, size in self._our_fills(event)]
+            for key, size in fills:
+                self._add_to_position(key, size)
+            if trade_id:
+                self._pending_fills[trade_id] = fills
+        
+        for (_, outcome), size in fills:
+            logger.debug(f"Fill: {market_id} {outcome} {size:+.2f}")
+    
+    def _our_fills(self, event: Dict) -> List[Tuple[str, float]]:
+        """(outcome, signed size) of our side of a trade (call with the lock held)"""
+        taker_side = (event.get('side') or '').lower()
+        if (event.get('trader_side') or '').upper() != 'MAKER':
+            size = float(event.get('size') or 0)
+            return [(event.get('outcome'), -size if taker_side == 'sell' else size)]
+        
+        fills = []
+        for maker_order in event.get('maker_orders') or []:
+            ours = maker_order.get('order_id') in self.open_orders or (
+                self.owner is not None and maker_order.get('owner') == self.owner
+            )
+            if not ours:
+                continue
+            # Makers take the other side of the taker unless the entry says otherwise
+            side = (maker_order.get('side') or ('buy' if taker_side == 'sell' else 'sell')).lower()
+            size = float(maker_order.get('matched_amount') or 0)
+            fills.append((maker_order.get('outcome') or event.get('outcome'), -size if side == 'sell' else size))
+        return fills
+    
+    def _add_to_position(self, key: Tuple[str, str], size: float) -> None:
+        """Add a signed size to a position, dropping it once flat (call with the lock held)"""
+        market_id, outcome = key
+        position = self.positions.setdefault(key, {
+            'market_id': market_id,
+            'outcome': outcome,
+            'size': 0.0
+        })
+        position['size'] = float(position.get('size', 0)) + size
+        if position['size'] <= 0:
+            del self.positions[key]
+    
+    def snapshot(self) -> Dict[str, List[Dict]]:
+        """
+        Get current state in the get_account_state() format.
+        
+        Returns:
+            Dict with 'positions' and 'open_orders' lists
+        """
+        with self.lock:
+            return {
+                'positions': [dict(position) for position in self.positions.values()],
+                'open_orders': [dict(order) for order in self.open_orders.values()]
+            }
@@ -1,7 +1,8 @@
 """Risk management engine"""
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
+import numpy as np
 from ..utils.logger import setup_logger
 from ..risk.position_tracker import PositionTracker, Position
 
@@ -131,6 +132,38 @@ class RiskManager:
         
         return False
     
+    def check_stop_losses(self, current_prices: Dict[str, float]) -> List[str]:
+        """
+        Check many positions for stop loss in one vectorized pass.
+        
+        Same rule as check_stop_loss; positions that are not tracked are ignored.
+        
+        Args:
+            current_prices: Position identifier -> current market price
+            
+        Returns:
+            Identifiers of positions whose stop loss triggered
+        """
+        positions = self.position_tracker.positions
+        ids = [position_id for position_id in current_prices if position_id in positions]
+        if not ids:
+            return []
+        
+        entry = np.fromiter((positions[i].entry_price for i in ids), dtype=np.float64, count=len(ids))
+        current = np.fromiter((current_prices[i] for i in ids), dtype=np.float64, count=len(ids))
+        direction = np.fromiter((1.0 if positions[i].side == 'buy' else -1.0 for i in ids), dtype=np.float64, count=len(ids))
+        
+        # Current P&L percentage, sign flipped for sells; zero entry prices never
+        # trigger (check_stop_loss raises ZeroDivisionError on them)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_pct = direction * (current - entry) / entry * 100
+        
+        triggered = []
+        for i in np.flatnonzero((pnl_pct <= -self.stop_loss_pct) & (entry != 0)):
+            logger.warning(f"Stop loss triggered for {ids[i]}: {pnl_pct[i]:.2f}%")
+            triggered.append(ids[i])
+        return triggered
+    
     def get_risk_metrics(self) -> Dict:
         """
         Get current risk metrics.
@@ -1,7 +1,7 @@
 """Base strategy class"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, Iterable, Iterator, List, Optional, Any, TYPE_CHECKING
 from ..api.polymarket_client import PolymarketClient
 from ..api.perpdex_client import PerpdexClient
 from ..risk.risk_manager import RiskManager
@@ -60,6 +60,19 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def iter_opportunities(self) -> Iterator[Dict]:
+        """
+        Yield trading opportunities as they are found.
+        
+        The default materializes scan_opportunities(). Strategies that can
+        stream override this so run() executes each opportunity while the
+        scan is still in progress.
+        
+        Yields:
+            Opportunity dictionaries
+        """
+        yield from self.scan_opportunities()
+    
     @abstractmethod
     def execute_trade(self, opportunity: Dict) -> Optional[Dict]:
         """
@@ -73,10 +86,16 @@ class BaseStrategy(ABC):
         """
         pass
     
-    def run(self) -> List[Dict]:
+    def run(self, opportunities: Optional[Iterable[Dict]] = None) -> List[Dict]:
         """
         Run strategy: scan and execute trades.
         
+        Opportunities are executed as iter_opportunities() yields them.
+        
+        Args:
+            opportunities: Already scanned opportunities to execute instead
+                of scanning (e.g. from the bot's concurrent prescan)
+        
         Returns:
             List of executed trades
         """
@@ -91,28 +110,25 @@ class BaseStrategy(ABC):
         scan_start = time.time()
         logger.debug(f"  [{self.name}] Scanning for opportunities...")
         
-        opportunities = self.scan_opportunities()
-        scan_time = time.time() - scan_start
-        
-        logger.debug(f"  [{self.name}] Found {len(opportunities)} opportunities (scan took {scan_time:.2f}s)")
-        
-        if opportunities:
-            # Log summary of top opportunities (debug only)
-            for i, opp in enumerate(opportunities[:3]):  # Show top 3
-                market_id = opp.get('market_id', 'unknown')[:20]  # Truncate long IDs
-                if 'profit_pct' in opp:
-                    logger.debug(f"    Opportunity {i+1}: Market {market_id} | Profit: {opp['profit_pct']:.2f}%")
-                elif 'current_spread_pct' in opp:
-                    logger.debug(f"    Opportunity {i+1}: Market {market_id} | Spread: {opp['current_spread_pct']:.2f}%")
-        
         executed_trades = []
+        found = 0
         
-        if opportunities:
-            logger.debug(f"  [{self.name}] Attempting to execute trades on {len(opportunities)} opportunities...")
+        if opportunities is None:
+            opportunities = self.iter_opportunities()
         
         for i, opportunity in enumerate(opportunities):
+            found += 1
+            
+            # Log summary of top opportunities (debug only)
+            if i < 3:  # Show top 3
+                market_id = opportunity.get('market_id', 'unknown')[:20]  # Truncate long IDs
+                if 'profit_pct' in opportunity:
+                    logger.debug(f"    Opportunity {i+1}: Market {market_id} | Profit: {opportunity['profit_pct']:.2f}%")
+                elif 'current_spread_pct' in opportunity:
+                    logger.debug(f"    Opportunity {i+1}: Market {market_id} | Spread: {opportunity['current_spread_pct']:.2f}%")
+            
             try:
-                logger.debug(f"  [{self.name}] Executing trade {i+1}/{len(opportunities)}...")
+                logger.debug(f"  [{self.name}] Executing trade {i+1}...")
                 result = self.execute_trade(opportunity)
                 if result:
                     executed_trades.append(result)
@@ -122,8 +138,11 @@ class BaseStrategy(ABC):
             except Exception as e:
                 error_logger.error(f"  [{self.name}] ✗ Error executing trade {i+1}: {e}", exc_info=True)
         
-        if opportunities and not executed_trades:
-            logger.debug(f"  [{self.name}] Found {len(opportunities)} opportunities but executed 0 trades")
+        scan_time = time.time() - scan_start
+        logger.debug(f"  [{self.name}] Found {found} opportunities (scan and execution took {scan_time:.2f}s)")
+        
+        if found and not executed_trades:
+            logger.debug(f"  [{self.name}] Found {found} opportunities but executed 0 trades")
         
         return executed_trades
     
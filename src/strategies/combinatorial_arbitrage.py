@@ -6,11 +6,14 @@ import re
 from ..strategies.base_strategy import BaseStrategy
 from ..utils.logger import setup_logger, get_trade_logger, get_error_logger
 from ..utils.market_analyzer import MarketAnalyzer
+from ..utils.market_utils import market_id as get_market_id
 
 logger = setup_logger(__name__)
 trade_logger = get_trade_logger()
 error_logger = get_error_logger()
 
+_WORD_RE = re.compile(r'\w+')
+
 class CombinatorialStrategy(BaseStrategy):
     """
     Combinatorial Arbitrage Strategy:
@@ -46,19 +49,28 @@ class CombinatorialStrategy(BaseStrategy):
             if not isinstance(markets, list):
                 return []
                 
-            # Group by keyword
-            grouped_markets = {k: [] for k in self.keywords}
+            # Group by keyword (one pass over the markets for all keywords)
+            grouped_markets = self.analyzer.find_correlated_markets_multi(markets, self.keywords)
             
-            for market in markets:
-                question = market.get('question', '').lower()
-                for keyword in self.keywords:
-                    if keyword.lower() in question:
-                        grouped_markets[keyword].append(market)
+            # YES prices for every market that can form a pair, in one cache call
+            yes_prices = {}
+            if self.market_cache:
+                pair_ids = {
+                    get_market_id(m)
+                    for group in grouped_markets.values() if len(group) >= 2
+                    for m in group
+                }
+                pair_ids.discard(None)
+                if pair_ids:
+                    yes_prices = self.market_cache.get_prices_bulk(list(pair_ids), 'YES')
             
             # Analyze groups
             for keyword, group in grouped_markets.items():
                 if len(group) < 2:
                     continue
+                
+                # Tokenize each question once rather than once per pair
+                word_sets = [self._word_set(m.get('question') or '') for m in group]
                     
                 # Compare pairs in group
                 # This is O(N^2) per group, but N is usually small (< 10)
@@ -67,8 +79,8 @@ class CombinatorialStrategy(BaseStrategy):
                         m1 = group[i]
                         m2 = group[j]
                         
-                        m1_id = m1.get('id') or m1.get('market_id')
-                        m2_id = m2.get('id') or m2.get('market_id')
+                        m1_id = get_market_id(m1)
+                        m2_id = get_market_id(m2)
                         
                         if not m1_id or not m2_id:
                             continue
@@ -76,8 +88,8 @@ class CombinatorialStrategy(BaseStrategy):
                         # Get YES prices
                         try:
                             if self.market_cache:
-                                p1 = self.market_cache.get_price(m1_id, outcome='YES')
-                                p2 = self.market_cache.get_price(m2_id, outcome='YES')
+                                p1 = yes_prices.get(m1_id)
+                                p2 = yes_prices.get(m2_id)
                             else:
                                 p1 = self.polymarket_client.get_best_price(m1_id, outcome='YES')
                                 p2 = self.polymarket_client.get_best_price(m2_id, outcome='YES')
@@ -94,7 +106,7 @@ class CombinatorialStrategy(BaseStrategy):
                                     
                                     # Very basic heuristic: if questions are very similar, prices should be similar
                                     # Similarity check (e.g., mostly same words)
-                                    sim_score = self._calculate_similarity(m1.get('question'), m2.get('question'))
+                                    sim_score = self._jaccard(word_sets[i], word_sets[j])
                                     
                                     if sim_score > self.similarity_threshold:
                                         logger.info(f"[{self.name}] Found divergence for '{keyword}':")
@@ -123,12 +135,18 @@ class CombinatorialStrategy(BaseStrategy):
         """Simple Jaccard similarity of words"""
         if not s1 or not s2:
             return 0.0
-            
-        set1 = set(re.findall(r'\w+', s1.lower()))
-        set2 = set(re.findall(r'\w+', s2.lower()))
-        
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        return self._jaccard(self._word_set(s1), self._word_set(s2))
+    
+    @staticmethod
+    def _word_set(text: str) -> Set[str]:
+        """Lowercased word tokens of a question"""
+        return set(_WORD_RE.findall(text.lower()))
+    
+    @staticmethod
+    def _jaccard(set1: Set[str], set2: Set[str]) -> float:
+        """Jaccard similarity of two word sets (0.0 if both are empty)"""
+        intersection = len(set1 & set2)
+        union = len(set1) + len(set2) - intersection
         
         if union == 0:
             return 0.0
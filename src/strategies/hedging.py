@@ -4,6 +4,7 @@ from typing import Dict, List, Optional
 from ..strategies.base_strategy import BaseStrategy
 from ..risk.position_tracker import Position
 from ..utils.logger import setup_logger, get_trade_logger, get_error_logger
+from ..utils.market_utils import market_id as get_market_id
 
 
 logger = setup_logger(__name__)
@@ -56,7 +57,7 @@ class HedgingStrategy(BaseStrategy):
                 if not any(keyword in question for keyword in self.btc_market_keywords):
                     continue
                 
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
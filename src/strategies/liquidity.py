@@ -5,6 +5,7 @@ from ..strategies.base_strategy import BaseStrategy
 from ..risk.position_tracker import Position
 from ..utils.logger import setup_logger
 from ..utils.market_analyzer import MarketAnalyzer
+from ..utils.market_utils import market_id as get_market_id
 
 
 logger = setup_logger(__name__)
@@ -63,7 +64,7 @@ class LiquidityStrategy(BaseStrategy):
                 if not isinstance(market, dict):
                     continue
                     
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
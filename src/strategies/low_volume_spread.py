@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from ..strategies.base_strategy import BaseStrategy
 from ..risk.position_tracker import Position
 from ..utils.logger import setup_logger, get_trade_logger, get_error_logger
+from ..utils.market_utils import market_id as get_market_id
 
 
 logger = setup_logger(__name__)
@@ -65,7 +66,7 @@ class LowVolumeSpreadStrategy(BaseStrategy):
                 if not isinstance(market, dict):
                     continue
                 
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from ..strategies.base_strategy import BaseStrategy
 from ..utils.logger import setup_logger, get_trade_logger, get_error_logger
+from ..utils.market_utils import market_id as get_market_id
 
 logger = setup_logger(__name__)
 trade_logger = get_trade_logger()
@@ -158,7 +159,7 @@ class MarketMakingStrategy(BaseStrategy):
                 if not isinstance(market, dict):
                     continue
                 
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                     
@@ -5,6 +5,7 @@ from ..strategies.base_strategy import BaseStrategy
 from ..risk.position_tracker import Position
 from ..utils.logger import setup_logger
 from ..utils.market_analyzer import MarketAnalyzer
+from ..utils.market_utils import market_id as get_market_id
 
 
 logger = setup_logger(__name__)
@@ -56,7 +57,7 @@ class MicroSpreadStrategy(BaseStrategy):
                 if not isinstance(market, dict):
                     continue
                     
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
@@ -66,20 +67,20 @@ class MicroSpreadStrategy(BaseStrategy):
             
             # Fetch prices in parallel if cache available
             if self.market_cache and market_outcomes:
-                price_results = self.market_cache.get_prices_parallel(market_outcomes, max_workers=10)
+                price_results = self.market_cache.get_prices_parallel(market_outcomes)
             else:
                 price_results = {}
             
             # Process markets with fetched prices
             for market in markets:
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
                 try:
                     # Check both YES and NO outcomes
                     for outcome in ["YES", "NO"]:
-                        cache_key = f"{market_id}_{outcome}"
+                        cache_key = (market_id, outcome)
                         if cache_key in price_results:
                             prices = price_results[cache_key]
                         elif self.market_cache:
@@ -98,7 +99,7 @@ class MicroSpreadStrategy(BaseStrategy):
                             # Calculate potential profit
                             profit_info = self.analyzer.calculate_micro_spread_profit(bid, ask)
                             
-                            if profit_info['profit_pct'] >= self.min_profit_pct:
+                            if profit_info.profit_pct >= self.min_profit_pct:
                                 spread_pct = self.analyzer.calculate_spread(bid, ask)
                                 
                                 if spread_pct <= self.max_spread_pct:
@@ -107,7 +108,7 @@ class MicroSpreadStrategy(BaseStrategy):
                                         'outcome': outcome,
                                         'buy_price': bid,
                                         'sell_price': ask,
-                                        'profit_pct': profit_info['profit_pct'],
+                                        'profit_pct': profit_info.profit_pct,
                                         'spread_pct': spread_pct,
                                         'market_question': market.get('question')
                                     }
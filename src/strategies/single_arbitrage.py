@@ -5,6 +5,7 @@ from ..strategies.base_strategy import BaseStrategy
 from ..risk.position_tracker import Position
 from ..utils.logger import setup_logger
 from ..utils.market_analyzer import MarketAnalyzer
+from ..utils.market_utils import market_id as get_market_id
 
 
 logger = setup_logger(__name__)
@@ -52,7 +53,7 @@ class SingleArbitrageStrategy(BaseStrategy):
                 if not isinstance(market, dict):
                     continue
                     
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
@@ -80,15 +81,15 @@ class SingleArbitrageStrategy(BaseStrategy):
                     # Check for arbitrage opportunity
                     arb_opp = self.analyzer.find_arbitrage_opportunity(yes_ask, no_ask)
                     
-                    if arb_opp and arb_opp['total_price'] <= self.max_total_price:
-                        if arb_opp['profit_pct'] >= self.min_profit_pct:
+                    if arb_opp and arb_opp.total_price <= self.max_total_price:
+                        if arb_opp.profit_pct >= self.min_profit_pct:
                             opportunity = {
                                 'market_id': market_id,
                                 'yes_price': yes_ask,
                                 'no_price': no_ask,
-                                'total_price': arb_opp['total_price'],
-                                'profit': arb_opp['profit'],
-                                'profit_pct': arb_opp['profit_pct'],
+                                'total_price': arb_opp.total_price,
+                                'profit': arb_opp.profit,
+                                'profit_pct': arb_opp.profit_pct,
                                 'market_question': market.get('question'),
                                 'resolution_source': market.get('resolution_source', '')
                             }
@@ -105,7 +106,7 @@ class SingleArbitrageStrategy(BaseStrategy):
                 if not isinstance(market, dict):
                     continue
                     
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id:
                     continue
                 
@@ -129,15 +130,15 @@ class SingleArbitrageStrategy(BaseStrategy):
                         if len(outcome_prices) == len(outcomes):
                             arb_opp = self.analyzer.find_multi_choice_arbitrage(outcome_prices)
                             
-                            if arb_opp and arb_opp['total_price'] <= self.max_total_price:
-                                if arb_opp['profit_pct'] >= self.min_profit_pct:
+                            if arb_opp and arb_opp.total_price <= self.max_total_price:
+                                if arb_opp.profit_pct >= self.min_profit_pct:
                                     opportunity = {
                                         'market_id': market_id,
                                         'outcome_prices': outcome_prices,
                                         'outcomes': outcomes,
-                                        'total_price': arb_opp['total_price'],
-                                        'profit': arb_opp['profit'],
-                                        'profit_pct': arb_opp['profit_pct'],
+                                        'total_price': arb_opp.total_price,
+                                        'profit': arb_opp.profit,
+                                        'profit_pct': arb_opp.profit_pct,
                                         'market_question': market.get('question'),
                                         'multi_choice': True
                                     }
@@ -11,17 +11,25 @@ Logic:
 
 import json
 import time
-from typing import Dict, List, Optional
+from collections import namedtuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dateutil import parser
 
 from ..strategies.base_strategy import BaseStrategy
+from ..utils.expiring_set import ExpiringSet
 from ..utils.logger import setup_logger, get_trade_logger, get_error_logger
 
 logger = setup_logger(__name__)
 trade_logger = get_trade_logger()
 error_logger = get_error_logger()
 
+# Market fields read by the scan loop, unpacked once per market
+ScanMarket = namedtuple('ScanMarket', [
+    'condition_id', 'id', 'market_id', 'enable_order_book', 'accepting_orders',
+    'closed', 'end_date_iso', 'endDate', 'tokens'
+])
+
 class SpreadScalpingStrategy(BaseStrategy):
     """
     Spread Scalping Strategy
@@ -43,14 +51,21 @@ class SpreadScalpingStrategy(BaseStrategy):
         self.order_size_usdc = self.config.get('order_size_usdc', 10.0)
         self.max_positions = self.config.get('max_positions', 5)
         
+        # Thresholds in integer thousandths of a dollar (price tick resolution)
+        self._min_spread_m = int(round(self.min_spread_cents * 1000))
+        self._threshold_m = int(round(self.likely_outcome_threshold * 1000))
+        
         # Rotating scan configuration
         self.markets_per_scan = self.config.get('markets_per_scan', 1000)  # Markets to check per iteration
         self.full_scan_interval = self.config.get('full_scan_interval', 10)  # Full scan every N iterations
+        self.active_markets_sweep_interval = self.config.get('active_markets_sweep_interval', 10)  # Prune stale active markets every N iterations
         
         # State
-        self.active_markets = set() # Markets we are currently trading
+        # Markets we are currently trading (bounded, entries expire after a week)
+        self.active_markets = ExpiringSet(maxsize=10_000, ttl=7 * 24 * 3600)
         self.scan_cursor = ""  # Cursor for rotating through markets
         self.scan_iteration = 0  # Track iterations for full scans
+        self.manage_iteration = 0  # Track position-management passes for active market sweeps
         
         logger.info(f"[{self.name}] Initialized Spread Scalping Strategy")
         logger.info(f"Config: Min Spread: ${self.min_spread_cents}, Min Vol: ${self.min_liquidity}")
@@ -62,16 +77,25 @@ class SpreadScalpingStrategy(BaseStrategy):
         1. Manage existing positions (Flip Buy -> Sell).
         2. Find new markets to enter.
         """
-        opportunities = []
+        return list(self.iter_opportunities())
+
+    def iter_opportunities(self) -> Iterator[Dict]:
+        """
+        Yield opportunities as they are found: exits first, then entries
+        market by market, so run() can place orders while the scan continues.
+        """
+        # Keyed by (market_id, outcome) so each outcome is emitted at most once
+        opportunities: Dict[Tuple[str, str], Dict] = {}
         
         try:
             # 1. Manage Existing Positions & Orders
             # We need to check if our buy orders filled, or if we hold positions that need selling
             self._manage_existing_positions(opportunities)
+            yield from list(opportunities.values())
             
             # If we have reached max positions, don't scan for new ones
             if len(self.active_markets) >= self.max_positions:
-                return opportunities
+                return
 
             # 2. Scan for New Markets using rotating pagination
             self.scan_iteration += 1
@@ -101,8 +125,16 @@ class SpreadScalpingStrategy(BaseStrategy):
                 self.scan_cursor = ""
                 logger.info(f"[{self.name}] Reached end of markets, resetting cursor")
             
+            # Loop invariant: reference time for expiry checks
+            now = datetime.utcnow()
+            
             for market in markets:
-                market_id = market.get('condition_id') or market.get('id') or market.get('market_id')
+                # Entries executed while streaming count towards the limit
+                if len(self.active_markets) >= self.max_positions:
+                    break
+                
+                m = ScanMarket._make(map(market.get, ScanMarket._fields))
+                market_id = m.condition_id or m.id or m.market_id
                 if not market_id or market_id in self.active_markets:
                     continue
                 
@@ -113,20 +145,20 @@ class SpreadScalpingStrategy(BaseStrategy):
                 #     continue
                 
                 # Filter by market status - must be accepting orders and not closed
-                if not market.get('enable_order_book', False):
+                if not m.enable_order_book:
                     continue
-                if not market.get('accepting_orders', False):
+                if not m.accepting_orders:
                     continue
-                if market.get('closed', False):
+                if m.closed:
                     continue
                 
                 # Filter by Expiration
-                end_date = market.get('end_date_iso') or market.get('endDate')
-                if not self._check_expiration(end_date):
+                end_date = m.end_date_iso or m.endDate
+                if not self._check_expiration(end_date, now):
                     continue
                 
                 # Get token IDs from market data
-                tokens = market.get('tokens', [])
+                tokens = m.tokens
                 if not tokens or len(tokens) < 2:
                     continue
                 
@@ -143,54 +175,59 @@ class SpreadScalpingStrategy(BaseStrategy):
                         # Get orderbook using token_id
                         price_info = self.polymarket_client.get_best_price(token_id, outcome=outcome)
                         if self._analyze_opportunity(market_id, outcome, price_info, opportunities):
+                            yield opportunities[(market_id, outcome)]
                             break # Found opportunity in this market
                     
                 except Exception as e:
-                    logger.debug(f"Error checking price for {market_id}: {e}")
+                    logger.debug("Error checking price for %s: %s", market_id, e)
                     continue
 
         except Exception as e:
             error_logger.error(f"[{self.name}] Error scanning: {e}", exc_info=True)
-            
-        return opportunities
 
-    def _check_expiration(self, end_date_str: str) -> bool:
+    def _check_expiration(self, end_date_str: str, now: Optional[datetime] = None) -> bool:
         if not end_date_str:
             return False
         try:
             # Handle ISO format
             end_date = parser.parse(end_date_str).replace(tzinfo=None)
-            now = datetime.utcnow()
+            if now is None:
+                now = datetime.utcnow()
             days_diff = (end_date - now).days
             return days_diff >= self.min_days_to_expiry
         except Exception:
             return False
 
-    def _analyze_opportunity(self, market_id: str, outcome: str, price_info: Dict, opportunities: List[Dict]) -> bool:
+    def _analyze_opportunity(self, market_id: str, outcome: str, price_info: Dict, opportunities: Dict[Tuple[str, str], Dict]) -> bool:
         """Analyze a specific outcome for spread and probability"""
         if not price_info:
-            logger.debug(f"DEBUG: {market_id} {outcome} - No price info")
-        return False
+            logger.debug("DEBUG: %s %s - No price info", market_id, outcome)
+            return False
 
-        bid = float(price_info.get('bid') or 0)
-        ask = float(price_info.get('ask') or 0)
+        # Prices are quantized to 0.001, so filter in integer thousandths
+        bid_m = int(round(float(price_info.get('bid') or 0) * 1000))
+        ask_m = int(round(float(price_info.get('ask') or 0) * 1000))
         
-        if bid == 0 or ask == 0:
-            logger.debug(f"DEBUG: {market_id} {outcome} - Zero bid/ask: {bid}/{ask}")
+        if bid_m == 0 or ask_m == 0:
+            logger.debug("DEBUG: %s %s - Zero bid/ask: %s/%s", market_id, outcome, price_info.get('bid'), price_info.get('ask'))
             return False
             
-        spread = ask - bid
-        mid_price = (ask + bid) / 2
+        spread_m = ask_m - bid_m
         
-        # Check Probability (using Mid Price as proxy)
-        if mid_price < self.likely_outcome_threshold:
-            logger.debug(f"DEBUG: {market_id} {outcome} - Low prob: {mid_price} < {self.likely_outcome_threshold}")
+        # Check Probability (using Mid Price as proxy; compare 2*mid to avoid halving)
+        if ask_m + bid_m < 2 * self._threshold_m:
+            logger.debug("DEBUG: %s %s - Low prob: %s < %s", market_id, outcome, (ask_m + bid_m) / 2000, self.likely_outcome_threshold)
             return False
             
         # Check Spread
-        if spread < self.min_spread_cents:
-            logger.debug(f"DEBUG: {market_id} {outcome} - Low spread: {spread} < {self.min_spread_cents}")
+        if spread_m < self._min_spread_m:
+            logger.debug("DEBUG: %s %s - Low spread: %s < %s", market_id, outcome, spread_m / 1000, self.min_spread_cents)
             return False
+        
+        bid = bid_m / 1000
+        ask = ask_m / 1000
+        spread = spread_m / 1000
+        mid_price = (ask_m + bid_m) / 2000
             
         # Found a candidate!
         
@@ -215,10 +252,10 @@ class SpreadScalpingStrategy(BaseStrategy):
             f"   Action 2: SELL LIMIT @ ${sell_target:.3f} (After fill)\n"
             f"   Spread: ${spread:.3f} per share\n"
         )
-        logger.info(signal_msg)
-        print(signal_msg) # Ensure it prints to console for user to see immediately
+        # Trade logger mirrors to the console (plain message format) and the trade log
+        trade_logger.info(signal_msg)
         
-        opportunities.append({
+        opportunities[(market_id, outcome)] = {
             'type': 'entry',
             'market_id': market_id,
             'outcome': outcome,
@@ -227,10 +264,10 @@ class SpreadScalpingStrategy(BaseStrategy):
             'spread': spread,
             'mid_price': mid_price,
             'signal_text': signal_msg
-        })
+        }
         return True
 
-    def _manage_existing_positions(self, opportunities: List[Dict]):
+    def _manage_existing_positions(self, opportunities: Dict[Tuple[str, str], Dict]):
         """
         Check active markets. 
         If we have shares -> Sell at Ask.
@@ -241,19 +278,25 @@ class SpreadScalpingStrategy(BaseStrategy):
         # For this implementation, we'll query positions and open orders
         
         try:
-            positions = self.polymarket_client.get_positions() 
-            # Note: get_positions implementation depends on client. Assuming it returns list of positions.
-            
-            open_orders = self.polymarket_client.get_orders(status='open')
+            # In-memory account state (USER channel events + periodic REST reconcile)
+            account_state = self.polymarket_client.get_account_state()
+            positions = account_state['positions']
+            open_orders = account_state['open_orders']
             
             # Map market_id -> position/order status
             # This is complex to synchronize perfectly without a local db, but we'll do best effort
+            open_order_market_ids = {order.get('market_id') for order in open_orders}
             
             for pos in positions:
                 market_id = pos.get('market_id')
                 size = float(pos.get('size', 0))
                 outcome = pos.get('outcome')
                 
+                if size < 0.1 and market_id not in open_order_market_ids:
+                    # Position is closed out and nothing is working - stop tracking it
+                    self.active_markets.discard(market_id)
+                    continue
+                
                 if size > 0.1: # We have a position
                     self.active_markets.add(market_id)
                     
@@ -270,7 +313,7 @@ class SpreadScalpingStrategy(BaseStrategy):
                         price_info = self.polymarket_client.get_best_price(market_id, outcome=outcome)
                         ask = float(price_info.get('ask') or 0)
                         if ask > 0:
-                            opportunities.append({
+                            opportunities[(market_id, outcome)] = {
                                 'type': 'exit',
                                 'market_id': market_id,
                                 'outcome': outcome,
@@ -279,12 +322,20 @@ class SpreadScalpingStrategy(BaseStrategy):
                                 # Strategy says: "list the shares for sale with a limit order as well, using the 8 cent spread"
                                 # Implies we might want to price it based on our entry + spread, or just current market Ask.
                                 # Current market Ask is safer to ensure fill if spread is stable.
-                            })
+                            }
                             
             # Also track markets where we have open BUY orders so we don't double enter
             for order in open_orders:
                 if order.get('side') == 'buy':
                     self.active_markets.add(order.get('market_id'))
+            
+            # Periodically drop markets we no longer hold or have orders in
+            self.manage_iteration += 1
+            if self.manage_iteration % self.active_markets_sweep_interval == 0:
+                live_market_ids = {pos.get('market_id') for pos in positions if float(pos.get('size', 0)) >= 0.1}
+                dropped = self.active_markets.retain(live_market_ids | open_order_market_ids)
+                if dropped:
+                    logger.debug(f"[{self.name}] Pruned {dropped} inactive markets from active set")
 
         except Exception as e:
             logger.error(f"Error managing positions: {e}")
@@ -296,6 +347,12 @@ class SpreadScalpingStrategy(BaseStrategy):
         
         try:
             if type == 'entry':
+                # Enforce the position cap here too: callers that collect the
+                # opportunities before executing never hit the scan-loop check
+                if market_id in self.active_markets or len(self.active_markets) >= self.max_positions:
+                    logger.debug(f"[{self.name}] Skipping entry for {market_id}: already active or at max positions ({self.max_positions})")
+                    return None
+                
                 # Place Limit Buy at Bid
                 price = opportunity['bid']
                 size = self.order_size_usdc / price
@@ -1,13 +1,14 @@
 """Strategy 5: Tail-End Trading (High Probability & Near Expiry)"""
 
 import time
-from typing import Dict, List, Optional
-from datetime import datetime
-from dateutil import parser
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 
 from ..strategies.base_strategy import BaseStrategy
 from ..risk.position_tracker import Position
 from ..utils.logger import setup_logger, get_trade_logger, get_error_logger
+from ..utils.market_cache import parse_end_timestamp
+from ..utils.market_utils import market_id as get_market_id
 
 logger = setup_logger(__name__)
 trade_logger = get_trade_logger()
@@ -38,8 +39,12 @@ class TailEndStrategy(BaseStrategy):
     def scan_opportunities(self) -> List[Dict]:
         """
         Scan for high-probability markets near expiry.
+        
+        Expiry and price-band filters are evaluated as NumPy masks over the
+        whole batch; prices are only fetched for markets inside the expiry window.
         """
-        opportunities = []
+        # Keyed by (market_id, outcome) so each outcome is signalled at most once
+        opportunities: Dict[Tuple[str, str], Dict] = {}
         
         try:
             # Use market cache if available
@@ -51,85 +56,118 @@ class TailEndStrategy(BaseStrategy):
             if not isinstance(markets, list):
                 return []
             
+            # Collect candidate markets with a parseable expiry
+            candidates = []  # (market_id, market, end_date_str)
+            end_timestamps = []
             for market in markets:
-                market_id = market.get('id') or market.get('market_id')
+                market_id = get_market_id(market)
                 if not market_id or market_id in self.active_positions:
                     continue
                 
-                # Check expiry
-                end_date_str = market.get('end_date_iso') or market.get('endDate')
-                if not self._check_expiry_window(end_date_str):
+                # Check outcomes/prices
+                if not market.get('tokens'):
                     continue
                 
-                # Check outcomes/prices
-                tokens = market.get('tokens', [])
-                if not tokens:
+                end_date_str = market.get('end_date_iso') or market.get('endDate')
+                if self.market_cache:
+                    end_ts = self.market_cache.get_end_ts_epoch(market_id, end_date_str)
+                else:
+                    end_ts = parse_end_timestamp(end_date_str)
+                if end_ts is None:
                     continue
                 
+                candidates.append((market_id, market, end_date_str))
+                end_timestamps.append(end_ts)
+            
+            if not candidates:
+                return []
+            
+            # Check expiry: must be in future but close (whole days, as timedelta.days)
+            ends = np.array(end_timestamps, dtype=np.int64)
+            days_to_expiry = (ends - int(time.time())) // 86400
+            in_window = (days_to_expiry >= 0) & (days_to_expiry <= self.max_days_to_expiry)
+            
+            # Every outcome of the markets in the window
+            tokens = []  # (market_id, market, end_date_str, token_id, outcome)
+            for i in np.flatnonzero(in_window):
+                market_id, market, end_date_str = candidates[i]
                 try:
-                    for token in tokens:
+                    for token in market.get('tokens', []):
                         token_id = token.get('token_id')
                         outcome = token.get('outcome', 'UNKNOWN')
                         
                         if not token_id:
                             continue
                         
-                        # Get price
-                        if self.market_cache:
-                            price_info = self.market_cache.get_price(market_id, outcome=outcome)
-                        else:
-                            price_info = self.polymarket_client.get_best_price(token_id, outcome=outcome)
-                            
-                        if not price_info:
-                            continue
-                            
-                        ask = float(price_info.get('ask') or 0)
-                        
-                        if self.min_price <= ask <= self.max_price:
-                            # Found a high probability outcome
-                            
-                            # Additional Safety Check: Liquidity/Volume (Basic check)
-                            # spread = float(price_info.get('ask') or 0) - float(price_info.get('bid') or 0)
-                            # if spread > 0.05: continue # Skip wide spreads
-                            
-                            logger.info(f"[{self.name}] Found opportunity: {market.get('question')} | {outcome} @ {ask}")
-                            
-                            opportunities.append({
-                                'market_id': market_id,
-                                'token_id': token_id,
-                                'outcome': outcome,
-                                'price': ask,
-                                'question': market.get('question'),
-                                'end_date': end_date_str
-                            })
+                        tokens.append((market_id, market, end_date_str, token_id, outcome))
                             
                 except Exception as e:
-                    logger.debug(f"Error checking market {market_id}: {e}")
+                    logger.debug("Error checking market %s: %s", market_id, e)
                     continue
+            
+            # Get prices: one bulk cache lookup per outcome, else per token from the client
+            bulk_prices = {}
+            if self.market_cache:
+                ids_by_outcome: Dict[str, List[str]] = {}
+                for market_id, _, _, _, outcome in tokens:
+                    ids_by_outcome.setdefault(outcome, []).append(market_id)
+                bulk_prices = {
+                    outcome: self.market_cache.get_prices_bulk(market_ids, outcome)
+                    for outcome, market_ids in ids_by_outcome.items()
+                }
+            
+            rows = []  # entries of tokens that have a price
+            asks = []
+            for row in tokens:
+                market_id, _, _, token_id, outcome = row
+                try:
+                    if self.market_cache:
+                        price_info = bulk_prices[outcome].get(market_id)
+                    else:
+                        price_info = self.polymarket_client.get_best_price(token_id, outcome=outcome)
                     
+                    if not price_info:
+                        continue
+                    
+                    asks.append(float(price_info.get('ask') or 0))
+                    rows.append(row)
+                except Exception as e:
+                    logger.debug("Error checking market %s: %s", market_id, e)
+                    continue
+            
+            if not rows:
+                return []
+            
+            # Found high probability outcomes: ask inside [min_price, max_price]
+            ask_arr = np.array(asks, dtype=np.float64)
+            matches = np.flatnonzero((ask_arr >= self.min_price) & (ask_arr <= self.max_price))
+            
+            # Additional Safety Check: Liquidity/Volume (Basic check)
+            # spread = float(price_info.get('ask') or 0) - float(price_info.get('bid') or 0)
+            # if spread > 0.05: continue # Skip wide spreads
+            
             # Sort by highest price (highest probability) to prioritize safest?
             # Or lowest price (highest return)? Strategy says "0.95-0.99".
             # Let's sort by price ascending (maximizing return within the safe bucket)
-            opportunities.sort(key=lambda x: x['price'])
+            for i in matches[np.argsort(ask_arr[matches], kind='stable')]:
+                market_id, market, end_date_str, token_id, outcome = rows[i]
+                ask = asks[i]
+                
+                logger.info(f"[{self.name}] Found opportunity: {market.get('question')} | {outcome} @ {ask}")
+                
+                opportunities[(market_id, outcome)] = {
+                    'market_id': market_id,
+                    'token_id': token_id,
+                    'outcome': outcome,
+                    'price': ask,
+                    'question': market.get('question'),
+                    'end_date': end_date_str
+                }
             
         except Exception as e:
             error_logger.error(f"[{self.name}] Error scanning: {e}", exc_info=True)
             
-        return opportunities
-
-    def _check_expiry_window(self, end_date_str: str) -> bool:
-        if not end_date_str:
-            return False
-        try:
-            end_date = parser.parse(end_date_str).replace(tzinfo=None)
-            now = datetime.utcnow()
-            diff = end_date - now
-            days_diff = diff.days
-            
-            # Must be in future but close
-            return 0 <= days_diff <= self.max_days_to_expiry
-        except Exception:
-            return False
+        return list(opportunities.values())
 
     def execute_trade(self, opportunity: Dict) -> Optional[Dict]:
         """Execute buy for high probability outcome"""
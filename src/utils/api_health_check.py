@@ -1,11 +1,18 @@
 """API health check and connectivity verification"""
 
+import copy
 import time
-from typing import Dict, List, Optional
+import threading
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
 from ..api.polymarket_client import PolymarketClient
 from ..utils.logger import setup_logger
 from ..utils.market_data_validator import MarketDataValidator
+from ..utils.market_utils import market_id as get_market_id
 
 
 logger = setup_logger(__name__)
@@ -14,34 +21,166 @@ logger = setup_logger(__name__)
 class APIHealthCheck:
     """Check API connectivity and data quality"""
     
-    def __init__(self, polymarket_client: PolymarketClient):
+    def __init__(
+        self,
+        polymarket_client: PolymarketClient,
+        probe_timeout_s: float = 2.0,
+        ttl_s: float = 30.0,
+        stale_max_s: float = 300.0
+    ):
         """
         Initialize health checker.
         
         Args:
             polymarket_client: Polymarket client instance
+            probe_timeout_s: Maximum time a single probe may take before it is reported as timed out
+            ttl_s: How long a full check result is reused (0 disables caching)
+            stale_max_s: How long a probe's last good result may stand in for a failure
         """
         self.client = polymarket_client
-        self.validator = MarketDataValidator()
-        self.client.verbose_validation = True  # Enable verbose logging for health checks
+        self.probe_timeout_s = probe_timeout_s
+        self.ttl_s = ttl_s
+        
+        # Cached run_full_check() result
+        self._cached_result: Optional[Dict] = None
+        self._cached_at: float = 0.0
+        self._cache_lock = threading.Lock()
+        
+        # Last successful result per probe, served (marked stale) on transient failures
+        self.stale_max_s = stale_max_s
+        self._last_good_result: Dict[str, Dict] = {}
+        self._last_good_at: Dict[str, float] = {}
+        
+        # Pooled session set-up and warm-up are deferred to the first real check
+        self._session_ready = False
+    
+    @cached_property
+    def validator(self) -> MarketDataValidator:
+        """Validator for health check data (created on first use)"""
+        return MarketDataValidator()
+    
+    def _ensure_pooled_session(self) -> None:
+        """
+        Make sure the client's HTTP session can keep a connection per parallel probe alive.
+        
+        Mounts a larger connection pool for the client's base URL if needed and
+        issues one throwaway request so the TLS session is established before
+        the probes fan out. Runs once, on the first run_full_check() cache miss.
+        """
+        if self._session_ready:
+            return
+        self._session_ready = True
+        
+        # PolymarketAdapter keeps its session on the wrapped REST client
+        http_client = self.client if hasattr(self.client, 'session') else getattr(self.client, 'rest_client', None)
+        session = getattr(http_client, 'session', None)
+        base_url = getattr(http_client, 'BASE_URL', None)
+        if not isinstance(session, requests.Session) or not base_url:
+            return
+        
+        adapter = session.get_adapter(base_url)
+        if not isinstance(adapter, HTTPAdapter) or getattr(adapter, '_pool_maxsize', 0) < 20:
+            session.mount(base_url, HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+        session.headers.setdefault('Connection', 'keep-alive')
+        
+        try:
+            session.head(base_url, timeout=self.probe_timeout_s)
+        except requests.RequestException as e:
+            logger.debug(f"Health check connection warm-up failed: {e}")
     
     def run_full_check(self) -> Dict:
         """
         Run comprehensive API health check.
         
+        Results are reused for `ttl_s` seconds. Callers that miss the cache
+        while a check is in flight wait for it instead of starting their own.
+        
         Returns:
-            Health check results dictionary
+            Health check results dictionary ('cache' is 'HIT' or 'MISS')
         """
+        with self._cache_lock:
+            if self._cached_result is not None and time.monotonic() - self._cached_at < self.ttl_s:
+                results = copy.deepcopy(self._cached_result)
+                results['cache'] = 'HIT'
+                results['timestamp'] = datetime.now().isoformat()
+                return results
+            
+            # Parallel probes should reuse pooled keep-alive connections
+            self._ensure_pooled_session()
+            
+            # Verbose validation logging only for the duration of the check
+            previous_verbose = getattr(self.client, 'verbose_validation', False)
+            self.client.verbose_validation = True
+            try:
+                results = self._run_checks()
+            finally:
+                self.client.verbose_validation = previous_verbose
+            
+            self._cached_result = copy.deepcopy(results)
+            self._cached_at = time.monotonic()
+        
+        results['cache'] = 'MISS'
+        return results
+    
+    def _run_checks(self) -> Dict:
+        """Probe all endpoints and build the results dictionary"""
         logger.info("=" * 60)
         logger.info("Starting API Health Check")
         logger.info("=" * 60)
         
+        # Probes hit independent endpoints, so run them concurrently. The pool is
+        # not joined on exit so a hung request cannot hold up the report.
+        executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            submitted_at = {}
+            futures = {}
+            
+            def submit(name, fn, *args):
+                submitted_at[name] = time.monotonic()
+                futures[name] = executor.submit(fn, *args)
+            
+            def timeout_result(name):
+                logger.error(f"✗ {name} probe timed out after {self.probe_timeout_s}s")
+                return {
+                    'status': 'timeout',
+                    'message': f'No response within {self.probe_timeout_s}s'
+                }
+            
+            submit('api_connectivity', self._check_connectivity)
+            submit('markets_endpoint', self._check_markets_endpoint)
+            
+            # The markets probe's fetch also supplies the sample market for the
+            # orderbook and price probes, so /markets is only requested once
+            probe_results = {}
+            try:
+                probe_results['markets_endpoint'], markets = futures.pop('markets_endpoint').result(
+                    timeout=self.probe_timeout_s
+                )
+            except FuturesTimeoutError:
+                probe_results['markets_endpoint'], markets = timeout_result('markets_endpoint'), None
+            sample_market_id, sample_error = self._get_sample_market_id(markets)
+            
+            submit('orderbook_endpoint', self._check_orderbook_endpoint, sample_market_id, sample_error)
+            submit('price_endpoint', self._check_price_endpoint, sample_market_id, sample_error)
+            
+            for name, future in futures.items():
+                remaining = self.probe_timeout_s - (time.monotonic() - submitted_at[name])
+                try:
+                    probe_results[name] = future.result(timeout=max(0.0, remaining))
+                except FuturesTimeoutError:
+                    future.cancel()
+                    probe_results[name] = timeout_result(name)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        served_stale = self._apply_stale_fallback(probe_results)
+        
         results = {
             'timestamp': datetime.now().isoformat(),
-            'api_connectivity': self._check_connectivity(),
-            'markets_endpoint': self._check_markets_endpoint(),
-            'orderbook_endpoint': self._check_orderbook_endpoint(),
-            'price_endpoint': self._check_price_endpoint(),
+            'api_connectivity': probe_results['api_connectivity'],
+            'markets_endpoint': probe_results['markets_endpoint'],
+            'orderbook_endpoint': probe_results['orderbook_endpoint'],
+            'price_endpoint': probe_results['price_endpoint'],
             'rate_limiter_stats': self._get_rate_limiter_stats(),
             'validation_stats': self.validator.get_stats(),
             'overall_status': 'unknown'
@@ -55,16 +194,72 @@ class APIHealthCheck:
             results['price_endpoint']['status'] == 'ok'
         ])
         
-        results['overall_status'] = 'healthy' if all_passed else 'unhealthy'
+        if not all_passed:
+            results['overall_status'] = 'unhealthy'
+        elif served_stale:
+            results['overall_status'] = 'degraded_serving_stale'
+        else:
+            results['overall_status'] = 'healthy'
         
         # Print summary
         self._print_summary(results)
         
-        # Disable verbose validation after check
-        self.client.verbose_validation = False
-        
         return results
     
+    def _apply_stale_fallback(self, probe_results: Dict[str, Dict]) -> bool:
+        """
+        Record passing probes and replace recently-passing failures with their last good result.
+        
+        Args:
+            probe_results: Probe name -> result, updated in place
+            
+        Returns:
+            True if any probe is being served from a stale result
+        """
+        now = time.monotonic()
+        served_stale = False
+        
+        for name, result in probe_results.items():
+            if result.get('status') == 'ok':
+                self._last_good_result[name] = result
+                self._last_good_at[name] = now
+                continue
+            
+            last_good = self._last_good_result.get(name)
+            stale_age_s = now - self._last_good_at.get(name, 0.0)
+            if last_good is None or stale_age_s >= self.stale_max_s:
+                continue
+            
+            logger.warning(f"{name} failed ({result.get('message')}), serving result from {stale_age_s:.0f}s ago")
+            probe_results[name] = {
+                **last_good,
+                'stale': True,
+                'stale_age_s': stale_age_s,
+                'error': result.get('message')
+            }
+            served_stale = True
+        
+        return served_stale
+    
+    def _get_sample_market_id(self, markets: Optional[List[Dict]]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Pick the market to probe orderbook and price endpoints with.
+        
+        Args:
+            markets: Markets fetched by the markets probe (None if it failed)
+            
+        Returns:
+            Tuple of (market_id, error_message)
+        """
+        if not markets or not isinstance(markets, list):
+            return None, 'no markets available'
+        
+        market_id = get_market_id(markets[0])
+        if not market_id:
+            return None, 'Market missing ID field'
+        
+        return market_id, None
+    
     def _check_connectivity(self) -> Dict:
         """Check basic API connectivity"""
         logger.info("\n[1/4] Checking API Connectivity...")
@@ -95,10 +290,16 @@ class APIHealthCheck:
                 'message': str(e)
             }
     
-    def _check_markets_endpoint(self) -> Dict:
-        """Check markets endpoint"""
+    def _check_markets_endpoint(self) -> Tuple[Dict, Optional[List[Dict]]]:
+        """
+        Check markets endpoint.
+        
+        Returns:
+            Tuple of (probe result, fetched markets or None)
+        """
         logger.info("\n[2/4] Checking Markets Endpoint...")
         
+        markets = None
         try:
             markets = self.client.get_markets(active=True, limit=10)
             
@@ -108,7 +309,7 @@ class APIHealthCheck:
                     'status': 'error',
                     'markets_count': 0,
                     'message': 'No markets returned'
-                }
+                }, markets
             
             if not isinstance(markets, list):
                 logger.error(f"✗ Markets is not a list: {type(markets)}")
@@ -116,49 +317,45 @@ class APIHealthCheck:
                     'status': 'error',
                     'markets_count': 0,
                     'message': f'Expected list, got {type(markets)}'
-                }
+                }, None
             
             # Validate first market
             if len(markets) > 0:
                 first_market = markets[0]
                 logger.info(f"✓ Retrieved {len(markets)} markets")
-                logger.info(f"  Sample market ID: {first_market.get('id') or first_market.get('market_id')}")
+                logger.info(f"  Sample market ID: {get_market_id(first_market)}")
                 logger.info(f"  Sample market keys: {list(first_market.keys())[:10]}")
             
             return {
                 'status': 'ok',
                 'markets_count': len(markets),
                 'message': f'Successfully retrieved {len(markets)} markets'
-            }
+            }, markets
             
         except Exception as e:
             logger.error(f"✗ Markets endpoint failed: {e}", exc_info=True)
             return {
                 'status': 'error',
                 'message': str(e)
-            }
+            }, markets
     
-    def _check_orderbook_endpoint(self) -> Dict:
-        """Check orderbook endpoint"""
+    def _check_orderbook_endpoint(self, market_id: Optional[str], sample_error: Optional[str] = None) -> Dict:
+        """
+        Check orderbook endpoint.
+        
+        Args:
+            market_id: Sample market to fetch the orderbook for
+            sample_error: Why no sample market is available (if market_id is None)
+        """
         logger.info("\n[3/4] Checking Orderbook Endpoint...")
         
+        if not market_id:
+            return {
+                'status': 'error',
+                'message': f'Cannot test orderbook - {sample_error}'
+            }
+        
         try:
-            # First get a market
-            markets = self.client.get_markets(active=True, limit=5)
-            if not markets:
-                return {
-                    'status': 'error',
-                    'message': 'Cannot test orderbook - no markets available'
-                }
-            
-            # Try to get orderbook for first market
-            market_id = markets[0].get('id') or markets[0].get('market_id')
-            if not market_id:
-                return {
-                    'status': 'error',
-                    'message': 'Market missing ID field'
-                }
-            
             orderbook = self.client.get_orderbook(market_id, outcome="YES")
             
             if not orderbook:
@@ -194,26 +391,23 @@ class APIHealthCheck:
                 'message': str(e)
             }
     
-    def _check_price_endpoint(self) -> Dict:
-        """Check price endpoint"""
+    def _check_price_endpoint(self, market_id: Optional[str], sample_error: Optional[str] = None) -> Dict:
+        """
+        Check price endpoint.
+        
+        Args:
+            market_id: Sample market to fetch prices for
+            sample_error: Why no sample market is available (if market_id is None)
+        """
         logger.info("\n[4/4] Checking Price Endpoint...")
         
+        if not market_id:
+            return {
+                'status': 'error',
+                'message': f'Cannot test prices - {sample_error}'
+            }
+        
         try:
-            # Get a market
-            markets = self.client.get_markets(active=True, limit=5)
-            if not markets:
-                return {
-                    'status': 'error',
-                    'message': 'Cannot test prices - no markets available'
-                }
-            
-            market_id = markets[0].get('id') or markets[0].get('market_id')
-            if not market_id:
-                return {
-                    'status': 'error',
-                    'message': 'Market missing ID field'
-                }
-            
             prices = self.client.get_best_price(market_id, outcome="YES")
             
             bid = prices.get('bid')
@@ -268,10 +462,15 @@ class APIHealthCheck:
         logger.info("")
         
         logger.info("Endpoint Status:")
-        logger.info(f"  Connectivity: {results['api_connectivity']['status']}")
-        logger.info(f"  Markets: {results['markets_endpoint']['status']}")
-        logger.info(f"  Orderbook: {results['orderbook_endpoint']['status']}")
-        logger.info(f"  Prices: {results['price_endpoint']['status']}")
+        for label, key in (
+            ('Connectivity', 'api_connectivity'),
+            ('Markets', 'markets_endpoint'),
+            ('Orderbook', 'orderbook_endpoint'),
+            ('Prices', 'price_endpoint')
+        ):
+            probe = results[key]
+            stale = f" (stale, {probe['stale_age_s']:.0f}s old)" if probe.get('stale') else ""
+            logger.info(f"  {label}: {probe['status']}{stale}")
         logger.info("")
         
         if 'validation_stats' in results:
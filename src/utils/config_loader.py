@@ -1,10 +1,32 @@
 """Configuration file loader"""
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import os
 
+# C-accelerated parser when PyYAML was built against libyaml (the default for
+# the PyPI wheels); otherwise fall back to the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Environment variables that override config values: (env var, config key path)
+_ENV_MAP = (
+    ('POLYMARKET_API_KEY', ('api', 'polymarket', 'api_key')),
+    ('POLYMARKET_PRIVATE_KEY', ('api', 'polymarket', 'private_key')),
+    ('PERPDEX_API_KEY', ('api', 'perpdex', 'api_key')),
+)
+
+# Marks a cached lookup of a key path that is not in the config
+_MISSING = object()
+
+# Parsed YAML per resolved config path: path -> (st_mtime_ns, config)
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
 
 class ConfigLoader:
     """Load and manage configuration from YAML files"""
@@ -18,6 +40,7 @@ class ConfigLoader:
         """
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self._get_cache: Dict[str, Any] = {}  # key_path -> value (or _MISSING)
         self.load_config()
     
     def load_config(self) -> None:
@@ -25,35 +48,35 @@ class ConfigLoader:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as f:
-            self.config = yaml.safe_load(f) or {}
+        self._get_cache.clear()
+        
+        # Reuse the parse from another loader of the same, unchanged file.
+        # Copies keep callers that mutate their config from poisoning the cache.
+        resolved_path = self.config_path.resolve()
+        mtime_ns = resolved_path.stat().st_mtime_ns
+        cached = _CONFIG_CACHE.get(resolved_path)
+        
+        if cached is not None and cached[0] == mtime_ns:
+            self.config = copy.deepcopy(cached[1])
+        else:
+            with open(self.config_path, 'r') as f:
+                self.config = yaml.load(f, Loader=SafeLoader) or {}
+            _CONFIG_CACHE[resolved_path] = (mtime_ns, copy.deepcopy(self.config))
         
         # Override with environment variables if present
         self._load_env_overrides()
     
     def _load_env_overrides(self) -> None:
         """Override config values with environment variables"""
-        # API credentials from env
-        if 'POLYMARKET_API_KEY' in os.environ:
-            if 'api' not in self.config:
-                self.config['api'] = {}
-            if 'polymarket' not in self.config['api']:
-                self.config['api']['polymarket'] = {}
-            self.config['api']['polymarket']['api_key'] = os.environ['POLYMARKET_API_KEY']
-        
-        if 'POLYMARKET_PRIVATE_KEY' in os.environ:
-            if 'api' not in self.config:
-                self.config['api'] = {}
-            if 'polymarket' not in self.config['api']:
-                self.config['api']['polymarket'] = {}
-            self.config['api']['polymarket']['private_key'] = os.environ['POLYMARKET_PRIVATE_KEY']
-        
-        if 'PERPDEX_API_KEY' in os.environ:
-            if 'api' not in self.config:
-                self.config['api'] = {}
-            if 'perpdex' not in self.config['api']:
-                self.config['api']['perpdex'] = {}
-            self.config['api']['perpdex']['api_key'] = os.environ['PERPDEX_API_KEY']
+        for env_key, path in _ENV_MAP:
+            value = os.environ.get(env_key)
+            if value is None:
+                continue
+            
+            section = self.config
+            for key in path[:-1]:
+                section = section.setdefault(key, {})
+            section[path[-1]] = value
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -66,16 +89,21 @@ class ConfigLoader:
         Returns:
             Config value or default
         """
-        keys = key_path.split('.')
-        value = self.config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
+        if key_path in self._get_cache:
+            value = self._get_cache[key_path]
+        else:
+            value = self.config
+            for key in key_path.split('.'):
+                if isinstance(value, dict) and key in value:
+                    value = value[key]
+                else:
+                    value = _MISSING
+                    break
+            
+            # Config only changes through load_config(), which clears the cache
+            self._get_cache[key_path] = value
         
-        return value
+        return default if value is _MISSING else value
     
     def get_strategy_config(self, strategy_name: str) -> Dict[str, Any]:
         """
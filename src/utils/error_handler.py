@@ -1,6 +1,10 @@
 """Enhanced error handling with graceful degradation"""
 
+import asyncio
+import inspect
+import re
 import time
+from collections import deque
 from typing import Dict, Optional, Callable, Any, Type
 from functools import wraps
 from ..utils.logger import setup_logger
@@ -8,6 +12,18 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Message fragments that identify an error category regardless of exception type
+_ERROR_PAT = re.compile(r'429|rate limit|timeout|timed out|connection', re.IGNORECASE)
+_ERROR_KINDS = {
+    '429': 'RateLimitError',
+    'rate limit': 'RateLimitError',
+    'timeout': 'Timeout',
+    'timed out': 'Timeout',
+    'connection': 'ConnectionError',
+}
+# When several fragments match, the first category listed here wins
+_ERROR_KIND_PRIORITY = ('RateLimitError', 'Timeout', 'ConnectionError')
+
 
 class ErrorHandler:
     """Centralized error handling with graceful degradation"""
@@ -17,7 +33,7 @@ class ErrorHandler:
         self.error_stats = {
             'total_errors': 0,
             'errors_by_type': {},
-            'recent_errors': []
+            'recent_errors': deque(maxlen=100)  # Last 100 errors
         }
     
     def handle_error(
@@ -27,21 +43,26 @@ class ErrorHandler:
         fallback_value: Any = None,
         retry: bool = False,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        operation: Optional[Callable[[], Any]] = None
     ) -> Any:
         """
         Handle an error with graceful degradation.
         
+        The error is counted and logged once; retries re-invoke `operation`
+        with exponential backoff and are not counted as new errors.
+        
         Args:
             error: Exception that occurred
             context: Context where error occurred
             fallback_value: Value to return if error persists
             retry: Whether to retry
             max_retries: Maximum retry attempts
-            retry_delay: Delay between retries
+            retry_delay: Initial delay between retries (doubled after each attempt)
+            operation: Zero-argument callable to re-invoke when retrying
             
         Returns:
-            Fallback value or None
+            Result of a successful retry, else fallback value or None
         """
         error_type = type(error).__name__
         self.error_stats['total_errors'] += 1
@@ -56,21 +77,21 @@ class ErrorHandler:
             'timestamp': time.time()
         })
         
-        # Keep only last 100 errors
-        if len(self.error_stats['recent_errors']) > 100:
-            self.error_stats['recent_errors'] = self.error_stats['recent_errors'][-100:]
-        
         # Log error
         logger.error(f"Error in {context}: {error_type} - {str(error)}")
         
-        # Retry if requested
-        if retry and max_retries > 0:
-            logger.info(f"Retrying {context} (attempts remaining: {max_retries})")
-            time.sleep(retry_delay)
-            return self.handle_error(
-                error, context, fallback_value, retry=True,
-                max_retries=max_retries - 1, retry_delay=retry_delay * 2
-            )
+        # Retry if requested (there is nothing to retry without an operation)
+        if retry and operation is not None:
+            for attempt in range(max_retries):
+                logger.info(f"Retrying {context} (attempt {attempt + 1}/{max_retries})")
+                time.sleep(retry_delay)
+                retry_delay *= 2
+                try:
+                    return operation()
+                except Exception as e:
+                    logger.warning(f"Retry {attempt + 1}/{max_retries} failed in {context}: {type(e).__name__} - {e}")
+        elif retry:
+            logger.debug(f"No operation given for {context}, skipping retries")
         
         # Return fallback value
         if fallback_value is not None:
@@ -102,27 +123,32 @@ class ErrorHandler:
             'KeyError': f'Missing required data: {error_msg}',
         }
         
-        # Check for specific error types
-        if '429' in error_msg or 'rate limit' in error_msg.lower():
-            return friendly_messages.get('RateLimitError', 'Rate limit exceeded.')
-        
-        if 'timeout' in error_msg.lower() or 'timed out' in error_msg.lower():
-            return friendly_messages.get('Timeout', 'Request timed out.')
-        
-        if 'connection' in error_msg.lower():
-            return friendly_messages.get('ConnectionError', 'Connection error.')
+        # Check for specific error types (one scan of the message)
+        matched_kinds = {_ERROR_KINDS[fragment.lower()] for fragment in _ERROR_PAT.findall(error_msg)}
+        for kind in _ERROR_KIND_PRIORITY:
+            if kind in matched_kinds:
+                return friendly_messages[kind]
         
         # Return mapped message or generic
         return friendly_messages.get(error_type, f'An error occurred: {error_msg}')
     
     def get_stats(self) -> Dict:
-        """Get error statistics"""
+        """
+        Get error statistics.
+        
+        `error_rate` is errors per second over the window covered by
+        `recent_errors` (0 when there are none).
+        """
+        recent_errors = self.error_stats['recent_errors']
+        error_rate = 0.0
+        if recent_errors:
+            window_s = time.time() - recent_errors[0]['timestamp']
+            error_rate = len(recent_errors) / max(1e-9, window_s)
+        
         return {
             **self.error_stats,
-            'error_rate': (
-                self.error_stats['total_errors'] / max(1, len(self.error_stats['recent_errors']))
-                if self.error_stats['recent_errors'] else 0
-            )
+            'recent_errors': list(recent_errors),
+            'error_rate': error_rate
         }
 
 
@@ -131,38 +157,112 @@ def retry_on_error(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
-    fallback_value: Any = None
+    fallback_value: Any = None,
+    deadline: Optional[float] = None
 ):
     """
     Decorator for retrying functions on error.
     
+    Coroutine functions are retried with non-blocking sleeps
+    (see async_retry_on_error).
+    
     Args:
         max_retries: Maximum retry attempts
         delay: Initial delay between retries
         backoff: Backoff multiplier
         exceptions: Tuple of exceptions to catch
         fallback_value: Value to return if all retries fail
+        deadline: Time budget in seconds per call; no retry is started
+            if its backoff sleep would end past it
     """
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            return async_retry_on_error(
+                max_retries, delay, backoff, exceptions, fallback_value, deadline
+            )(func)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
             current_delay = delay
+            deadline_at = time.monotonic() + deadline if deadline is not None else None
             
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_retries:
+                    if attempt >= max_retries:
+                        logger.error(f"Max retries exceeded for {func.__name__}: {e}")
+                    elif deadline_at is not None and time.monotonic() + current_delay >= deadline_at:
+                        logger.error(f"Deadline of {deadline:.2f}s reached for {func.__name__}: {e}")
+                        break
+                    else:
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
                             f"Retrying in {current_delay:.2f}s..."
                         )
                         time.sleep(current_delay)
                         current_delay *= backoff
-                    else:
+            
+            # All retries failed
+            if fallback_value is not None:
+                logger.debug(f"Using fallback value for {func.__name__}")
+                return fallback_value
+            
+            raise last_exception
+        
+        return wrapper
+    return decorator
+
+
+def async_retry_on_error(
+    max_retries: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    exceptions: tuple = (Exception,),
+    fallback_value: Any = None,
+    deadline: Optional[float] = None
+):
+    """
+    Decorator for retrying coroutine functions on error.
+    
+    Same behaviour as retry_on_error, but backs off with asyncio.sleep so
+    other tasks keep running while a call waits to be retried.
+    
+    Args:
+        max_retries: Maximum retry attempts
+        delay: Initial delay between retries
+        backoff: Backoff multiplier
+        exceptions: Tuple of exceptions to catch
+        fallback_value: Value to return if all retries fail
+        deadline: Time budget in seconds per call; no retry is started
+            if its backoff sleep would end past it
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
+            current_delay = delay
+            deadline_at = time.monotonic() + deadline if deadline is not None else None
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+                    if attempt >= max_retries:
                         logger.error(f"Max retries exceeded for {func.__name__}: {e}")
+                    elif deadline_at is not None and time.monotonic() + current_delay >= deadline_at:
+                        logger.error(f"Deadline of {deadline:.2f}s reached for {func.__name__}: {e}")
+                        break
+                    else:
+                        logger.warning(
+                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
+                            f"Retrying in {current_delay:.2f}s..."
+                        )
+                        await asyncio.sleep(current_delay)
+                        current_delay *= backoff
             
             # All retries failed
             if fallback_value is not None:
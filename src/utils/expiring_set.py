@@ -0,0 +1,85 @@
+"""Bounded set whose members expire after a fixed time-to-live"""
+
+import time
+from collections import OrderedDict
+from typing import Hashable, Iterable, Iterator
+
+
+class ExpiringSet:
+    """
+    Set with a maximum size and per-member TTL.
+
+    Members are kept in insertion/refresh order, so expired entries always sit
+    at the front and can be evicted without scanning the whole set. When the
+    set is full, the oldest member is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 7 * 24 * 3600):
+        """
+        Initialize expiring set.
+
+        Args:
+            maxsize: Maximum number of members kept
+            ttl: Time-to-live of a member in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._expiry: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop members whose TTL has elapsed"""
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            del self._expiry[key]
+
+    def add(self, key: Hashable) -> None:
+        """Add a member, or refresh its TTL if already present"""
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._expiry[key] = now + self.ttl
+        self._expiry.move_to_end(key)
+        while len(self._expiry) > self.maxsize:
+            self._expiry.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a member if present"""
+        self._expiry.pop(key, None)
+
+    def retain(self, keys: Iterable[Hashable]) -> int:
+        """
+        Keep only members that are also in `keys`.
+
+        Args:
+            keys: Members that should survive
+
+        Returns:
+            Number of members dropped
+        """
+        keep = set(keys)
+        stale = [key for key in self._expiry if key not in keep]
+        for key in stale:
+            del self._expiry[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all members"""
+        self._expiry.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        expires_at = self._expiry.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._expiry[key]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        self._evict_expired(time.monotonic())
+        return len(self._expiry)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        self._evict_expired(time.monotonic())
+        return iter(list(self._expiry))
@@ -1,10 +1,13 @@
 """Logging configuration and utilities"""
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
 # Global log file paths
@@ -12,6 +15,42 @@ TRADE_LOG_FILE: Optional[str] = None
 ERROR_LOG_FILE: Optional[str] = None
 MAIN_LOG_FILE: Optional[str] = None
 
+# Log rotation: files roll over at LOG_MAX_BYTES, keeping N backups
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+TRADE_LOG_BACKUP_COUNT = 20  # Trade log is the audit trail, keep more history
+
+# Background threads that write queued records for setup_multi_logger()
+_LOG_LISTENERS: List[QueueListener] = []
+
+
+def _stop_log_listeners() -> None:
+    """Flush queued records and stop the background log writers"""
+    while _LOG_LISTENERS:
+        _LOG_LISTENERS.pop().stop()
+
+
+atexit.register(_stop_log_listeners)
+
+
+def _attach_queued_handlers(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """
+    Route a logger's records through a queue to `handlers` on a listener thread.
+    
+    The calling thread only enqueues the record; formatting and I/O happen
+    in the background.
+    
+    Args:
+        logger: Logger to attach the queue to
+        *handlers: Handlers that do the actual output
+    """
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _LOG_LISTENERS.append(listener)
+
 
 def setup_logger(
     name: str = "PolyHFT", 
@@ -48,14 +87,14 @@ def setup_logger(
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
     
     # File handler if specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
@@ -80,6 +119,9 @@ def setup_multi_logger(
     """
     global TRADE_LOG_FILE, ERROR_LOG_FILE, MAIN_LOG_FILE
     
+    # Reconfiguring: drain and stop the writers of the previous setup
+    _stop_log_listeners()
+    
     TRADE_LOG_FILE = trade_log_file
     ERROR_LOG_FILE = error_log_file
     MAIN_LOG_FILE = main_log_file
@@ -100,10 +142,9 @@ def setup_multi_logger(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    main_file_handler = logging.FileHandler(main_log_file)
+    main_file_handler = RotatingFileHandler(main_log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
     main_file_handler.setLevel(logging.DEBUG)
     main_file_handler.setFormatter(main_formatter)
-    main_logger.addHandler(main_file_handler)
     
     # Setup trade logger (console + trade file)
     trade_logger = logging.getLogger("PolyHFT.Trades")
@@ -116,17 +157,18 @@ def setup_multi_logger(
     trade_console_handler.setLevel(logging.INFO)
     trade_formatter = logging.Formatter('%(message)s')  # Simple format for trades
     trade_console_handler.setFormatter(trade_formatter)
-    trade_logger.addHandler(trade_console_handler)
     
     # Trade log file handler
-    trade_file_handler = logging.FileHandler(trade_log_file)
+    trade_file_handler = RotatingFileHandler(
+        trade_log_file, maxBytes=LOG_MAX_BYTES, backupCount=TRADE_LOG_BACKUP_COUNT
+    )
     trade_file_handler.setLevel(logging.INFO)
     trade_file_formatter = logging.Formatter(
         '%(asctime)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     trade_file_handler.setFormatter(trade_file_formatter)
-    trade_logger.addHandler(trade_file_handler)
+    _attach_queued_handlers(trade_logger, trade_console_handler, trade_file_handler)
     
     # Setup error logger (error file only, no console)
     error_logger = logging.getLogger("PolyHFT.Errors")
@@ -135,20 +177,18 @@ def setup_multi_logger(
     error_logger.propagate = False  # Don't propagate to parent
     
     # Error log file handler
-    error_file_handler = logging.FileHandler(error_log_file)
+    error_file_handler = RotatingFileHandler(error_log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
     error_file_handler.setLevel(logging.WARNING)
     error_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     error_file_handler.setFormatter(error_formatter)
-    error_logger.addHandler(error_file_handler)
+    _attach_queued_handlers(error_logger, error_file_handler)
     
-    # Also add error handler to main logger to catch all errors
-    error_handler = logging.FileHandler(error_log_file)
-    error_handler.setLevel(logging.WARNING)
-    error_handler.setFormatter(error_formatter)
-    main_logger.addHandler(error_handler)
+    # Also add error handler to main logger to catch all errors. The handler is
+    # shared so only one handler ever rotates the error file.
+    _attach_queued_handlers(main_logger, main_file_handler, error_file_handler)
 
 
 def get_trade_logger() -> logging.Logger:
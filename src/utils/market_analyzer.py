@@ -1,9 +1,72 @@
 """Market data analysis utilities"""
 
-from typing import Dict, List, Tuple, Optional
+import re
+import math
+import threading
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from decimal import Decimal
 
 
+# Lowercased search text keyed by the raw (question, description) strings.
+# Keying on the text rather than the markets list keeps no reference to the
+# list or its dicts, and an edited market simply misses and is re-lowercased.
+_lowered_text: Dict[Tuple[str, str], str] = {}
+_lowered_text_lock = threading.Lock()  # scans run on several threads
+_MAX_LOWERED_TEXT = 50000
+
+
+def _build_corpus(markets: List[Dict]) -> List[Tuple[Dict, str]]:
+    """
+    Pair each market with its lowercased question and description.
+    
+    Lowercased text is cached per (question, description), so repeated keyword
+    scans over the same markets skip the lowercasing.
+    
+    Args:
+        markets: List of market dicts
+        
+    Returns:
+        List of (market, lowercased "question\0description") pairs
+    """
+    corpus = []
+    with _lowered_text_lock:
+        if len(_lowered_text) > _MAX_LOWERED_TEXT:
+            _lowered_text.clear()
+        for market in markets:
+            key = (market.get('question') or '', market.get('description') or '')
+            text = _lowered_text.get(key)
+            if text is None:
+                # NUL separator keeps a keyword from matching across question/description
+                text = _lowered_text[key] = f"{key[0]}\0{key[1]}".lower()
+            corpus.append((market, text))
+    return corpus
+
+
+class MicroSpread(NamedTuple):
+    """Profit metrics for a micro-spread trade"""
+    buy_price: float
+    sell_price: float
+    profit: float
+    profit_pct: float
+
+
+class ArbitrageOpportunity(NamedTuple):
+    """Single-market YES/NO arbitrage opportunity"""
+    yes_price: float
+    no_price: float
+    total_price: float
+    profit: float
+    profit_pct: float
+
+
+class MultiChoiceArbitrage(NamedTuple):
+    """Multi-outcome arbitrage opportunity (all outcome asks sum below 1)"""
+    outcome_prices: List[float]
+    total_price: float
+    profit: float
+    profit_pct: float
+
+
 class MarketAnalyzer:
     """Utilities for analyzing market data and identifying opportunities"""
     
@@ -24,7 +87,7 @@ class MarketAnalyzer:
         return ((ask_price - bid_price) / ask_price) * 100
     
     @staticmethod
-    def find_arbitrage_opportunity(yes_price: float, no_price: float) -> Optional[Dict]:
+    def find_arbitrage_opportunity(yes_price: float, no_price: float) -> Optional[ArbitrageOpportunity]:
         """
         Check if single-market arbitrage opportunity exists.
         
@@ -33,27 +96,19 @@ class MarketAnalyzer:
             no_price: NO outcome price
             
         Returns:
-            Dict with opportunity details or None
+            ArbitrageOpportunity or None
         """
         total_price = yes_price + no_price
         
         if total_price < 1.0:
             profit = 1.0 - total_price
             profit_pct = (profit / total_price) * 100
-            
-            return {
-                'exists': True,
-                'yes_price': yes_price,
-                'no_price': no_price,
-                'total_price': total_price,
-                'profit': profit,
-                'profit_pct': profit_pct
-            }
+            return ArbitrageOpportunity(yes_price, no_price, total_price, profit, profit_pct)
         
         return None
     
     @staticmethod
-    def find_multi_choice_arbitrage(outcome_prices: List[float]) -> Optional[Dict]:
+    def find_multi_choice_arbitrage(outcome_prices: List[float]) -> Optional[MultiChoiceArbitrage]:
         """
         Check if multi-choice market arbitrage exists.
         
@@ -61,26 +116,20 @@ class MarketAnalyzer:
             outcome_prices: List of prices for all outcomes
             
         Returns:
-            Dict with opportunity details or None
+            MultiChoiceArbitrage or None
         """
-        total_price = sum(outcome_prices)
+        # fsum is exact for many outcomes, so e.g. ten 0.1 asks total 1.0, not 0.9999...
+        total_price = math.fsum(outcome_prices)
         
         if total_price < 1.0:
             profit = 1.0 - total_price
             profit_pct = (profit / total_price) * 100
-            
-            return {
-                'exists': True,
-                'outcome_prices': outcome_prices,
-                'total_price': total_price,
-                'profit': profit,
-                'profit_pct': profit_pct
-            }
+            return MultiChoiceArbitrage(outcome_prices, total_price, profit, profit_pct)
         
         return None
     
     @staticmethod
-    def calculate_micro_spread_profit(buy_price: float, sell_price: float) -> Dict:
+    def calculate_micro_spread_profit(buy_price: float, sell_price: float) -> MicroSpread:
         """
         Calculate profit from micro-spread trade.
         
@@ -89,20 +138,14 @@ class MarketAnalyzer:
             sell_price: Price to sell at
             
         Returns:
-            Dict with profit metrics
+            MicroSpread with profit metrics (zero profit if buy_price is 0)
         """
         if buy_price == 0:
-            return {'profit_pct': 0, 'profit': 0}
+            return MicroSpread(buy_price, sell_price, 0.0, 0.0)
         
         profit = sell_price - buy_price
         profit_pct = (profit / buy_price) * 100
-        
-        return {
-            'buy_price': buy_price,
-            'sell_price': sell_price,
-            'profit': profit,
-            'profit_pct': profit_pct
-        }
+        return MicroSpread(buy_price, sell_price, profit, profit_pct)
     
     @staticmethod
     def find_correlated_markets(markets: List[Dict], keyword: str) -> List[Dict]:
@@ -116,17 +159,47 @@ class MarketAnalyzer:
         Returns:
             List of correlated markets
         """
-        correlated = []
         keyword_lower = keyword.lower()
+        return [market for market, text in _build_corpus(markets) if keyword_lower in text]
+    
+    @staticmethod
+    def find_correlated_markets_multi(markets: List[Dict], keywords: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Find correlated markets for several keywords in a single pass.
         
-        for market in markets:
-            question = market.get('question', '').lower()
-            description = market.get('description', '').lower()
+        All keywords are compiled into one alternation regex so each market's
+        text is scanned once instead of once per keyword.
+        
+        Args:
+            markets: List of market dicts with 'question' or 'description' fields
+            keywords: Keywords to search for
             
-            if keyword_lower in question or keyword_lower in description:
-                correlated.append(market)
+        Returns:
+            Dict mapping each keyword to its list of correlated markets
+        """
+        results: Dict[str, List[Dict]] = {keyword: [] for keyword in keywords}
+        by_lower: Dict[str, List[str]] = {}
+        for keyword in keywords:
+            if keyword:
+                by_lower.setdefault(keyword.lower(), []).append(keyword)
+        if not by_lower:
+            return results
+        
+        # Longest first so the lookahead reports the longest keyword starting at
+        # each position; shorter keywords contained in it are added via `contains`
+        lowered = sorted(by_lower, key=len, reverse=True)
+        pattern = re.compile('(?=(' + '|'.join(re.escape(k) for k in lowered) + '))')
+        contains = {k: [other for other in lowered if other != k and other in k] for k in lowered}
+        
+        for market, text in _build_corpus(markets):
+            found = set(pattern.findall(text))
+            for keyword_lower in list(found):
+                found.update(contains[keyword_lower])
+            for keyword_lower in found:
+                for keyword in by_lower[keyword_lower]:
+                    results[keyword].append(market)
         
-        return correlated
+        return results
     
     @staticmethod
     def detect_price_divergence(market1_price: float, market2_price: float, threshold: float = 0.05) -> bool:
@@ -1,33 +1,119 @@
 """Market data cache with parallel fetching"""
 
 import time
+import asyncio
 import threading
-from typing import Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import aiohttp
+from collections import OrderedDict
+from datetime import timezone
+from dateutil import parser
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from ..utils.logger import setup_logger
 
 
 logger = setup_logger(__name__)
 
 
+def _parse_dict_levels(bids: List, asks: List) -> Tuple[float, float]:
+    """Best bid/ask from [{'price': ..., 'size': ...}, ...] levels"""
+    return float(bids[0].get('price', 0)), float(asks[0].get('price', 0))
+
+
+def _parse_list_levels(bids: List, asks: List) -> Tuple[float, float]:
+    """Best bid/ask from [[price, size], ...] levels"""
+    return float(bids[0][0]), float(asks[0][0])
+
+
+def _resolve_orderbook_parser(level) -> Optional[Callable[[List, List], Tuple[float, float]]]:
+    """Pick the level parser matching an observed orderbook level"""
+    if isinstance(level, dict):
+        return _parse_dict_levels
+    if isinstance(level, list):
+        return _parse_list_levels
+    return None
+
+
+def parse_end_timestamp(end_date_str: Optional[str]) -> Optional[int]:
+    """Parse a market end date to a UTC epoch timestamp (None if missing/invalid)"""
+    if not end_date_str:
+        return None
+    try:
+        end_date = parser.parse(end_date_str).replace(tzinfo=timezone.utc)
+        return int(end_date.timestamp())
+    except Exception:
+        return None
+
+
 class MarketCache:
     """Shared market cache with parallel price fetching"""
     
-    def __init__(self, polymarket_client, cache_ttl: float = 5.0):
+    def __init__(
+        self,
+        polymarket_client,
+        cache_ttl: float = 5.0,
+        max_price_entries: int = 5000,
+        max_workers: int = 10,
+        async_prices: bool = False
+    ):
         """
         Initialize market cache.
         
         Args:
             polymarket_client: Polymarket client instance
             cache_ttl: Cache time-to-live in seconds
+            max_price_entries: Maximum cached market/outcome prices (least recently used are evicted)
+            max_workers: Size of the shared price-fetch thread pool
+            async_prices: Fetch batched prices with aiohttp on an event loop
+                instead of the thread pool (bypasses the client's rate limiter
+                and WebSocket cache, so it is opt-in)
         """
         self.polymarket_client = polymarket_client
         self.cache_ttl = cache_ttl
         self._markets_cache: Optional[List[Dict]] = None
         self._cache_timestamp: float = 0
-        self._lock = threading.Lock()
-        self._price_cache: Dict[str, Dict] = {}  # market_id_outcome -> prices
-        self._price_cache_timestamp: Dict[str, float] = {}
+        self._markets_lock = threading.Lock()  # guards _markets_cache/_cache_timestamp
+        self._prices_lock = threading.Lock()  # guards _price_cache
+        # WebSocket orderbook level parser, resolved from the first orderbook seen
+        self._ob_parser: Optional[Callable[[List, List], Tuple[float, float]]] = None
+        self.max_price_entries = max_price_entries
+        # LRU: (market_id, outcome) -> (prices, fetched_at); times are time.monotonic()
+        self._price_cache: "OrderedDict[Tuple[str, str], Tuple[Dict, float]]" = OrderedDict()
+        # Long-lived pool reused by every get_prices_parallel call
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='price-fetch')
+        # Fetches currently running, so overlapping requests share one HTTP call
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # market_id -> (end date string, parsed epoch); end dates rarely change, so
+        # each market's date is parsed once rather than on every scan
+        self._end_ts: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
+        
+        # Async price fetching: one event loop thread owning one aiohttp session
+        self.async_prices = async_prices
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._inflight_async: Dict[Tuple[str, str], asyncio.Task] = {}  # only touched on self._loop
+    
+    def _get_cached_price(self, cache_key: Tuple[str, str], current_time: float) -> Optional[Dict]:
+        """Return cached prices if still fresh, marking the entry as recently used"""
+        with self._prices_lock:
+            entry = self._price_cache.get(cache_key)
+            if entry is None:
+                return None
+            prices, fetched_at = entry
+            if current_time - fetched_at >= self.cache_ttl:
+                return None
+            self._price_cache.move_to_end(cache_key)
+            return prices
+    
+    def _store_price(self, cache_key: Tuple[str, str], prices: Dict, fetched_at: float) -> None:
+        """Insert prices into the LRU, evicting the least recently used entry on overflow"""
+        with self._prices_lock:
+            self._price_cache[cache_key] = (prices, fetched_at)
+            self._price_cache.move_to_end(cache_key)
+            if len(self._price_cache) > self.max_price_entries:
+                self._price_cache.popitem(last=False)
     
     def get_markets(self, active: bool = True, limit: int = 200) -> List[Dict]:
         """
@@ -40,8 +126,8 @@ class MarketCache:
         Returns:
             List of market dictionaries
         """
-        with self._lock:
-            current_time = time.time()
+        with self._markets_lock:
+            current_time = time.monotonic()
             
             # Return cached if still valid
             if (self._markets_cache is not None and 
@@ -68,63 +154,234 @@ class MarketCache:
                     return self._markets_cache[:limit]
                 return []
     
+    def get_end_ts_epoch(self, market_id: str, end_date_str: Optional[str]) -> Optional[int]:
+        """
+        Get a market's end date as a UTC epoch timestamp, parsing it once per market.
+        
+        Args:
+            market_id: Market ID
+            end_date_str: The market's end date as reported by the API
+            
+        Returns:
+            Epoch seconds, or None if the date is missing or invalid
+        """
+        entry = self._end_ts.get(market_id)
+        if entry is not None and entry[0] == end_date_str:
+            return entry[1]
+        # Concurrent misses just parse twice and store the same value
+        end_ts = parse_end_timestamp(end_date_str)
+        self._end_ts[market_id] = (end_date_str, end_ts)
+        return end_ts
+    
     def get_prices_parallel(
         self, 
         market_outcomes: List[tuple], 
-        max_workers: int = 10
-    ) -> Dict[str, Dict]:
+        max_workers: Optional[int] = None
+    ) -> Dict[Tuple[str, str], Dict]:
         """
         Fetch prices for multiple market/outcome pairs in parallel.
         
         Args:
             market_outcomes: List of (market_id, outcome) tuples
-            max_workers: Maximum number of parallel workers
+            max_workers: Unused; the shared pool is sized in __init__ (kept for compatibility)
             
         Returns:
-            Dictionary mapping "market_id_outcome" -> prices dict
+            Dictionary mapping (market_id, outcome) -> prices dict
         """
-        results = {}
-        current_time = time.time()
+        if self.async_prices:
+            return asyncio.run_coroutine_threadsafe(
+                self._fetch_prices_on_loop(market_outcomes), self._ensure_loop()
+            ).result()
+        
+        # One clock read per batch: used for TTL checks and as the insert time
+        current_time = time.monotonic()
+        results, to_fetch = self._split_cached(market_outcomes, current_time)
         
-        # Filter out cached prices that are still valid
+        if not to_fetch:
+            return results
+        
+        # Fetch remaining prices in parallel, joining fetches already in flight
+        futures = {}
+        with self._inflight_lock:
+            for market_id, outcome, cache_key in to_fetch:
+                future = self._inflight.get(cache_key)
+                if future is None:
+                    future = self._executor.submit(
+                        self._fetch_and_store, market_id, outcome, cache_key, current_time
+                    )
+                    self._inflight[cache_key] = future
+                futures[cache_key] = future
+        
+        for cache_key, future in futures.items():
+            prices = future.result()
+            if prices:
+                results[cache_key] = prices
+        
+        return results
+    
+    def _fetch_and_store(
+        self,
+        market_id: str,
+        outcome: str,
+        cache_key: Tuple[str, str],
+        fetched_at: float
+    ) -> Optional[Dict]:
+        """Fetch one price on the pool, cache it and release its in-flight slot"""
+        try:
+            prices = self.polymarket_client.get_best_price(market_id, outcome=outcome)
+        except Exception as e:
+            logger.debug(f"Error fetching price for {market_id} {outcome}: {e}")
+            prices = None
+        
+        if prices:
+            self._store_price(cache_key, prices, fetched_at)
+        # Submitter holds the lock until the future is registered, so this pop always sees it
+        with self._inflight_lock:
+            self._inflight.pop(cache_key, None)
+        return prices
+    
+    def _split_cached(
+        self,
+        market_outcomes: List[tuple],
+        current_time: float
+    ) -> Tuple[Dict[Tuple[str, str], Dict], List[tuple]]:
+        """
+        Split requested pairs into fresh cached prices and pairs still to fetch.
+        
+        Returns:
+            Tuple of (cached results, list of (market_id, outcome, cache_key) to fetch)
+        """
+        results = {}
         to_fetch = []
         for market_id, outcome in market_outcomes:
-            cache_key = f"{market_id}_{outcome}"
-            if (cache_key in self._price_cache and 
-                cache_key in self._price_cache_timestamp and
-                current_time - self._price_cache_timestamp[cache_key] < self.cache_ttl):
-                results[cache_key] = self._price_cache[cache_key]
+            cache_key = (market_id, outcome)
+            cached = self._get_cached_price(cache_key, current_time)
+            if cached is not None:
+                results[cache_key] = cached
             else:
                 to_fetch.append((market_id, outcome, cache_key))
         
+        return results, to_fetch
+    
+    async def get_prices_async(self, market_outcomes: List[tuple]) -> Dict[Tuple[str, str], Dict]:
+        """
+        Fetch prices for multiple market/outcome pairs concurrently with aiohttp.
+        
+        Requests run on the cache's own event loop (where the shared session
+        lives), so this can be awaited from any loop.
+        
+        Args:
+            market_outcomes: List of (market_id, outcome) tuples
+            
+        Returns:
+            Dictionary mapping (market_id, outcome) -> prices dict
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._fetch_prices_on_loop(market_outcomes), self._ensure_loop()
+        )
+        return await asyncio.wrap_future(future)
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop used for async price fetching"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name='price-fetch-loop',
+                    daemon=True
+                ).start()
+            return self._loop
+    
+    async def _fetch_prices_on_loop(self, market_outcomes: List[tuple]) -> Dict[Tuple[str, str], Dict]:
+        """Cache-aware batched fetch; must run on self._loop"""
+        current_time = time.monotonic()
+        results, to_fetch = self._split_cached(market_outcomes, current_time)
         if not to_fetch:
             return results
         
-        # Fetch remaining prices in parallel
-        def fetch_price(args):
-            market_id, outcome, cache_key = args
-            try:
-                prices = self.polymarket_client.get_best_price(market_id, outcome=outcome)
-                return cache_key, prices
-            except Exception as e:
-                logger.debug(f"Error fetching price for {market_id} {outcome}: {e}")
-                return cache_key, None
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_key = {
-                executor.submit(fetch_price, args): args[2] 
-                for args in to_fetch
-            }
-            
-            for future in as_completed(future_to_key):
-                cache_key, prices = future.result()
-                if prices:
-                    results[cache_key] = prices
-                    self._price_cache[cache_key] = prices
-                    self._price_cache_timestamp[cache_key] = time.time()
+        if self._session is None or self._session.closed:
+            rest_client = getattr(self.polymarket_client, 'rest_client', self.polymarket_client)
+            session = getattr(rest_client, 'session', None)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100),
+                headers=dict(session.headers) if session is not None else None,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        
+        tasks = []
+        for market_id, outcome, cache_key in to_fetch:
+            task = self._inflight_async.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._fetch_and_store_async(self._session, market_id, outcome, cache_key, current_time)
+                )
+                self._inflight_async[cache_key] = task
+            tasks.append(task)
+        
+        fetched = await asyncio.gather(*tasks)
+        
+        for (_, _, cache_key), prices in zip(to_fetch, fetched):
+            if prices:
+                results[cache_key] = prices
         
         return results
     
+    async def _fetch_and_store_async(
+        self,
+        session: aiohttp.ClientSession,
+        market_id: str,
+        outcome: str,
+        cache_key: Tuple[str, str],
+        fetched_at: float
+    ) -> Optional[Dict]:
+        """Fetch one price on the loop, cache it and release its in-flight slot"""
+        try:
+            prices = await self._fetch_price_async(session, market_id, outcome)
+            if prices:
+                self._store_price(cache_key, prices, fetched_at)
+            return prices
+        finally:
+            self._inflight_async.pop(cache_key, None)
+    
+    async def _fetch_price_async(
+        self,
+        session: aiohttp.ClientSession,
+        market_id: str,
+        outcome: str
+    ) -> Optional[Dict]:
+        """
+        Fetch best bid/ask for one market/outcome from the REST orderbook.
+        
+        Args:
+            session: Shared aiohttp session
+            market_id: Market (token) identifier
+            outcome: Outcome (YES, NO, etc.)
+            
+        Returns:
+            Prices dictionary or None on error
+        """
+        rest_client = getattr(self.polymarket_client, 'rest_client', self.polymarket_client)
+        url = f"{rest_client.BASE_URL}/book"
+        try:
+            async with session.get(url, params={'token_id': market_id}) as response:
+                response.raise_for_status()
+                orderbook = await response.json()
+        except Exception as e:
+            logger.debug(f"Error fetching price for {market_id} {outcome}: {e}")
+            return None
+        
+        bids = orderbook.get('bids', []) if isinstance(orderbook, dict) else []
+        asks = orderbook.get('asks', []) if isinstance(orderbook, dict) else []
+        best_bid = float(bids[0]['price']) if bids and isinstance(bids[0], dict) else None
+        best_ask = float(asks[0]['price']) if asks and isinstance(asks[0], dict) else None
+        
+        return {
+            'bid': best_bid,
+            'ask': best_ask,
+            'spread': best_ask - best_bid if (best_bid and best_ask) else None
+        }
+    
     def get_price(self, market_id: str, outcome: str) -> Optional[Dict]:
         """
         Get price for a single market/outcome (uses cache if available).
@@ -137,54 +394,128 @@ class MarketCache:
         Returns:
             Prices dictionary or None
         """
-        cache_key = f"{market_id}_{outcome}"
-        current_time = time.time()
+        cache_key = (market_id, outcome)
+        current_time = time.monotonic()
         
         # Try WebSocket cache first if available
-        if hasattr(self.polymarket_client, 'ws_client') and self.polymarket_client.ws_client:
-            ws_cache = self.polymarket_client.ws_client.get_orderbook(market_id, outcome)
-            if ws_cache:
-                # Convert orderbook to price format
-                bids = ws_cache.get('bids', [])
-                asks = ws_cache.get('asks', [])
-                if bids and asks:
-                    best_bid = float(bids[0].get('price', 0)) if isinstance(bids[0], dict) else float(bids[0][0]) if isinstance(bids[0], list) else None
-                    best_ask = float(asks[0].get('price', 0)) if isinstance(asks[0], dict) else float(asks[0][0]) if isinstance(asks[0], list) else None
-                    if best_bid and best_ask:
-                        prices = {'bid': best_bid, 'ask': best_ask, 'spread': best_ask - best_bid}
-                        self._price_cache[cache_key] = prices
-                        self._price_cache_timestamp[cache_key] = current_time
-                        return prices
+        prices = self._get_ws_price(cache_key, current_time)
+        if prices is not None:
+            return prices
         
         # Check cache first
-        if (cache_key in self._price_cache and 
-            cache_key in self._price_cache_timestamp and
-            current_time - self._price_cache_timestamp[cache_key] < self.cache_ttl):
-            return self._price_cache[cache_key]
+        cached = self._get_cached_price(cache_key, current_time)
+        if cached is not None:
+            return cached
         
         # Fetch fresh price (will use WebSocket if enabled via adapter)
         try:
             prices = self.polymarket_client.get_best_price(market_id, outcome=outcome)
             if prices:
-                self._price_cache[cache_key] = prices
-                self._price_cache_timestamp[cache_key] = current_time
-                
-                # Subscribe to WebSocket if available
-                if hasattr(self.polymarket_client, 'ws_client') and self.polymarket_client.ws_client:
-                    if self.polymarket_client.ws_client.is_connected():
-                        # Pass rest_client to get asset_ids for subscription
-                        rest_client = getattr(self.polymarket_client, 'rest_client', None)
-                        self.polymarket_client.ws_client.subscribe_orderbook(market_id, outcome, rest_client=rest_client)
+                self._store_price(cache_key, prices, current_time)
+                self._subscribe_ws(market_id, outcome)
             return prices
         except Exception as e:
             logger.debug(f"Error fetching price for {market_id} {outcome}: {e}")
             return None
     
+    def get_prices_bulk(self, market_ids: List[str], outcome: str) -> Dict[str, Dict]:
+        """
+        Get prices for one outcome of many markets in a single call.
+        
+        Each market is looked up as in get_price (WebSocket orderbook, then the
+        price cache); the remaining markets are fetched together on the shared pool.
+        
+        Args:
+            market_ids: Market identifiers
+            outcome: Outcome (YES, NO, etc.)
+            
+        Returns:
+            Dictionary mapping market_id -> prices dict (markets without a price are omitted)
+        """
+        current_time = time.monotonic()
+        results = {}
+        pending = []
+        for market_id in market_ids:
+            prices = self._get_ws_price((market_id, outcome), current_time)
+            if prices is not None:
+                results[market_id] = prices
+            else:
+                pending.append((market_id, outcome))
+        
+        cached, to_fetch = self._split_cached(pending, current_time)
+        for (market_id, _), prices in cached.items():
+            results[market_id] = prices
+        
+        if to_fetch:
+            fetched = self.get_prices_parallel([(market_id, outcome) for market_id, outcome, _ in to_fetch])
+            for (market_id, _), prices in fetched.items():
+                results[market_id] = prices
+                self._subscribe_ws(market_id, outcome)
+        
+        return results
+    
+    def _get_ws_price(self, cache_key: Tuple[str, str], current_time: float) -> Optional[Dict]:
+        """Best bid/ask from the WebSocket orderbook cache (stored in the price cache), if available"""
+        ws_client = getattr(self.polymarket_client, 'ws_client', None)
+        if not ws_client:
+            return None
+        
+        ws_cache = ws_client.get_orderbook(*cache_key)
+        if not ws_cache:
+            return None
+        
+        # Convert orderbook to price format
+        bids = ws_cache.get('bids', [])
+        asks = ws_cache.get('asks', [])
+        if not bids or not asks:
+            return None
+        
+        parser = self._ob_parser
+        if parser is None:
+            parser = self._ob_parser = _resolve_orderbook_parser(bids[0])
+        try:
+            best_bid, best_ask = parser(bids, asks) if parser else (None, None)
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            # Layout differs from the one first seen; resolve again next time
+            self._ob_parser = None
+            return None
+        if not best_bid or not best_ask:
+            return None
+        
+        prices = {'bid': best_bid, 'ask': best_ask, 'spread': best_ask - best_bid}
+        self._store_price(cache_key, prices, current_time)
+        return prices
+    
+    def _subscribe_ws(self, market_id: str, outcome: str) -> None:
+        """Subscribe to WebSocket orderbook updates for a freshly fetched market, if connected"""
+        ws_client = getattr(self.polymarket_client, 'ws_client', None)
+        if ws_client and ws_client.is_connected():
+            # Pass rest_client to get asset_ids for subscription
+            rest_client = getattr(self.polymarket_client, 'rest_client', None)
+            ws_client.subscribe_orderbook(market_id, outcome, rest_client=rest_client)
+    
     def clear_cache(self):
         """Clear all caches"""
-        with self._lock:
+        with self._markets_lock:
             self._markets_cache = None
             self._cache_timestamp = 0
+        with self._prices_lock:
             self._price_cache.clear()
-            self._price_cache_timestamp.clear()
-
+        self._end_ts.clear()
+    
+    def close(self) -> None:
+        """Shut down the shared price-fetch thread pool and async session"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        
+        if self._session is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._session.close(), loop).result(timeout=5)
+            except Exception as e:
+                logger.debug(f"Error closing price session: {e}")
+            self._session = None
+        loop.call_soon_threadsafe(loop.stop)
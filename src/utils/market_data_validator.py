@@ -1,5 +1,7 @@
 """Market data validation and verification utilities"""
 
+import threading
+from collections import deque
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from ..utils.logger import setup_logger
@@ -18,8 +20,10 @@ class MarketDataValidator:
             'passed': 0,
             'failed': 0,
             'last_check': None,
-            'errors': []
+            'errors': deque(maxlen=100)  # Last 100 errors
         }
+        # Stats are updated from API client worker threads (e.g. parallel health probes)
+        self._stats_lock = threading.Lock()
     
     def validate_markets_response(self, response: Any) -> tuple[bool, str, Optional[List[Dict]]]:
         """
@@ -31,7 +35,7 @@ class MarketDataValidator:
         Returns:
             Tuple of (is_valid, error_message, markets_list)
         """
-        self.validation_stats['total_checks'] += 1
+        self._record_check()
         
         if response is None:
             error = "Response is None"
@@ -58,8 +62,7 @@ class MarketDataValidator:
                 self._record_error(error)
                 return False, error, None
             
-            self.validation_stats['passed'] += 1
-            self.validation_stats['last_check'] = datetime.now().isoformat()
+            self._record_pass()
             logger.debug(f"Validated {len(response)} markets")
             return True, "", response
         
@@ -76,7 +79,7 @@ class MarketDataValidator:
             if markets is None:
                 # Maybe the dict itself is a market?
                 if self._has_market_fields(response):
-                    self.validation_stats['passed'] += 1
+                    self._record_pass(update_last_check=False)
                     return True, "", [response]
                 
                 error = f"Dict response missing expected keys. Got: {list(response.keys())}"
@@ -101,7 +104,7 @@ class MarketDataValidator:
         Returns:
             Tuple of (is_valid, error_message, orderbook_dict)
         """
-        self.validation_stats['total_checks'] += 1
+        self._record_check()
         
         if response is None:
             error = "Orderbook response is None"
@@ -139,8 +142,7 @@ class MarketDataValidator:
             self._record_error(error)
             return False, error, None
         
-        self.validation_stats['passed'] += 1
-        self.validation_stats['last_check'] = datetime.now().isoformat()
+        self._record_pass()
         return True, "", response
     
     def validate_price_response(self, prices: Dict) -> tuple[bool, str]:
@@ -162,19 +164,21 @@ class MarketDataValidator:
         if bid is None and ask is None:
             return False, "Both bid and ask are None"
         
+        # Convert once; the spread check below reuses these
+        bid_value = ask_value = None
         if bid is not None:
             try:
-                float(bid)
+                bid_value = float(bid)
             except (ValueError, TypeError):
                 return False, f"Invalid bid value: {bid}"
         
         if ask is not None:
             try:
-                float(ask)
+                ask_value = float(ask)
             except (ValueError, TypeError):
                 return False, f"Invalid ask value: {ask}"
         
-        if bid and ask and float(bid) >= float(ask):
+        if bid and ask and bid_value >= ask_value:
             return False, f"Bid ({bid}) >= Ask ({ask}) - invalid spread"
         
         return True, ""
@@ -194,27 +198,38 @@ class MarketDataValidator:
             return False
         
         # Should have price and size
-        if 'price' not in level:
-            return False
+        price = level.get('price')
+        if isinstance(price, (int, float)):
+            return True
         
+        # Strings and other numerics (e.g. Decimal) need a conversion check
         try:
-            float(level['price'])
+            float(price)
         except (ValueError, TypeError):
             return False
         
         return True
     
+    def _record_check(self) -> None:
+        """Record a validation attempt"""
+        with self._stats_lock:
+            self.validation_stats['total_checks'] += 1
+    
+    def _record_pass(self, update_last_check: bool = True) -> None:
+        """Record a passed validation"""
+        with self._stats_lock:
+            self.validation_stats['passed'] += 1
+            if update_last_check:
+                self.validation_stats['last_check'] = datetime.now().isoformat()
+    
     def _record_error(self, error: str) -> None:
         """Record validation error"""
-        self.validation_stats['failed'] += 1
-        self.validation_stats['errors'].append({
-            'error': error,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        # Keep only last 100 errors
-        if len(self.validation_stats['errors']) > 100:
-            self.validation_stats['errors'] = self.validation_stats['errors'][-100:]
+        with self._stats_lock:
+            self.validation_stats['failed'] += 1
+            self.validation_stats['errors'].append({
+                'error': error,
+                'timestamp': datetime.now().isoformat()
+            })
     
     def log_response_sample(self, response: Any, endpoint: str, max_items: int = 3) -> None:
         """
@@ -245,14 +260,17 @@ class MarketDataValidator:
     
     def get_stats(self) -> Dict:
         """Get validation statistics"""
-        success_rate = (
-            (self.validation_stats['passed'] / self.validation_stats['total_checks'] * 100)
-            if self.validation_stats['total_checks'] > 0 else 0
-        )
-        
-        return {
-            **self.validation_stats,
-            'success_rate': f"{success_rate:.2f}%",
-            'recent_errors': self.validation_stats['errors'][-10:]  # Last 10 errors
-        }
+        with self._stats_lock:
+            success_rate = (
+                (self.validation_stats['passed'] / self.validation_stats['total_checks'] * 100)
+                if self.validation_stats['total_checks'] > 0 else 0
+            )
+            
+            errors = list(self.validation_stats['errors'])
+            return {
+                **self.validation_stats,
+                'errors': errors,
+                'success_rate': f"{success_rate:.2f}%",
+                'recent_errors': errors[-10:]  # Last 10 errors
+            }
 
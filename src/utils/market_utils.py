@@ -0,0 +1,19 @@
+"""Helpers for reading fields from raw market dicts"""
+
+from typing import Dict, Optional
+
+
+def market_id(market: Dict) -> Optional[str]:
+    """
+    Get a market's identifier.
+
+    Gamma markets carry 'id' and some cached/legacy payloads only 'market_id';
+    either key may be missing.
+
+    Args:
+        market: Market dict
+
+    Returns:
+        The first truthy of 'id' and 'market_id', else None
+    """
+    return market.get('id') or market.get('market_id')
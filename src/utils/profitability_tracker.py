@@ -4,15 +4,39 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from collections import defaultdict
+import numpy as np
 from ..utils.logger import setup_logger
 
 
 logger = setup_logger(__name__)
 
+# Box layout for get_performance_summary, filled from get_overall_stats()
+_SUMMARY_TMPL = """
+╔═══════════════════════════════════════════════════════════╗
+║              PROFITABILITY SUMMARY                        ║
+╠═══════════════════════════════════════════════════════════╣
+║ Total Trades:          {total_trades:>10}                    ║
+║ Win Rate:              {win_rate:>9.2f}%                   ║
+║ Winning Trades:        {winning_trades:>10}                    ║
+║ Losing Trades:         {losing_trades:>10}                    ║
+╠═══════════════════════════════════════════════════════════╣
+║ Total P&L:             ${total_pnl:>9.2f}                    ║
+║ ROI:                   {roi:>9.2f}%                   ║
+║ Initial Capital:       ${initial_capital:>9.2f}                    ║
+║ Current Capital:       ${current_capital:>9.2f}                    ║
+╠═══════════════════════════════════════════════════════════╣
+║ Average Win:           ${avg_win:>9.2f}                    ║
+║ Average Loss:          ${avg_loss:>9.2f}                    ║
+║ Largest Win:           ${largest_win:>9.2f}                    ║
+║ Largest Loss:          ${largest_loss:>9.2f}                    ║
+║ Profit Factor:         {profit_factor:>9.2f}                    ║
+╚═══════════════════════════════════════════════════════════╝
+"""
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeRecord:
-    """Record of a completed trade"""
+    """Record of a completed trade (immutable once recorded)"""
     trade_id: str
     strategy: str
     market_id: str
@@ -25,6 +49,23 @@ class TradeRecord:
     pnl: float
     pnl_pct: float
     fees: float = 0.0
+    
+    @classmethod
+    def to_arrays(cls, trades: List['TradeRecord']) -> Dict[str, np.ndarray]:
+        """
+        Extract the numeric trade fields as column arrays.
+        
+        Args:
+            trades: Trades to convert
+            
+        Returns:
+            Dict mapping field name (pnl, pnl_pct, entry_price, exit_price, size, fees)
+            to a float64 array aligned with trades
+        """
+        return {
+            name: np.array([getattr(trade, name) for trade in trades], dtype=np.float64)
+            for name in ('pnl', 'pnl_pct', 'entry_price', 'exit_price', 'size', 'fees')
+        }
 
 
 class ProfitabilityTracker:
@@ -33,6 +74,24 @@ class ProfitabilityTracker:
     def __init__(self):
         """Initialize profitability tracker"""
         self.trades: List[TradeRecord] = []
+        # Running aggregates over self.trades, updated in record_trade
+        self._agg = {
+            'total_pnl': 0.0,
+            'wins': 0,
+            'losses': 0,
+            'sum_win': 0.0,
+            'sum_loss': 0.0,
+            'largest_win': 0.0,
+            'largest_loss': 0.0
+        }
+        
+        # Column (SoA) copies of the fields analytics read, aligned with self.trades;
+        # the first len(self.trades) entries are valid and capacity doubles when full
+        self._pnl = np.empty(64, dtype=np.float64)
+        self._exit_ts = np.empty(64, dtype=np.int64)  # exit_time in microseconds
+        self._strategy_id = np.empty(64, dtype=np.int32)
+        self._strategy_ids: Dict[str, int] = {}  # strategy name -> id in _strategy_id
+        
         self.initial_capital: float = 0.0
         self.current_capital: float = 0.0
         
@@ -44,8 +103,8 @@ class ProfitabilityTracker:
             'total_pnl': 0.0,
             'total_pnl_pct': 0.0,
             'win_rate': 0.0,
-            'avg_win': 0.0,
-            'avg_loss': 0.0,
+            'sum_win': 0.0,  # avg_win/avg_loss are derived in get_strategy_stats
+            'sum_loss': 0.0,
             'largest_win': 0.0,
             'largest_loss': 0.0
         })
@@ -62,9 +121,30 @@ class ProfitabilityTracker:
         Args:
             trade: TradeRecord to add
         """
+        n = len(self.trades)
+        if n == len(self._pnl):
+            self._pnl = np.resize(self._pnl, 2 * n)
+            self._exit_ts = np.resize(self._exit_ts, 2 * n)
+            self._strategy_id = np.resize(self._strategy_id, 2 * n)
+        self._pnl[n] = trade.pnl
+        self._exit_ts[n] = round(trade.exit_time.timestamp() * 1_000_000)
+        self._strategy_id[n] = self._strategy_ids.setdefault(trade.strategy, len(self._strategy_ids))
+        
         self.trades.append(trade)
         self.current_capital += trade.pnl
         
+        # Update overall aggregates
+        agg = self._agg
+        agg['total_pnl'] += trade.pnl
+        if trade.pnl > 0:
+            agg['wins'] += 1
+            agg['sum_win'] += trade.pnl
+            agg['largest_win'] = max(agg['largest_win'], trade.pnl)
+        elif trade.pnl < 0:
+            agg['losses'] += 1
+            agg['sum_loss'] += trade.pnl
+            agg['largest_loss'] = min(agg['largest_loss'], trade.pnl)
+        
         # Update strategy stats
         stats = self.strategy_stats[trade.strategy]
         stats['total_trades'] += 1
@@ -73,17 +153,11 @@ class ProfitabilityTracker:
         if trade.pnl > 0:
             stats['winning_trades'] += 1
             stats['largest_win'] = max(stats['largest_win'], trade.pnl)
-            if stats['avg_win'] == 0:
-                stats['avg_win'] = trade.pnl
-            else:
-                stats['avg_win'] = (stats['avg_win'] * (stats['winning_trades'] - 1) + trade.pnl) / stats['winning_trades']
+            stats['sum_win'] += trade.pnl
         else:
             stats['losing_trades'] += 1
             stats['largest_loss'] = min(stats['largest_loss'], trade.pnl)
-            if stats['avg_loss'] == 0:
-                stats['avg_loss'] = trade.pnl
-            else:
-                stats['avg_loss'] = (stats['avg_loss'] * (stats['losing_trades'] - 1) + trade.pnl) / stats['losing_trades']
+            stats['sum_loss'] += trade.pnl
         
         # Calculate win rate
         if stats['total_trades'] > 0:
@@ -100,22 +174,22 @@ class ProfitabilityTracker:
         Returns:
             Dictionary of overall stats
         """
+        agg = self._agg
         total_trades = len(self.trades)
-        winning_trades = sum(1 for t in self.trades if t.pnl > 0)
-        losing_trades = sum(1 for t in self.trades if t.pnl < 0)
+        winning_trades = agg['wins']
+        losing_trades = agg['losses']
+        sum_win = agg['sum_win']
+        sum_loss = agg['sum_loss']
         
-        total_pnl = sum(t.pnl for t in self.trades)
+        total_pnl = agg['total_pnl']
         total_pnl_pct = (total_pnl / self.initial_capital * 100) if self.initial_capital > 0 else 0.0
         
         roi = ((self.current_capital - self.initial_capital) / self.initial_capital * 100) if self.initial_capital > 0 else 0.0
         
-        winning_pnls = [t.pnl for t in self.trades if t.pnl > 0]
-        losing_pnls = [t.pnl for t in self.trades if t.pnl < 0]
+        avg_win = sum_win / winning_trades if winning_trades else 0.0
+        avg_loss = sum_loss / losing_trades if losing_trades else 0.0
         
-        avg_win = sum(winning_pnls) / len(winning_pnls) if winning_pnls else 0.0
-        avg_loss = sum(losing_pnls) / len(losing_pnls) if losing_pnls else 0.0
-        
-        profit_factor = abs(sum(winning_pnls) / sum(losing_pnls)) if losing_pnls and sum(losing_pnls) != 0 else float('inf') if winning_pnls else 0.0
+        profit_factor = abs(sum_win / sum_loss) if losing_trades and sum_loss != 0 else float('inf') if winning_trades else 0.0
         
         return {
             'total_trades': total_trades,
@@ -129,8 +203,8 @@ class ProfitabilityTracker:
             'current_capital': self.current_capital,
             'avg_win': avg_win,
             'avg_loss': avg_loss,
-            'largest_win': max(winning_pnls) if winning_pnls else 0.0,
-            'largest_loss': min(losing_pnls) if losing_pnls else 0.0,
+            'largest_win': agg['largest_win'],
+            'largest_loss': agg['largest_loss'],
             'profit_factor': profit_factor
         }
     
@@ -145,8 +219,17 @@ class ProfitabilityTracker:
             Dictionary of strategy stats
         """
         if strategy:
-            return self.strategy_stats.get(strategy, {})
-        return dict(self.strategy_stats)
+            stats = self.strategy_stats.get(strategy)
+            return self._with_averages(stats) if stats else {}
+        return {name: self._with_averages(stats) for name, stats in self.strategy_stats.items()}
+    
+    @staticmethod
+    def _with_averages(stats: Dict) -> Dict:
+        """Copy strategy stats, adding avg_win/avg_loss from the running sums"""
+        result = dict(stats)
+        result['avg_win'] = stats['sum_win'] / stats['winning_trades'] if stats['winning_trades'] else 0.0
+        result['avg_loss'] = stats['sum_loss'] / stats['losing_trades'] if stats['losing_trades'] else 0.0
+        return result
     
     def get_recent_trades(self, limit: int = 10) -> List[TradeRecord]:
         """
@@ -158,7 +241,38 @@ class ProfitabilityTracker:
         Returns:
             List of recent trades
         """
-        return sorted(self.trades, key=lambda t: t.exit_time, reverse=True)[:limit]
+        n = len(self.trades)
+        if limit <= 0 or n == 0:
+            return []
+        
+        exit_ts = self._exit_ts[:n]
+        if limit < n:
+            # limit-th newest exit time; keep every trade tied with it so ties resolve by record order
+            cutoff = exit_ts[np.argpartition(exit_ts, n - limit)[n - limit]]
+            candidates = np.flatnonzero(exit_ts >= cutoff)
+        else:
+            candidates = np.arange(n)
+        # Newest first; ties keep record order
+        order = candidates[np.lexsort((candidates, -exit_ts[candidates]))][:limit]
+        return [self.trades[i] for i in order]
+    
+    def get_pnl_array(self, strategy: Optional[str] = None) -> np.ndarray:
+        """
+        Get trade P&L in record order.
+        
+        Args:
+            strategy: Strategy name (None for all)
+            
+        Returns:
+            Array of P&L values
+        """
+        n = len(self.trades)
+        if strategy is None:
+            return self._pnl[:n].copy()
+        strategy_id = self._strategy_ids.get(strategy)
+        if strategy_id is None:
+            return np.empty(0, dtype=np.float64)
+        return self._pnl[:n][self._strategy_id[:n] == strategy_id]
     
     def get_performance_summary(self) -> str:
         """
@@ -168,27 +282,5 @@ class ProfitabilityTracker:
             Formatted string summary
         """
         stats = self.get_overall_stats()
-        
-        summary = f"""
-╔═══════════════════════════════════════════════════════════╗
-║              PROFITABILITY SUMMARY                        ║
-╠═══════════════════════════════════════════════════════════╣
-║ Total Trades:          {stats['total_trades']:>10}                    ║
-║ Win Rate:              {stats['win_rate']:>9.2f}%                   ║
-║ Winning Trades:        {stats['winning_trades']:>10}                    ║
-║ Losing Trades:         {stats['losing_trades']:>10}                    ║
-╠═══════════════════════════════════════════════════════════╣
-║ Total P&L:             ${stats['total_pnl']:>9.2f}                    ║
-║ ROI:                   {stats['roi']:>9.2f}%                   ║
-║ Initial Capital:       ${stats['initial_capital']:>9.2f}                    ║
-║ Current Capital:       ${stats['current_capital']:>9.2f}                    ║
-╠═══════════════════════════════════════════════════════════╣
-║ Average Win:           ${stats['avg_win']:>9.2f}                    ║
-║ Average Loss:          ${stats['avg_loss']:>9.2f}                    ║
-║ Largest Win:           ${stats['largest_win']:>9.2f}                    ║
-║ Largest Loss:          ${stats['largest_loss']:>9.2f}                    ║
-║ Profit Factor:         {stats['profit_factor']:>9.2f}                    ║
-╚═══════════════════════════════════════════════════════════╝
-"""
-        return summary
+        return _SUMMARY_TMPL.format_map(stats)
 
@@ -1,29 +1,116 @@
 """Telegram notifications for trading bot"""
 
 import logging
+import sys
 import threading
 import asyncio
 import concurrent.futures
-from typing import Optional
-from telegram import Bot
+import html
+from collections import deque
+from datetime import timedelta
+from typing import Deque, Optional, Tuple
+import httpx
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
 from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler, filters, ContextTypes
-from telegram import Update
+from telegram import LinkPreviewOptions, Update
 from ..utils.logger import setup_logger
 
+try:
+    import uvloop
+except ImportError:  # optional: libuv-based loop for the notifier thread
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of Telegram API responses
+    orjson = None
+
 
 logger = setup_logger(__name__)
 
+# Batched sends stay below Telegram's 4096-character message limit
+MAX_BATCH_CHARS = 4000
+
+# Telegram allows about one message per second to a single chat
+MIN_SEND_INTERVAL = 1.0
+
+# Seconds to wait between chat ID long polls that fail or come back empty
+POLL_BACKOFF = (0.5, 1.0, 2.0, 4.0)
+
+# Connection settings for the notifier's HTTP client. Idle connections are kept
+# for 30s (httpx defaults to 5s) so sends a few batches apart reuse the TLS session.
+_REQUEST_SETTINGS = {
+    'http_version': "1.1",
+    'pool_timeout': 5,
+    'httpx_kwargs': {'limits': httpx.Limits(max_connections=8, keepalive_expiry=30.0)}
+}
+
+
+_NO_LINK_PREVIEW = LinkPreviewOptions(is_disabled=True)
+
+
+def _retry_after_seconds(error: RetryAfter) -> float:
+    """Flood-control wait from a RetryAfter (an int or a timedelta depending on PTB settings)"""
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return retry_after
+
+
+class _OrjsonRequest(HTTPXRequest):
+    """HTTPXRequest that parses Telegram responses with orjson"""
+    
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # Fall back to PTB's parser, which tolerates bad UTF-8 and raises TelegramError
+            return HTTPXRequest.parse_json_payload(payload)
+
 
 class TelegramNotifier:
     """Send notifications to Telegram using python-telegram-bot library"""
     
-    def __init__(self, bot_token: str, chat_id: Optional[str] = None):
+    # Message templates (HTML parse mode); interpolated text is passed through html.escape
+    _BOT_STARTED_TMPL = "🤖 <b>Bot Started</b>\n\n✅ Strategies: {strategies}\n📊 Monitoring markets..."
+    _STATUS_UPDATE_TMPL = (
+        "📊 <b>Bot Status Update</b>\n\n"
+        "⏱️  Uptime: {uptime:.0f} minutes\n"
+        "🔄 Iterations: {iterations:,}\n"
+        "💼 Trades: {trades}\n"
+        "💰 P&L: ${pnl:.2f}\n"
+        "📡 WebSocket: {ws_status}\n"
+        "✅ Strategies: {strategy_count} active\n"
+    )
+    _TRADE_EXECUTED_TMPL = "🎯 <b>Trade Executed</b>\n\n<b>Strategy:</b> {strategy}\n<b>Market:</b> {market}...\n"
+    _TRADE_COMPLETED_TMPL = (
+        "✅ <b>Trade Completed</b>\n\n<b>Strategy:</b> {strategy}\n<b>Market:</b> {market}...\n"
+        "<b>Profit:</b> ${profit:.2f}"
+    )
+    _BOT_STOPPED_TMPL = "🛑 <b>Bot Stopped</b>\n\n<b>Total Trades:</b> {total_trades}\n<b>Final P&L:</b> ${final_pnl:.2f}"
+    
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: Optional[str] = None,
+        batch_flush_interval: float = 3.0,
+        batch_quiet_interval: float = 0.5,
+        notify_timeout: float = 1.5
+    ):
         """
         Initialize Telegram notifier.
         
         Args:
             bot_token: Telegram bot token from BotFather
             chat_id: Chat ID (optional, will be auto-detected if not provided)
+            batch_flush_interval: Longest seconds to collect queued notifications
+                before sending them as one message
+            batch_quiet_interval: Send a batch early once no notification has been
+                queued for this many seconds
+            notify_timeout: Seconds a caller blocks waiting on a Telegram call
+                (e.g. check_for_updates) before giving up
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
@@ -33,45 +120,263 @@ class TelegramNotifier:
         self._polling_thread = None
         self._event_loop = None
         self._loop_thread = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None  # default executor of our own loop
+        self._tasks = set()  # background tasks started by _schedule
+        
+        # Outgoing notifications: (text, parse_mode), drained by _flush_loop
+        self.batch_flush_interval = batch_flush_interval
+        self.batch_quiet_interval = batch_quiet_interval
+        self.notify_timeout = notify_timeout
+        self._outbox: Deque[Tuple[str, Optional[str]]] = deque()
+        self._outbox_event: Optional[asyncio.Event] = None
+        self._next_send_at = 0.0  # loop time before which the next batch waits (per-chat rate limit)
         
         if self.enabled:
             try:
-                self.bot = Bot(token=bot_token)
+                # One Application (and so one keep-alive HTTP connection pool) for the
+                # notifier's lifetime; released in close()
+                request_class = _OrjsonRequest if orjson else HTTPXRequest
+                self.application = (
+                    ApplicationBuilder()
+                    .token(bot_token)
+                    .request(request_class(**_REQUEST_SETTINGS))
+                    .build()
+                )
+                self.bot = self.application.bot
                 # Start a persistent event loop in a background thread
                 self._start_event_loop()
-                # Test connection by getting bot info
-                try:
-                    async def get_bot_info():
-                        return await self.bot.get_me()
-                    bot_info = self._run_async(get_bot_info())
-                    logger.debug(f"Telegram bot connected: @{bot_info.username}")
-                except Exception as e:
-                    logger.debug(f"Could not verify Telegram bot: {e}")
             except Exception as e:
                 logger.debug(f"Failed to initialize Telegram bot: {e}")
                 self.enabled = False
     
     def _start_event_loop(self):
         """Start a persistent event loop in a background thread"""
+        loop_ready = threading.Event()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="telegram-notifier"
+        )
+        
         def run_loop():
-            self._event_loop = asyncio.new_event_loop()
+            self._event_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
             asyncio.set_event_loop(self._event_loop)
+            if sys.version_info >= (3, 12):
+                # Tasks that finish without suspending skip a trip through the ready queue
+                self._event_loop.set_task_factory(asyncio.eager_task_factory)
+            # Anything offloaded with run_in_executor needs a couple of threads, not cpu_count() + 4
+            self._event_loop.set_default_executor(self._executor)
+            # Signalled from inside the loop, so it is running once waiters wake
+            self._event_loop.call_soon(loop_ready.set)
             self._event_loop.run_forever()
         
         self._loop_thread = threading.Thread(target=run_loop, daemon=True)
         self._loop_thread.start()
-        # Wait a bit for loop to start
-        import time
-        time.sleep(0.1)
+        if not loop_ready.wait(timeout=2.0):
+            raise RuntimeError("Telegram event loop did not start")
+        
+        self._start_background_tasks()
+    
+    def _start_background_tasks(self):
+        """Start the batch flusher and the token check on the notifier's loop"""
+        self._outbox_event = asyncio.Event()
+        self._schedule(self._flush_loop())
+        # Test connection by getting bot info (logged only, so don't wait for it)
+        self._schedule(self._verify_bot())
+    
+    def _in_loop(self) -> bool:
+        """Whether the caller is running on the notifier's event loop"""
+        try:
+            return asyncio.get_running_loop() is self._event_loop
+        except RuntimeError:
+            return False
+    
+    async def _verify_bot(self):
+        """Initialize the application (fetches the bot's identity) to confirm the token works"""
+        await self.application.initialize()
+        logger.debug(f"Telegram bot connected: @{self.bot.username}")
+    
+    async def _flush_loop(self):
+        """Send queued notifications in batches for the notifier's lifetime"""
+        while True:
+            await self._outbox_event.wait()
+            # Let a burst accumulate so it goes out as one message: wait until no new
+            # notification arrives for batch_quiet_interval, or batch_flush_interval passes
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.batch_flush_interval
+            while True:
+                self._outbox_event.clear()
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        self._outbox_event.wait(), timeout=min(self.batch_quiet_interval, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._drain_outbox()
     
-    def _run_async(self, coro):
-        """Run an async coroutine in the persistent event loop"""
+    async def _drain_outbox(self):
+        """Send everything queued, joining consecutive entries up to MAX_BATCH_CHARS"""
+        while self._outbox:
+            parse_mode = self._outbox[0][1]
+            parts = []
+            length = 0
+            while self._outbox and self._outbox[0][1] == parse_mode:
+                text = self._outbox[0][0]
+                added = len(text) + (2 if parts else 0)
+                if parts and length + added > MAX_BATCH_CHARS:
+                    break
+                parts.append(text)
+                length += added
+                self._outbox.popleft()
+            text = "\n\n".join(parts)
+            if len(parts) > 1:
+                text = f"🔔 {len(parts)} notifications\n\n{text}"
+            await self._send_batch(text, parse_mode)
+    
+    async def _send_batch(self, text: str, parse_mode: Optional[str], max_attempts: int = 3) -> bool:
+        """Send one batched message, waiting out Telegram flood control (429)"""
+        for _ in range(max_attempts):
+            # Space sends out so the chat's rate limit is respected up front
+            loop = asyncio.get_running_loop()
+            delay = self._next_send_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_send_at = loop.time() + MIN_SEND_INTERVAL
+            try:
+                await self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text=text,
+                    parse_mode=parse_mode,
+                    # Notifications carry no links worth previewing; skip Telegram's fetch
+                    link_preview_options=_NO_LINK_PREVIEW
+                )
+                return True
+            except RetryAfter as e:
+                retry_after = _retry_after_seconds(e)
+                logger.debug(f"Telegram flood control, retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
+            except Exception as e:
+                logger.debug(f"Error in async send: {e}")
+                return False
+        return False
+    
+    def flush(self, timeout: float = 10.0) -> None:
+        """
+        Send queued notifications now and wait for them (e.g. before shutdown).
+        
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if not self._event_loop or not self._outbox:
+            return
+        if self._in_loop():
+            # Blocking here would stall the loop doing the sending
+            self._schedule(self._drain_outbox())
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain_outbox(), self._event_loop).result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Error flushing Telegram notifications: {e}")
+    
+    def _schedule(self, coro) -> None:
+        """Schedule a fire-and-forget coroutine on the persistent event loop"""
+        if self._in_loop():
+            self._create_task(coro)
+            return
+        # A bare task is enough here; run_coroutine_threadsafe would also build a
+        # concurrent Future nobody waits on
+        self._event_loop.call_soon_threadsafe(self._create_task, coro)
+    
+    def _create_task(self, coro) -> None:
+        """Start a background task (runs on the event loop)"""
+        task = self._event_loop.create_task(coro)
+        # The loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+    
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished background task, logging any failure"""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.debug(f"Telegram background task failed: {task.exception()}")
+    
+    async def _cancel_tasks(self) -> None:
+        """Cancel outstanding background tasks (e.g. _flush_loop) and wait for them"""
+        tasks = [task for task in self._tasks if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _run_async(self, coro, timeout: Optional[float] = None):
+        """
+        Run an async coroutine in the persistent event loop and wait for its result.
+        
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (defaults to notify_timeout); on timeout the
+                call is cancelled and None is returned
+        """
         if not self._event_loop:
             # Fallback to asyncio.run if loop not available
             return asyncio.run(coro)
+        if self._in_loop():
+            raise RuntimeError("Cannot wait for a Telegram call from the notifier's own event loop")
+        
+        if timeout is None:
+            timeout = self.notify_timeout
         
         future = asyncio.run_coroutine_threadsafe(coro, self._event_loop)
-        return future.result(timeout=10)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # Don't leave the request running on the loop
+            future.cancel()
+            logger.debug(f"Telegram call timed out after {timeout}s")
+            return None
+    
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Send queued notifications, release the HTTP connection pool and stop the loop.
+        
+        When called from the notifier's own loop the shutdown is scheduled
+        rather than waited for.
+        
+        Args:
+            timeout: Maximum seconds to wait for each step
+        """
+        if not self._event_loop:
+            return
+        
+        if self._in_loop():
+            self._schedule(self._shutdown())
+            self._event_loop = None
+            return
+        
+        self.flush(timeout=timeout)
+        try:
+            asyncio.run_coroutine_threadsafe(self.application.shutdown(), self._event_loop).result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Error shutting down Telegram application: {e}")
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self._event_loop).result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Error cancelling Telegram background tasks: {e}")
+        
+        loop, self._event_loop = self._event_loop, None
+        loop.call_soon_threadsafe(loop.stop)
+        self._executor.shutdown(wait=False)
+    
+    async def _shutdown(self) -> None:
+        """close() steps, for when it is called from the notifier's own loop"""
+        try:
+            await self._drain_outbox()
+            await self.application.shutdown()
+        except Exception as e:
+            logger.debug(f"Error shutting down Telegram application: {e}")
+        await self._cancel_tasks()
+        asyncio.get_running_loop().stop()
+        self._executor.shutdown(wait=False)
     
     def check_for_updates(self) -> Optional[str]:
         """Manually check for updates to detect chat_id"""
@@ -79,77 +384,114 @@ class TelegramNotifier:
             return self.chat_id
         
         try:
-            async def _check():
-                # Get the last update
-                updates = await self.bot.get_updates(offset=-1, limit=1, timeout=1)
-                if updates:
-                    update = updates[-1]
-                    if update.message:
-                        chat_id = str(update.message.chat.id)
-                        self.chat_id = chat_id
-                        logger.info(f"Telegram chat ID detected: {self.chat_id}")
-                        # Send confirmation message
-                        try:
-                            await self.bot.send_message(
-                                chat_id=chat_id,
-                                text="✅ Bot connected! You will receive trade notifications here."
-                            )
-                        except:
-                            pass  # Chat ID is set, that's what matters
-                        return chat_id
-                return None
-            
-            # Use persistent event loop
-            return self._run_async(_check())
+            # Short poll: the caller only waits notify_timeout for the whole check
+            return self._run_async(self._poll_chat_id(0))
         except Exception as e:
             logger.debug(f"Error checking for updates: {e}")
             return None
     
-    def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
+    def long_poll_for_chat_id(self, timeout: float = 15.0) -> Optional[str]:
         """
-        Send message to Telegram.
+        Wait for the user's first message to detect chat_id.
+        
+        Uses Telegram's long polling, so this returns as soon as a message arrives
+        rather than on the next poll.
         
         Args:
-            message: Message text
-            parse_mode: Parse mode (HTML or Markdown)
+            timeout: Maximum seconds to wait
             
         Returns:
-            True if sent successfully
+            Detected chat ID, or None if no message arrived in time
         """
-        if not self.enabled or not self.bot:
-            return False
-        
-        if not self.chat_id:
-            # Chat ID not detected yet - user needs to send a message first
-            return False
+        if not self.bot or self.chat_id:
+            return self.chat_id
         
         try:
-            # Use persistent event loop
-            async def _send():
+            # Leave room for the request overhead on top of the long poll itself
+            return self._run_async(self._long_poll_chat_id(timeout), timeout=timeout + 5)
+        except Exception as e:
+            logger.debug(f"Error waiting for Telegram chat ID: {e}")
+            return None
+    
+    async def _long_poll_chat_id(self, timeout: float) -> Optional[str]:
+        """Long-poll getUpdates until a chat ID is found or timeout elapses"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        backoff = iter(POLL_BACKOFF)
+        
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            
+            try:
+                chat_id = await self._poll_chat_id(max(1, int(remaining)))
+                if chat_id:
+                    return chat_id
+                # Poll ran out, or the latest update carried no message
+                delay = next(backoff, POLL_BACKOFF[-1])
+            except RetryAfter as e:
+                delay = _retry_after_seconds(e)
+            except Exception as e:
+                delay = next(backoff, POLL_BACKOFF[-1])
+                logger.debug(f"Error polling Telegram updates, retrying in {delay}s: {e}")
+            
+            await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+    
+    async def _poll_chat_id(self, poll_timeout: int) -> Optional[str]:
+        """Read the latest update (waiting up to poll_timeout seconds for one) and take its chat ID"""
+        updates = await self.bot.get_updates(offset=-1, limit=1, timeout=poll_timeout)
+        if updates:
+            update = updates[-1]
+            if update.message:
+                chat_id = str(update.message.chat.id)
+                self.chat_id = chat_id
+                logger.info(f"Telegram chat ID detected: {self.chat_id}")
+                # Send confirmation message
                 try:
                     await self.bot.send_message(
-                        chat_id=self.chat_id,
-                        text=message,
-                        parse_mode=parse_mode
+                        chat_id=chat_id,
+                        text="✅ Bot connected! You will receive trade notifications here."
                     )
-                    return True
-                except Exception as e:
-                    logger.debug(f"Error in async send: {e}")
-                    return False
-            
-            return self._run_async(_send())
+                except:
+                    pass  # Chat ID is set, that's what matters
+                return chat_id
+        return None
+    
+    @property
+    def ready(self) -> bool:
+        """Whether notifications can be sent (chat ID is only known once the user has messaged the bot)"""
+        return bool(self.enabled and self.bot is not None and self.chat_id)
+    
+    def send_message(self, message: str, parse_mode: Optional[str] = "HTML") -> bool:
+        """
+        Queue a message for Telegram.
+        
+        Messages are sent in the background; ones queued close together are
+        joined into a single Telegram message.
+        
+        Args:
+            message: Message text
+            parse_mode: Parse mode (HTML, Markdown or None for plain text)
             
-        except Exception as e:
-            # Log error but don't spam terminal
-            logger.debug(f"Error sending Telegram message: {e}", exc_info=True)
+        Returns:
+            True if queued for sending
+        """
+        if not self.ready or not self._event_loop:
             return False
+        
+        self._outbox.append((message, parse_mode))
+        if self._in_loop():
+            self._outbox_event.set()
+        else:
+            self._event_loop.call_soon_threadsafe(self._outbox_event.set)
+        return True
     
     def bot_started(self, strategies: list) -> bool:
         """Notify that bot has started"""
-        message = f"🤖 <b>Bot Started</b>\n\n"
-        message += f"✅ Strategies: {', '.join(strategies)}\n"
-        message += f"📊 Monitoring markets..."
-        return self.send_message(message)
+        if not self.ready:
+            return False
+        return self.send_message(self._BOT_STARTED_TMPL.format(strategies=html.escape(', '.join(strategies))))
     
     def send_status_update(self, stats: dict) -> bool:
         """
@@ -165,8 +507,11 @@ class TelegramNotifier:
                 - iteration_count: Number of iterations
                 
         Returns:
-            True if sent successfully
+            True if queued for sending
         """
+        if not self.ready:
+            return False
+        
         uptime = stats.get('uptime_minutes', 0)
         trades = stats.get('total_trades', 0)
         pnl = stats.get('total_pnl', 0.0)
@@ -174,52 +519,53 @@ class TelegramNotifier:
         ws_status = stats.get('websocket_status', 'Unknown')
         iterations = stats.get('iteration_count', 0)
         
-        message = f"📊 <b>Bot Status Update</b>\n\n"
-        message += f"⏱️  Uptime: {uptime:.0f} minutes\n"
-        message += f"🔄 Iterations: {iterations:,}\n"
-        message += f"💼 Trades: {trades}\n"
-        message += f"💰 P&L: ${pnl:.2f}\n"
-        message += f"📡 WebSocket: {ws_status}\n"
-        message += f"✅ Strategies: {len(strategies)} active\n"
-        
+        parts = [self._STATUS_UPDATE_TMPL.format(
+            uptime=uptime,
+            iterations=iterations,
+            trades=trades,
+            pnl=pnl,
+            ws_status=ws_status,
+            strategy_count=len(strategies)
+        )]
         if strategies:
-            message += f"   • {', '.join(strategies[:5])}"
+            parts.append(f"   • {html.escape(', '.join(strategies[:5]))}")
             if len(strategies) > 5:
-                message += f" +{len(strategies) - 5} more"
+                parts.append(f" +{len(strategies) - 5} more")
         
-        return self.send_message(message)
+        return self.send_message("".join(parts))
     
     def trade_executed(self, strategy: str, market_id: str, details: dict) -> bool:
         """Notify that a trade was executed"""
-        message = f"🎯 <b>Trade Executed</b>\n\n"
-        message += f"<b>Strategy:</b> {strategy}\n"
-        message += f"<b>Market:</b> {market_id[:30]}...\n"
+        if not self.ready:
+            return False
+        
+        parts = [self._TRADE_EXECUTED_TMPL.format(strategy=html.escape(strategy), market=html.escape(market_id[:30]))]
         
         if 'profit_pct' in details:
-            message += f"<b>Profit:</b> {details['profit_pct']:.2f}%\n"
+            parts.append(f"<b>Profit:</b> {details['profit_pct']:.2f}%\n")
         elif 'profit_cents' in details:
-            message += f"<b>Profit:</b> {details['profit_cents']:.1f}¢\n"
+            parts.append(f"<b>Profit:</b> {details['profit_cents']:.1f}¢\n")
         
         if 'buy_price' in details and 'sell_price' in details:
-            message += f"<b>Buy:</b> ${details['buy_price']:.4f}\n"
-            message += f"<b>Sell:</b> ${details['sell_price']:.4f}\n"
+            parts.append(f"<b>Buy:</b> ${details['buy_price']:.4f}\n<b>Sell:</b> ${details['sell_price']:.4f}\n")
         elif 'effective_cost' in details and 'potential_profit' in details:
-            message += f"<b>Cost:</b> ${details['effective_cost']:.2f}\n"
-            message += f"<b>Potential:</b> ${details['potential_profit']:.2f}\n"
+            parts.append(
+                f"<b>Cost:</b> ${details['effective_cost']:.2f}\n"
+                f"<b>Potential:</b> ${details['potential_profit']:.2f}\n"
+            )
         
-        return self.send_message(message)
+        return self.send_message("".join(parts))
     
     def trade_completed(self, strategy: str, market_id: str, profit: float) -> bool:
         """Notify that a trade was completed"""
-        message = f"✅ <b>Trade Completed</b>\n\n"
-        message += f"<b>Strategy:</b> {strategy}\n"
-        message += f"<b>Market:</b> {market_id[:30]}...\n"
-        message += f"<b>Profit:</b> ${profit:.2f}"
-        return self.send_message(message)
+        if not self.ready:
+            return False
+        return self.send_message(self._TRADE_COMPLETED_TMPL.format(
+            strategy=html.escape(strategy), market=html.escape(market_id[:30]), profit=profit
+        ))
     
     def bot_stopped(self, total_trades: int, final_pnl: float) -> bool:
         """Notify that bot has stopped"""
-        message = f"🛑 <b>Bot Stopped</b>\n\n"
-        message += f"<b>Total Trades:</b> {total_trades}\n"
-        message += f"<b>Final P&L:</b> ${final_pnl:.2f}"
-        return self.send_message(message)
+        if not self.ready:
+            return False
+        return self.send_message(self._BOT_STOPPED_TMPL.format(total_trades=total_trades, final_pnl=final_pnl))
@@ -9,7 +9,6 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.bot import TradingBot
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -26,6 +25,9 @@ def test_bot_integration():
         
     try:
         print("📦 Initializing bot...")
+        # Imported here so collecting this file does not load the whole bot
+        from src.bot import TradingBot
+        
         bot = TradingBot(config_path=str(config_path))
         
         print(f"✅ Bot initialized with {len(bot.strategies)} strategies")
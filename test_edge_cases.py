@@ -11,12 +11,14 @@ sys.path.insert(0, os.path.abspath("src"))
 from src.strategies.tail_end_strategy import TailEndStrategy
 from src.strategies.combinatorial_arbitrage import CombinatorialStrategy
 from src.strategies.market_making import MarketMakingStrategy
+from src.utils.market_cache import parse_end_timestamp
 
 class TestEdgeCases(unittest.TestCase):
     def setUp(self):
         self.mock_client = MagicMock()
         self.mock_risk_manager = MagicMock()
         self.mock_market_cache = MagicMock()
+        self.mock_market_cache.get_end_ts_epoch.side_effect = lambda market_id, end_date_str: parse_end_timestamp(end_date_str)
         self.config = {}
 
     # --- Tail End Strategy Edge Cases ---
@@ -58,7 +60,7 @@ class TestEdgeCases(unittest.TestCase):
         self.mock_market_cache.get_markets.return_value = markets
         
         # Price is 0 or None
-        self.mock_market_cache.get_price.return_value = {'ask': 0}
+        self.mock_market_cache.get_prices_bulk.return_value = {'m1': {'ask': 0}}
         
         opportunities = strategy.scan_opportunities()
         self.assertEqual(len(opportunities), 0)
@@ -100,7 +102,7 @@ class TestEdgeCases(unittest.TestCase):
         self.mock_market_cache.get_markets.return_value = markets
         
         # Both prices 0
-        self.mock_market_cache.get_price.return_value = {'ask': 0.0}
+        self.mock_market_cache.get_prices_bulk.return_value = {'m1': {'ask': 0.0}, 'm2': {'ask': 0.0}}
         
         opportunities = strategy.scan_opportunities()
         self.assertEqual(len(opportunities), 0)
@@ -7,13 +7,11 @@ It demonstrates how the strategy maintains orders in bands around market price.
 """
 
 import sys
-import time
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.bot import TradingBot
 from src.utils.logger import setup_logger, get_trade_logger
 
 logger = setup_logger(__name__)
@@ -52,6 +50,9 @@ def test_market_making_strategy():
     try:
         # Initialize bot
         print("📦 Initializing bot...")
+        # Imported here so collecting this file does not load the whole bot
+        from src.bot import TradingBot
+        
         bot = TradingBot(config_path=str(config_path))
         
         # Check if market_making strategy is enabled
@@ -108,9 +109,11 @@ def test_market_making_strategy():
                 else:
                     print("   ℹ️  No trades executed")
                 
-                # Sleep between iterations
-                if iterations < max_iterations:
-                    time.sleep(2)  # 2 seconds between iterations for testing
+                # Idle iterations wait up to 2 seconds (cut short if the bot is stopped);
+                # iterations that traded go straight into the next one
+                if iterations < max_iterations and not trades:
+                    if bot.stop_event.wait(timeout=2.0):
+                        break
         
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user")
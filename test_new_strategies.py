@@ -2,6 +2,7 @@
 import unittest
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
+import time
 import sys
 import os
 
@@ -17,6 +18,21 @@ class TestNewStrategies(unittest.TestCase):
         self.mock_risk_manager = MagicMock()
         self.mock_market_cache = MagicMock()
         self.config = {}
+        
+        # Per-market prices, set by each test and served by a plain dict lookup
+        self.prices = {}
+        self.mock_market_cache.get_prices_bulk.side_effect = self._get_prices_bulk
+        
+        # Per-market expiry as epoch seconds, as MarketCache.get_end_ts_epoch returns it
+        self.now = int(time.time())
+        self.end_ts = {}
+        self.mock_market_cache.get_end_ts_epoch.side_effect = self._get_end_ts
+
+    def _get_prices_bulk(self, market_ids, outcome=None):
+        return {market_id: self.prices[market_id] for market_id in market_ids if market_id in self.prices}
+
+    def _get_end_ts(self, market_id, end_date_str=None):
+        return self.end_ts.get(market_id)
 
     def test_tail_end_strategy(self):
         strategy = TailEndStrategy(
@@ -36,10 +52,11 @@ class TestNewStrategies(unittest.TestCase):
             {'id': 'm2', 'question': 'Will Y happen?', 'end_date_iso': far_date, 'tokens': [{'token_id': 't2', 'outcome': 'YES'}]}
         ]
         self.mock_market_cache.get_markets.return_value = markets
+        self.end_ts = {'m1': self.now + 3 * 86400, 'm2': self.now + 20 * 86400}
         
         # Mock Prices
         # m1: YES @ 0.95 (Match)
-        self.mock_market_cache.get_price.side_effect = lambda mid, outcome: {'ask': 0.95} if mid == 'm1' else {'ask': 0.50}
+        self.prices = {'m1': {'ask': 0.95}, 'm2': {'ask': 0.50}}
         
         opportunities = strategy.scan_opportunities()
         
@@ -48,6 +65,37 @@ class TestNewStrategies(unittest.TestCase):
         self.assertEqual(opportunities[0]['price'], 0.95)
         print("✅ Tail End Strategy verified")
 
+    def test_tail_end_strategy_filters(self):
+        strategy = TailEndStrategy(
+            name="tail_end",
+            polymarket_client=self.mock_client,
+            risk_manager=self.mock_risk_manager,
+            config={'min_price': 0.90, 'max_price': 0.99, 'max_days_to_expiry': 7},
+            market_cache=self.mock_market_cache
+        )
+        
+        # m1 in window and band, m2 too far out, m3 too cheap, m4 expired
+        self.mock_market_cache.get_markets.return_value = [
+            {'id': market_id, 'question': f'Will {market_id} happen?', 'end_date_iso': 'cached',
+             'tokens': [{'token_id': f't{market_id}', 'outcome': 'YES'}]}
+            for market_id in ('m1', 'm2', 'm3', 'm4')
+        ]
+        self.end_ts = {
+            'm1': self.now + 3 * 86400,
+            'm2': self.now + 20 * 86400,
+            'm3': self.now + 86400,
+            'm4': self.now - 86400
+        }
+        self.prices = {'m1': {'ask': 0.95}, 'm2': {'ask': 0.95}, 'm3': {'ask': 0.50}, 'm4': {'ask': 0.95}}
+        
+        opportunities = strategy.scan_opportunities()
+        self.assertEqual([opp['market_id'] for opp in opportunities], ['m1'])
+        
+        # Markets already held are skipped
+        strategy.active_positions.add('m1')
+        self.assertEqual(strategy.scan_opportunities(), [])
+        print("✅ Tail End Strategy filters verified")
+
     def test_combinatorial_strategy(self):
         strategy = CombinatorialStrategy(
             name="combinatorial",
@@ -66,7 +114,7 @@ class TestNewStrategies(unittest.TestCase):
         
         # Mock Prices (Divergent)
         # m1: YES @ 0.40, m2: YES @ 0.50 (Diff 0.10, 20% > 10%)
-        self.mock_market_cache.get_price.side_effect = lambda mid, outcome: {'ask': 0.40} if mid == 'm1' else {'ask': 0.50}
+        self.prices = {'m1': {'ask': 0.40}, 'm2': {'ask': 0.50}}
         
         opportunities = strategy.scan_opportunities()
         
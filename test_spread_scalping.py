@@ -4,35 +4,92 @@ Test script for Spread Scalping Strategy
 """
 
 import sys
-import time
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import numpy as np
+import pytest
 
-from src.bot import TradingBot
-from src.strategies.spread_scalping import SpreadScalpingStrategy
 from src.utils.logger import setup_logger, get_trade_logger
 
 logger = setup_logger(__name__)
 trade_logger = get_trade_logger()
 
-def test_spread_scalping():
+N_MARKETS = 100
+
+# Mock responses are built once and returned as-is on every call
+_MARKET_TEMPLATE = {
+    'question': 'Will Bitcoin hit $100k by 2025?',
+    'volume': '50000',
+    'end_date_iso': '2099-12-31T23:59:59Z',
+    'enable_order_book': True,
+    'accepting_orders': True,
+    'closed': False
+}
+_MARKETS_RESPONSE = {
+    'markets': [
+        dict(
+            _MARKET_TEMPLATE,
+            condition_id=f'0x{i:064x}',
+            tokens=[
+                {'token_id': f'yes-{i}', 'outcome': 'YES'},
+                {'token_id': f'no-{i}', 'outcome': 'NO'}
+            ]
+        )
+        for i in range(N_MARKETS)
+    ],
+    'next_cursor': None
+}
+
+# YES books bid 0.75 with spreads cycling 0-9 cents; NO books mirror them
+_yes_spread = (np.arange(N_MARKETS) % 10) / 100
+_yes_ask = 0.75 + _yes_spread
+_PRICES = np.rec.fromarrays(
+    [
+        np.concatenate([np.full(N_MARKETS, 0.75), 1 - _yes_ask]),
+        np.concatenate([_yes_ask, np.full(N_MARKETS, 0.25)]),
+        np.concatenate([_yes_spread, _yes_spread])
+    ],
+    dtype=[('bid', 'f8'), ('ask', 'f8'), ('spread', 'f8')]
+)
+_PRICE_BY_TOKEN = {
+    token_id: MappingProxyType({'bid': float(row.bid), 'ask': float(row.ask), 'spread': float(row.spread)})
+    for token_id, row in zip(
+        [f'yes-{i}' for i in range(N_MARKETS)] + [f'no-{i}' for i in range(N_MARKETS)],
+        _PRICES
+    )
+}
+
+
+def mock_get_markets(active=True, limit=100, next_cursor=None):
+    return _MARKETS_RESPONSE
+
+
+def mock_get_best_price(token_id, outcome="YES"):
+    return _PRICE_BY_TOKEN.get(token_id)
+
+
+def mocked_prices(client):
+    """Point the client's market/price lookups at the mock batch, restoring them on exit"""
+    return patch.multiple(client, get_markets=mock_get_markets, get_best_price=mock_get_best_price)
+
+
+@pytest.fixture(scope="module")
+def mock_prices(bot):
+    """Mock the shared bot's Polymarket client while this module's tests run"""
+    with mocked_prices(bot.polymarket_client):
+        yield bot.polymarket_client
+
+
+def run_spread_scalping(bot) -> bool:
     print("=" * 80)
     print("Testing Spread Scalping Strategy")
     print("=" * 80)
     print()
     
-    # Check config
-    config_path = Path("config/config.yaml")
-    if not config_path.exists():
-        print("❌ Error: config/config.yaml not found!")
-        return False
-        
     try:
-        # Initialize bot (to get clients and managers)
-        print("📦 Initializing bot...")
-        bot = TradingBot(config_path=str(config_path))
+        from src.strategies.spread_scalping import SpreadScalpingStrategy
         
         # Manually initialize our new strategy
         strategy_config = {
@@ -41,7 +98,8 @@ def test_spread_scalping():
             'min_liquidity': 100.0, # Very low liquidity
             'min_days_to_expiry': 0, # Any expiry
             'likely_outcome_threshold': 0.1, # Any probability
-            'order_size_usdc': 10.0
+            'order_size_usdc': 10.0,
+            'max_positions': N_MARKETS # Scan the whole mock batch
         }
         
         strategy = SpreadScalpingStrategy(
@@ -56,32 +114,6 @@ def test_spread_scalping():
         print(f"   Min Spread: {strategy.min_spread_cents}")
         print(f"   Min Liquidity: {strategy.min_liquidity}")
         
-        # Mock PolymarketClient methods to return a perfect candidate
-        original_get_markets = bot.polymarket_client.get_markets
-        original_get_best_price = bot.polymarket_client.get_best_price
-        
-        def mock_get_markets(active=True, limit=100):
-            return [{
-                'id': '0x1234567890abcdef',
-                'market_id': '0x1234567890abcdef',
-                'question': 'Will Bitcoin hit $100k by 2025?',
-                'outcomes': '["YES", "NO"]',
-                'volume': '50000',
-                'endDate': '2025-12-31T23:59:59Z',
-                'closed': False,
-                'accepting_orders': True
-            }]
-            
-        def mock_get_best_price(market_id, outcome="YES"):
-            print(f"DEBUG: Mock get_best_price called for {outcome}")
-            if outcome == "YES":
-                return {'bid': 0.75, 'ask': 0.80, 'spread': 0.05}
-            else:
-                return {'bid': 0.20, 'ask': 0.25, 'spread': 0.05}
-                
-        bot.polymarket_client.get_markets = mock_get_markets
-        bot.polymarket_client.get_best_price = mock_get_best_price
-        
         # Run a few iterations
         print("\n🔄 Running iterations with MOCKED data...")
         
@@ -96,20 +128,35 @@ def test_spread_scalping():
             else:
                 print("   ℹ️  No trades executed (scanning...)")
             
-            time.sleep(1)
-            
-        # Restore mocks (good practice)
-        bot.polymarket_client.get_markets = original_get_markets
-        bot.polymarket_client.get_best_price = original_get_best_price
-            
         print("\n✅ Test completed!")
         return True
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        print(f"\n❌ Error: {e}", flush=True)
         import traceback
         traceback.print_exc()
         return False
 
+@pytest.mark.xdist_group("bot")  # one worker, so the session bot is built once
+def test_spread_scalping(bot, mock_prices):
+    """Run the strategy against the shared bot with mocked market data"""
+    assert run_spread_scalping(bot)
+
 if __name__ == "__main__":
-    test_spread_scalping()
+    # Block-buffer progress output; prints before blocking waits pass flush=True
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    # Check config
+    config_path = Path("config/config.yaml")
+    if not config_path.exists():
+        print("❌ Error: config/config.yaml not found!")
+        sys.exit(1)
+    
+    # Imported here so collecting this file under pytest does not load the whole bot
+    from src.bot import TradingBot
+    
+    # Initialize bot (to get clients and managers)
+    print("📦 Initializing bot...", flush=True)
+    bot = TradingBot(config_path=str(config_path))
+    with mocked_prices(bot.polymarket_client):
+        run_spread_scalping(bot)
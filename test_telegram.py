@@ -2,11 +2,14 @@
 """Test Telegram notifications"""
 
 import sys
-import time
+from pathlib import Path
+
+import pytest
+
 from src.utils.telegram_notifier import TelegramNotifier
 from src.utils.config_loader import ConfigLoader
 
-def test_telegram():
+def run_telegram() -> bool:
     """Test Telegram bot functionality"""
     print("=" * 60)
     print("Testing Telegram Integration")
@@ -43,20 +46,11 @@ def test_telegram():
         print("   2. Search for your bot (use the username BotFather gave you)")
         print("   3. Send any message to the bot (e.g., '/start' or 'hello')")
         print("   4. The bot will automatically detect your chat ID")
-        print("\n   Waiting 15 seconds for you to send a message...")
-        print("   (The bot is listening in the background)")
+        print("\n   Waiting up to 15 seconds for you to send a message...", flush=True)
         
-        # Wait and check periodically
-        for i in range(15):
-            time.sleep(1)
-            # Also try manual check
-            if not notifier.chat_id:
-                notifier.check_for_updates()
-            if notifier.chat_id:
-                print(f"\n✓ Chat ID detected after {i+1} seconds!")
-                break
-            if i % 5 == 4:
-                print(f"   Still waiting... ({i+1}/15 seconds)")
+        # One long poll returns as soon as the message arrives
+        if notifier.long_poll_for_chat_id(timeout=15):
+            print("\n✓ Chat ID detected!")
         
         # Check again
         if not notifier.chat_id:
@@ -96,15 +90,18 @@ def test_telegram():
         try:
             result = test_func()
             if result:
-                print("✓ Sent successfully")
+                print("✓ Queued")
                 results.append((test_name, True))
             else:
-                print("❌ Failed to send")
+                print("❌ Failed to queue")
                 results.append((test_name, False))
         except Exception as e:
             print(f"❌ Error: {e}")
             results.append((test_name, False))
-        time.sleep(1)  # Small delay between messages
+    
+    # Notifications are queued and sent in the background (batched and paced to
+    # Telegram's rate limits), so send them now instead of sleeping between tests
+    notifier.close()
     
     # Summary
     print("\n" + "=" * 60)
@@ -118,13 +115,22 @@ def test_telegram():
     
     if all_passed:
         print("\n✅ All Telegram tests passed!")
-        print("   Check your Telegram app - you should have received 4 test messages.")
+        print("   Check your Telegram app - you should have received the 4 test notifications.")
     else:
         print("\n⚠️  Some tests failed. Check the errors above.")
     
     return all_passed
 
+def test_telegram():
+    """Send the test notifications through the configured Telegram bot"""
+    if not Path("config/config.yaml").exists():
+        pytest.skip("config/config.yaml not found")
+    assert run_telegram()
+
 if __name__ == "__main__":
-    success = test_telegram()
+    # Block-buffer progress output; prints before blocking waits pass flush=True
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    success = run_telegram()
     sys.exit(0 if success else 1)
 
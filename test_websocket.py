@@ -6,20 +6,19 @@ This script tests WebSocket connectivity and real-time data updates.
 """
 
 import sys
-import time
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
-from src.bot import TradingBot
+from src.api.polymarket_websocket import PolymarketWebSocketClient, probe_endpoint
+from src.utils.market_utils import market_id as get_market_id
 from src.utils.logger import setup_logger, get_trade_logger
 
 logger = setup_logger(__name__)
 trade_logger = get_trade_logger()
 
 
-def test_websocket_connection():
+def run_websocket_connection(bot) -> bool:
     """Test WebSocket connection and functionality"""
     
     print("=" * 80)
@@ -27,17 +26,7 @@ def test_websocket_connection():
     print("=" * 80)
     print()
     
-    # Check if config exists
-    config_path = Path("config/config.yaml")
-    if not config_path.exists():
-        print("❌ Error: config/config.yaml not found!")
-        return False
-    
     try:
-        # Initialize bot
-        print("📦 Initializing bot with WebSocket...")
-        bot = TradingBot(config_path=str(config_path))
-        
         # Check WebSocket status
         ws_enabled = bot.config.get('websocket', {}).get('enabled', False)
         print(f"   WebSocket enabled in config: {ws_enabled}")
@@ -77,7 +66,7 @@ def test_websocket_connection():
         
         # Test getting prices via WebSocket
         test_market = markets[0]
-        market_id = test_market.get('id') or test_market.get('market_id')
+        market_id = get_market_id(test_market)
         
         if not market_id:
             print("   ⚠️  No valid market ID found")
@@ -90,9 +79,9 @@ def test_websocket_connection():
             ws_client.subscribe_orderbook(market_id, 'YES')
             print("   ✅ Subscribed to orderbook updates")
             
-            # Wait for initial update
-            print("   Waiting for WebSocket update...")
-            time.sleep(2)
+            # Wait for initial update (returns as soon as the first book arrives)
+            print("   Waiting for WebSocket update...", flush=True)
+            ws_client.get_update_event(market_id, 'YES').wait(timeout=5)
             
             # Get orderbook from WebSocket cache
             orderbook = ws_client.get_orderbook(market_id, 'YES')
@@ -127,13 +116,11 @@ def test_websocket_connection():
         
         # Test real-time updates
         print()
-        print("🔄 Testing real-time updates (waiting 5 seconds)...")
+        print("🔄 Testing real-time updates (waiting up to 5 seconds)...", flush=True)
         initial_orderbook = ws_client.get_orderbook(market_id, 'YES')
         initial_bids = len(initial_orderbook.get('bids', [])) if initial_orderbook else 0
         
-        time.sleep(5)
-        
-        updated_orderbook = ws_client.get_orderbook(market_id, 'YES')
+        updated_orderbook = ws_client.wait_for_orderbook(market_id, 'YES', timeout=5)
         updated_bids = len(updated_orderbook.get('bids', [])) if updated_orderbook else 0
         
         if updated_orderbook:
@@ -151,13 +138,34 @@ def test_websocket_connection():
         return True
     
     except Exception as e:
-        print(f"\n❌ Error during test: {e}")
+        print(f"\n❌ Error during test: {e}", flush=True)
         import traceback
         traceback.print_exc()
         return False
 
 
+@pytest.mark.xdist_group("bot")  # one worker, so the session bot is built once
+def test_websocket_connection(bot):
+    """Run the WebSocket checks against the session-wide bot fixture"""
+    if not probe_endpoint(PolymarketWebSocketClient.WS_URL):
+        pytest.skip("WebSocket endpoint unreachable")
+    assert run_websocket_connection(bot)
+
+
 if __name__ == "__main__":
-    success = test_websocket_connection()
+    # Block-buffer progress output; prints before blocking waits pass flush=True
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    # Check if config exists
+    config_path = Path("config/config.yaml")
+    if not config_path.exists():
+        print("❌ Error: config/config.yaml not found!")
+        sys.exit(1)
+    
+    # Imported here so collecting this file under pytest does not load the whole bot
+    from src.bot import TradingBot
+    
+    print("📦 Initializing bot with WebSocket...", flush=True)
+    success = run_websocket_connection(TradingBot(config_path=str(config_path)))
     sys.exit(0 if success else 1)
 
@@ -10,16 +10,16 @@ import sys
 import time
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import pytest
 
-from src.bot import TradingBot
+from src.api.polymarket_websocket import PolymarketWebSocketClient, probe_endpoint
+from src.utils.market_utils import market_id as get_market_id
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def test_websocket_fallback():
+def run_websocket_fallback(bot) -> bool:
     """Test WebSocket with REST fallback"""
     
     print("=" * 80)
@@ -27,19 +27,15 @@ def test_websocket_fallback():
     print("=" * 80)
     print()
     
-    config_path = Path("config/config.yaml")
-    if not config_path.exists():
-        print("❌ Error: config/config.yaml not found!")
-        return False
-    
     try:
-        print("📦 Initializing bot...")
-        bot = TradingBot(config_path=str(config_path))
-        
         # Check WebSocket configuration
         ws_enabled_config = bot.config.get('websocket', {}).get('enabled', False)
         print(f"✅ WebSocket enabled in config: {ws_enabled_config}")
         
+        # Cached TCP probe, shared with test_websocket.py
+        ws_reachable = probe_endpoint(PolymarketWebSocketClient.WS_URL)
+        print(f"✅ WebSocket endpoint reachable: {ws_reachable}")
+        
         # Check adapter
         if hasattr(bot.polymarket_client, 'use_websocket'):
             adapter_ws = bot.polymarket_client.use_websocket
@@ -64,7 +60,7 @@ def test_websocket_fallback():
             
             # Test getting prices
             test_market = markets[0]
-            market_id = test_market.get('id') or test_market.get('market_id')
+            market_id = get_market_id(test_market)
             
             if market_id:
                 print(f"   Testing price fetch for market: {market_id[:30]}...")
@@ -96,13 +92,31 @@ def test_websocket_fallback():
         return True
     
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        print(f"\n❌ Error: {e}", flush=True)
         import traceback
         traceback.print_exc()
         return False
 
 
+@pytest.mark.xdist_group("bot")  # one worker, so the session bot is built once
+def test_websocket_fallback(bot):
+    """Run the fallback checks against the session-wide bot fixture"""
+    assert run_websocket_fallback(bot)
+
+
 if __name__ == "__main__":
-    success = test_websocket_fallback()
+    # Block-buffer progress output; prints before blocking waits pass flush=True
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    config_path = Path("config/config.yaml")
+    if not config_path.exists():
+        print("❌ Error: config/config.yaml not found!")
+        sys.exit(1)
+    
+    # Imported here so collecting this file under pytest does not load the whole bot
+    from src.bot import TradingBot
+    
+    print("📦 Initializing bot...", flush=True)
+    success = run_websocket_fallback(TradingBot(config_path=str(config_path)))
     sys.exit(0 if success else 1)
 
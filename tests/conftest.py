@@ -0,0 +1,78 @@
+"""Shared fixtures for strategy tests"""
+
+import time
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+from unittest.mock import Mock
+from src.risk.risk_manager import RiskManager
+
+# Default stub responses; read-only since every test shares them
+_ORDER = MappingProxyType({
+    'order_id': 'order123',
+    'status': 'pending'
+})
+_ACCOUNT_STATE = MappingProxyType({
+    'positions': (),
+    'open_orders': ()
+})
+
+
+def _stub_polymarket(
+    markets: Any = None,
+    price: Any = None,
+    order: Any = _ORDER,
+    **methods: Callable
+) -> SimpleNamespace:
+    """
+    Build a paper-trading Polymarket client stub with fixed responses.
+    
+    Strategy tests only check what the strategy returns, never how the client
+    was called, so plain functions stand in for Mock's call tracking.
+    
+    Args:
+        markets: Returned by get_markets
+        price: Returned by get_best_price for every market and outcome
+        order: Returned by place_order
+        **methods: Extra or replacement client methods
+        
+    Returns:
+        Namespace exposing the PolymarketClient methods strategies call
+    """
+    client = {
+        'paper_trading': True,
+        'get_markets': lambda active=True, limit=100, **kwargs: markets,
+        'get_best_price': lambda market_id, outcome='YES': price,
+        'place_order': lambda *args, **kwargs: order,
+        'get_account_state': lambda: _ACCOUNT_STATE
+    }
+    client.update(methods)
+    return SimpleNamespace(**client)
+
+
+@pytest.fixture
+def make_polymarket_stub():
+    """Factory for Polymarket client stubs (see _stub_polymarket)"""
+    return _stub_polymarket
+
+
+@pytest.fixture
+def mock_risk_manager():
+    """Create mock risk manager that allows every trade"""
+    return Mock(spec_set=[*dir(RiskManager), 'position_tracker'], **{
+        'check_trade_allowed.return_value': (True, None),
+        'position_tracker.positions': {}
+    })
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(request, monkeypatch):
+    """
+    Make time.sleep a no-op so retry/backoff paths don't wait on the wall clock.
+    
+    Tests that rely on a real delay (e.g. to make threads overlap) opt out
+    with @pytest.mark.real_sleep.
+    """
+    if request.node.get_closest_marker('real_sleep') is None:
+        monkeypatch.setattr(time, 'sleep', lambda *_: None)
@@ -0,0 +1,84 @@
+"""Tests for event-driven account tracker"""
+
+from src.risk.account_tracker import AccountTracker
+
+
+def test_order_lifecycle():
+    """Test open orders follow placement, partial fill and cancellation events"""
+    tracker = AccountTracker()
+
+    tracker.apply_order_event({
+        'event_type': 'order', 'type': 'PLACEMENT', 'id': 'o1', 'market': 'market1',
+        'outcome': 'Yes', 'side': 'BUY', 'price': '0.75', 'original_size': '10', 'size_matched': '0'
+    })
+    assert tracker.snapshot()['open_orders'][0]['side'] == 'buy'
+
+    tracker.apply_order_event({
+        'event_type': 'order', 'type': 'UPDATE', 'id': 'o1', 'market': 'market1',
+        'outcome': 'Yes', 'side': 'BUY', 'price': '0.75', 'original_size': '10', 'size_matched': '4'
+    })
+    assert tracker.open_orders['o1']['size'] == 6
+
+    tracker.apply_order_event({'event_type': 'order', 'type': 'CANCELLATION', 'id': 'o1'})
+    assert tracker.snapshot()['open_orders'] == []
+
+
+def test_trade_updates_position():
+    """Test MATCHED trades move positions and later statuses are ignored"""
+    tracker = AccountTracker()
+    tracker.reconcile([{'market_id': 'market1', 'outcome': 'Yes', 'size': 5.0}], [])
+
+    buy = {'event_type': 'trade', 'status': 'MATCHED', 'market': 'market1',
+           'outcome': 'Yes', 'side': 'BUY', 'size': '10'}
+    tracker.apply_trade_event(buy)
+    tracker.apply_trade_event(dict(buy, status='CONFIRMED'))
+    assert tracker.positions[('market1', 'Yes')]['size'] == 15
+
+    tracker.apply_trade_event(dict(buy, side='SELL', size='15'))
+    assert tracker.snapshot()['positions'] == []
+
+
+def test_maker_fill_uses_maker_order():
+    """Test maker fills move the position by our maker order, not the taker's side"""
+    tracker = AccountTracker(owner='our-key')
+    tracker.reconcile([{'market_id': 'market1', 'outcome': 'Yes', 'size': 10.0}], [])
+
+    # A taker buys 8 and 3 of it fills our resting sell
+    tracker.apply_trade_event({
+        'event_type': 'trade', 'id': 't1', 'status': 'MATCHED', 'trader_side': 'MAKER',
+        'market': 'market1', 'outcome': 'Yes', 'side': 'BUY', 'size': '8',
+        'maker_orders': [
+            {'order_id': 'theirs', 'owner': 'other-key', 'matched_amount': '5', 'outcome': 'Yes', 'side': 'SELL'},
+            {'order_id': 'ours', 'owner': 'our-key', 'matched_amount': '3', 'outcome': 'Yes', 'side': 'SELL'}
+        ]
+    })
+    assert tracker.positions[('market1', 'Yes')]['size'] == 7
+
+
+def test_failed_trade_is_reverted():
+    """Test a MATCHED fill is undone when the trade later FAILS"""
+    tracker = AccountTracker()
+    tracker.reconcile([{'market_id': 'market1', 'outcome': 'Yes', 'size': 5.0}], [])
+
+    buy = {'event_type': 'trade', 'id': 't1', 'status': 'MATCHED', 'market': 'market1',
+           'outcome': 'Yes', 'side': 'BUY', 'size': '10'}
+    tracker.apply_trade_event(buy)
+    tracker.apply_trade_event(dict(buy, status='RETRYING'))
+    assert tracker.positions[('market1', 'Yes')]['size'] == 15
+
+    tracker.apply_trade_event(dict(buy, status='FAILED'))
+    tracker.apply_trade_event(dict(buy, status='FAILED'))
+    assert tracker.positions[('market1', 'Yes')]['size'] == 5
+
+
+def test_snapshot_returns_copies():
+    """Test mutating a snapshot leaves the tracked state untouched"""
+    tracker = AccountTracker()
+    tracker.reconcile([{'market_id': 'market1', 'outcome': 'Yes', 'size': 5.0}],
+                      [{'order_id': 'o1', 'size': 2.0}])
+
+    snapshot = tracker.snapshot()
+    snapshot['positions'][0]['size'] = 0.0
+    snapshot['open_orders'][0]['size'] = 0.0
+    assert tracker.positions[('market1', 'Yes')]['size'] == 5.0
+    assert tracker.open_orders['o1']['size'] == 2.0
@@ -0,0 +1,150 @@
+"""Tests for error handling and retry decorators"""
+
+import asyncio
+import time
+
+import pytest
+from src.utils.error_handler import ErrorHandler, retry_on_error
+
+
+def _failing(errors, calls):
+    """Callable raising the given errors in turn, then returning 'ok'"""
+    errors = list(errors)
+    
+    def operation():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return 'ok'
+    return operation
+
+
+def test_retry_on_error_retry_count():
+    """Test a call is attempted max_retries + 1 times before the last error is raised"""
+    calls = []
+    func = retry_on_error(max_retries=3, delay=0.1)(_failing([ValueError(str(i)) for i in range(10)], calls))
+    
+    with pytest.raises(ValueError, match='3'):
+        func()
+    assert len(calls) == 4
+
+
+def test_retry_on_error_success_and_fallback():
+    """Test a later success is returned and exhausted retries use the fallback"""
+    calls = []
+    assert retry_on_error(max_retries=3, delay=0.1)(_failing([ValueError()] * 2, calls))() == 'ok'
+    assert len(calls) == 3
+    
+    calls = []
+    func = retry_on_error(max_retries=2, delay=0.1, fallback_value='fallback')(_failing([ValueError()] * 5, calls))
+    assert func() == 'fallback'
+    assert len(calls) == 3
+
+
+def test_retry_on_error_only_catches_given_exceptions():
+    """Test exceptions outside `exceptions` are raised without retrying"""
+    calls = []
+    func = retry_on_error(max_retries=3, delay=0.1, exceptions=(ValueError,))(_failing([KeyError()], calls))
+    
+    with pytest.raises(KeyError):
+        func()
+    assert len(calls) == 1
+
+
+def test_retry_on_error_deadline():
+    """Test no retry starts once its backoff sleep would end past the deadline"""
+    calls = []
+    func = retry_on_error(max_retries=5, delay=1.0, deadline=0.5)(_failing([ValueError()] * 10, calls))
+    with pytest.raises(ValueError):
+        func()
+    assert len(calls) == 1
+    
+    # time.sleep is a no-op here, so only the growing delays (1, 2, 4, 8) count
+    # against the 5s budget: the fourth failure's 8s backoff would overrun it
+    calls = []
+    func = retry_on_error(max_retries=5, delay=1.0, backoff=2.0, deadline=5.0)(_failing([ValueError()] * 10, calls))
+    with pytest.raises(ValueError):
+        func()
+    assert len(calls) == 4
+
+
+def test_async_retry_on_error():
+    """Test coroutine functions are retried and honour the deadline without sleeping it out"""
+    calls = []
+    
+    @retry_on_error(max_retries=2, delay=0.0)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError('reset')
+        return 'ok'
+    
+    assert asyncio.run(flaky()) == 'ok'
+    assert len(calls) == 3
+    
+    calls = []
+    
+    @retry_on_error(max_retries=5, delay=30.0, deadline=1.0)
+    async def failing():
+        calls.append(1)
+        raise ConnectionError('reset')
+    
+    started = time.monotonic()
+    with pytest.raises(ConnectionError):
+        asyncio.run(failing())
+    assert len(calls) == 1
+    assert time.monotonic() - started < 1.0
+
+
+def test_handle_error_retries_operation():
+    """Test handle_error retries the operation and counts the error once"""
+    handler = ErrorHandler()
+    calls = []
+    
+    result = handler.handle_error(
+        ValueError('first'), context='fetch', retry=True, max_retries=3,
+        operation=_failing([ValueError()] * 2, calls)
+    )
+    assert result == 'ok'
+    assert len(calls) == 3
+    assert handler.get_stats()['total_errors'] == 1
+    
+    calls = []
+    result = handler.handle_error(
+        ValueError('second'), context='fetch', fallback_value=[], retry=True, max_retries=2,
+        operation=_failing([ValueError()] * 5, calls)
+    )
+    assert result == []
+    assert len(calls) == 2
+
+
+def test_user_friendly_message_priority():
+    """Test rate limits win over timeouts, and timeouts over connection errors"""
+    handler = ErrorHandler()
+    rate_limit = handler.get_user_friendly_message(Exception('Connection timed out: HTTP 429'))
+    timeout = handler.get_user_friendly_message(Exception('connection TIMEOUT'))
+    connection = handler.get_user_friendly_message(OSError('Connection reset by peer'))
+    
+    assert rate_limit.startswith('Rate limit exceeded')
+    assert timeout.startswith('Request timed out')
+    assert connection.startswith('Unable to connect')
+    assert handler.get_user_friendly_message(KeyError('price')) == "Missing required data: 'price'"
+
+
+def test_error_stats_window_and_rate(monkeypatch):
+    """Test recent errors are capped at 100 and the rate covers their time span"""
+    handler = ErrorHandler()
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    for i in range(150):
+        handler.handle_error(ValueError(str(i)))
+        now[0] += 1
+    
+    stats = handler.get_stats()
+    
+    assert stats['total_errors'] == 150
+    assert stats['errors_by_type'] == {'ValueError': 150}
+    assert len(stats['recent_errors']) == 100
+    assert stats['recent_errors'][0]['message'] == '50'
+    # 100 errors since the oldest kept one at t=1050
+    assert stats['error_rate'] == pytest.approx(1.0)
@@ -1,48 +1,27 @@
 """Tests for liquidity strategy"""
 
 import pytest
-from unittest.mock import Mock
+from types import MappingProxyType
 from src.strategies.liquidity import LiquidityStrategy
-from src.api.polymarket_client import PolymarketClient
-from src.risk.risk_manager import RiskManager
 
-
-@pytest.fixture
-def mock_polymarket_client():
-    """Create mock Polymarket client"""
-    client = Mock(spec=PolymarketClient)
-    client.paper_trading = True
-    
-    client.get_markets.return_value = [
-        {
-            'id': 'market1',
-            'question': 'Test market?'
-        }
-    ]
-    
-    # Wide spread: bid=0.45, ask=0.55 (10% spread)
-    client.get_best_price.return_value = {
-        'bid': 0.45,
-        'ask': 0.55,
-        'spread': 0.10
+_MARKETS = [
+    {
+        'id': 'market1',
+        'question': 'Test market?'
     }
-    
-    client.place_order.return_value = {
-        'order_id': 'order123',
-        'status': 'pending'
-    }
-    
-    return client
+]
+# Wide spread: bid=0.45, ask=0.55 (10% spread)
+_PRICE = MappingProxyType({
+    'bid': 0.45,
+    'ask': 0.55,
+    'spread': 0.10
+})
 
 
 @pytest.fixture
-def mock_risk_manager():
-    """Create mock risk manager"""
-    rm = Mock(spec=RiskManager)
-    rm.check_trade_allowed.return_value = (True, None)
-    rm.position_tracker = Mock()
-    rm.position_tracker.positions = {}
-    return rm
+def mock_polymarket_client(make_polymarket_stub):
+    """Create mock Polymarket client"""
+    return make_polymarket_stub(markets=_MARKETS, price=_PRICE)
 
 
 def test_liquidity_strategy_scan(mock_polymarket_client, mock_risk_manager):
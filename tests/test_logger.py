@@ -0,0 +1,17 @@
+"""Tests for logging setup"""
+
+import logging
+from src.utils.logger import setup_logger
+
+
+def test_setup_logger_without_console():
+    """Test that console=False attaches no console handler"""
+    logger = setup_logger('test_logger_no_console', console=False)
+    assert len(logger.handlers) == 0
+
+
+def test_setup_logger_with_console():
+    """Test that the default setup attaches one console handler"""
+    logger = setup_logger('test_logger_console')
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], logging.StreamHandler)
@@ -0,0 +1,28 @@
+"""Tests for market analysis utilities"""
+
+from src.utils.market_analyzer import MarketAnalyzer
+
+
+def test_find_correlated_markets_sees_in_place_edits():
+    """Test that editing a market in place is reflected in the next search"""
+    markets = [
+        {'question': 'Will BTC hit 100k?', 'description': ''},
+        {'question': 'Will ETH flip BTC?', 'description': ''}
+    ]
+    assert MarketAnalyzer.find_correlated_markets(markets, 'btc') == markets
+    
+    markets[1]['question'] = 'Will ETH hit 10k?'
+    assert MarketAnalyzer.find_correlated_markets(markets, 'btc') == [markets[0]]
+    
+    markets[0] = {'question': 'Will SOL hit 500?', 'description': 'Unlike BTC'}
+    assert MarketAnalyzer.find_correlated_markets(markets, 'BTC') == [markets[0]]
+
+
+def test_find_correlated_markets_multi():
+    """Test that each keyword gets the markets mentioning it"""
+    markets = [
+        {'question': 'Will Trump win?', 'description': 'US election'},
+        {'question': 'Election turnout above 60%?', 'description': None}
+    ]
+    results = MarketAnalyzer.find_correlated_markets_multi(markets, ['Trump', 'election'])
+    assert results == {'Trump': [markets[0]], 'election': markets}
@@ -0,0 +1,82 @@
+"""Tests for market cache"""
+
+import pytest
+from unittest.mock import Mock
+from src.utils.market_cache import MarketCache
+
+
+def test_price_cache_evicts_least_recently_used():
+    """Test that the price cache stays bounded and keeps recently used entries"""
+    client = Mock(spec=['get_best_price'])
+    client.get_best_price.side_effect = lambda market_id, outcome: {'bid': 0.4, 'ask': 0.5}
+    cache = MarketCache(client, cache_ttl=60.0, max_price_entries=2)
+    
+    cache.get_price('m1', 'YES')
+    cache.get_price('m2', 'YES')
+    cache.get_price('m1', 'YES')  # hit, m1 becomes most recent
+    cache.get_price('m3', 'YES')  # evicts m2
+    
+    assert len(cache._price_cache) == 2
+    assert client.get_best_price.call_count == 3
+    
+    cache.get_price('m1', 'YES')
+    assert client.get_best_price.call_count == 3
+    cache.get_price('m2', 'YES')
+    assert client.get_best_price.call_count == 4
+
+
+@pytest.mark.real_sleep  # the sleep keeps the three batches' fetches in flight together
+def test_parallel_fetches_share_inflight_requests():
+    """Test that overlapping batches issue one fetch per market/outcome"""
+    import threading
+    import time
+    
+    def get_best_price(market_id, outcome):
+        time.sleep(0.2)
+        return {'bid': 0.4, 'ask': 0.5}
+    
+    client = Mock(spec=['get_best_price'])
+    client.get_best_price.side_effect = get_best_price
+    cache = MarketCache(client, cache_ttl=60.0)
+    pairs = [('m1', 'YES'), ('m2', 'YES')]
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_prices_parallel(pairs)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.close()
+    
+    assert client.get_best_price.call_count == 2
+    assert all(len(result) == 2 for result in results)
+    assert cache._inflight == {}
+
+
+def test_end_ts_epoch_parsed_once_per_market():
+    """Test that market end dates are cached as epoch seconds until the date changes"""
+    cache = MarketCache(Mock())
+    
+    assert cache.get_end_ts_epoch('m1', '2026-01-01T00:00:00Z') == 1767225600
+    assert cache._end_ts['m1'] == ('2026-01-01T00:00:00Z', 1767225600)
+    assert cache.get_end_ts_epoch('m1', '2026-01-02T00:00:00Z') == 1767312000
+    assert cache.get_end_ts_epoch('m2', 'not-a-date') is None
+    assert cache.get_end_ts_epoch('m3', None) is None
+    cache.close()
+
+
+def test_prices_bulk_keys_by_market_and_reuses_cache():
+    """Test that bulk lookups return prices per market id and only fetch uncached markets"""
+    client = Mock(spec=['get_best_price'])
+    client.get_best_price.side_effect = lambda market_id, outcome: None if market_id == 'm3' else {'ask': 0.5}
+    cache = MarketCache(client, cache_ttl=60.0)
+    
+    cache.get_price('m1', 'YES')
+    prices = cache.get_prices_bulk(['m1', 'm2', 'm3'], 'YES')
+    
+    assert prices == {'m1': {'ask': 0.5}, 'm2': {'ask': 0.5}}
+    assert client.get_best_price.call_count == 3
+    cache.close()
@@ -1,50 +1,26 @@
 """Tests for micro-spread strategy"""
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from types import MappingProxyType
 from src.strategies.micro_spreads import MicroSpreadStrategy
-from src.api.polymarket_client import PolymarketClient
-from src.risk.risk_manager import RiskManager
 
-
-@pytest.fixture
-def mock_polymarket_client():
-    """Create mock Polymarket client"""
-    client = Mock(spec=PolymarketClient)
-    client.paper_trading = True
-    
-    # Mock get_markets
-    client.get_markets.return_value = [
-        {
-            'id': 'market1',
-            'question': 'Test market?'
-        }
-    ]
-    
-    # Mock get_best_price
-    client.get_best_price.return_value = {
-        'bid': 0.05,
-        'ask': 0.06,
-        'spread': 0.01
+_MARKETS = [
+    {
+        'id': 'market1',
+        'question': 'Test market?'
     }
-    
-    # Mock place_order
-    client.place_order.return_value = {
-        'order_id': 'order123',
-        'status': 'pending'
-    }
-    
-    return client
+]
+_PRICE = MappingProxyType({
+    'bid': 0.05,
+    'ask': 0.06,
+    'spread': 0.01
+})
 
 
 @pytest.fixture
-def mock_risk_manager():
-    """Create mock risk manager"""
-    rm = Mock(spec=RiskManager)
-    rm.check_trade_allowed.return_value = (True, None)
-    rm.position_tracker = Mock()
-    rm.position_tracker.positions = {}
-    return rm
+def mock_polymarket_client(make_polymarket_stub):
+    """Create mock Polymarket client"""
+    return make_polymarket_stub(markets=_MARKETS, price=_PRICE)
 
 
 def test_micro_spread_strategy_initialization(mock_polymarket_client, mock_risk_manager):
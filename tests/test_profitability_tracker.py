@@ -0,0 +1,51 @@
+"""Tests for profitability tracker"""
+
+from datetime import datetime, timedelta
+from src.utils.profitability_tracker import ProfitabilityTracker, TradeRecord
+
+
+def _trade(trade_id, strategy, pnl, exit_offset_s):
+    """Build a trade exiting exit_offset_s seconds after a fixed start"""
+    start = datetime(2024, 1, 1)
+    return TradeRecord(
+        trade_id=trade_id, strategy=strategy, market_id='market1',
+        entry_time=start, exit_time=start + timedelta(seconds=exit_offset_s),
+        entry_price=0.5, exit_price=0.6, size=10.0, side='buy',
+        pnl=pnl, pnl_pct=pnl / 5.0
+    )
+
+
+def test_overall_stats():
+    """Test running aggregates match the recorded trades"""
+    tracker = ProfitabilityTracker()
+    tracker.set_initial_capital(100.0)
+    for i, pnl in enumerate([2.0, -1.0, 0.0, 4.0, -3.0]):
+        tracker.record_trade(_trade(str(i), 'a', pnl, i))
+    
+    stats = tracker.get_overall_stats()
+    assert stats['total_trades'] == 5
+    assert stats['winning_trades'] == 2
+    assert stats['losing_trades'] == 2
+    assert stats['total_pnl'] == 2.0
+    assert stats['avg_win'] == 3.0
+    assert stats['avg_loss'] == -2.0
+    assert stats['largest_win'] == 4.0
+    assert stats['largest_loss'] == -3.0
+    assert stats['profit_factor'] == 1.5
+    assert stats['current_capital'] == 102.0
+
+
+def test_recent_trades_and_pnl_columns():
+    """Test recent trades come newest first and P&L columns filter by strategy"""
+    tracker = ProfitabilityTracker()
+    tracker.set_initial_capital(100.0)
+    for i in range(100):
+        tracker.record_trade(_trade(str(i), 'a' if i % 2 else 'b', float(i), exit_offset_s=i % 10))
+    
+    recent = tracker.get_recent_trades(3)
+    assert [t.trade_id for t in recent] == ['9', '19', '29']
+    assert tracker.get_recent_trades(0) == []
+    
+    assert list(tracker.get_pnl_array('b')[:3]) == [0.0, 2.0, 4.0]
+    assert len(tracker.get_pnl_array()) == 100
+    assert len(tracker.get_pnl_array('missing')) == 0
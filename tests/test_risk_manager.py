@@ -69,13 +69,6 @@ def test_stop_loss():
         size=100.0,
         entry_price=0.5
     )
-    rm.add_position(position)
-    
-    # Check stop loss with price down 15% (should trigger)
-    triggered = rm.check_stop_loss('test1', 0.425)  # 15% down
-    assert triggered is True
-    
-    # Check stop loss with price down 5% (should not trigger)
     position2 = Position(
         position_id='test2',
         market_id='market2',
@@ -84,7 +77,85 @@ def test_stop_loss():
         size=100.0,
         entry_price=0.5
     )
-    rm.add_position(position2)
+    for p in (position, position2):
+        rm.add_position(p)
+    
+    # Check stop loss with price down 15% (should trigger)
+    triggered = rm.check_stop_loss('test1', 0.425)  # 15% down
+    assert triggered is True
+    
+    # Check stop loss with price down 5% (should not trigger)
     triggered = rm.check_stop_loss('test2', 0.475)  # 5% down
     assert triggered is False
 
+
+def test_stop_losses_bulk():
+    """Test the vectorized stop loss check matches the per-position rule"""
+    rm = RiskManager({'stop_loss_pct': 10.0, 'initial_capital': 10000.0})
+    for i, side in enumerate(['buy', 'buy', 'sell', 'sell']):
+        rm.add_position(Position(
+            position_id=f'test{i}',
+            market_id=f'market{i}',
+            strategy='test',
+            side=side,
+            size=100.0,
+            entry_price=0.5
+        ))
+    
+    current_prices = {
+        'test0': 0.425,   # buy, 15% down -> triggers
+        'test1': 0.475,   # buy, 5% down
+        'test2': 0.575,   # sell, price 15% up -> triggers
+        'test3': 0.425,   # sell, price down is a gain
+        'unknown': 0.1    # not tracked
+    }
+    
+    triggered = rm.check_stop_losses(current_prices)
+    assert triggered == ['test0', 'test2']
+    for position_id in ('test0', 'test1', 'test2', 'test3'):
+        assert (position_id in triggered) is rm.check_stop_loss(position_id, current_prices[position_id])
+    assert rm.check_stop_losses({}) == []
+
+
+def test_stop_losses_bulk_matches_scalar_rule():
+    """Test the vectorized check agrees with check_stop_loss over a grid of prices"""
+    rm = RiskManager({'stop_loss_pct': 10.0, 'initial_capital': 10000.0})
+    current_prices = {}
+    for entry_price in (0.1, 0.33, 0.5, 0.9):
+        # Exact 10% moves sit on the threshold
+        prices = [round(0.01 * step, 2) for step in range(1, 100)] + [entry_price * 0.9, entry_price * 1.1]
+        for side in ('buy', 'sell'):
+            for j, price in enumerate(prices):
+                position_id = f'{side}-{entry_price}-{j}'
+                rm.add_position(Position(
+                    position_id=position_id,
+                    market_id=position_id,
+                    strategy='test',
+                    side=side,
+                    size=10.0,
+                    entry_price=entry_price
+                ))
+                current_prices[position_id] = price
+    
+    expected = [
+        position_id for position_id, price in current_prices.items()
+        if rm.check_stop_loss(position_id, price)
+    ]
+    assert expected
+    assert rm.check_stop_losses(current_prices) == expected
+
+
+def test_stop_losses_bulk_ignores_zero_entry_price():
+    """Test positions with a zero entry price never trigger"""
+    rm = RiskManager({'stop_loss_pct': 10.0, 'initial_capital': 10000.0})
+    for side in ('buy', 'sell'):
+        rm.add_position(Position(
+            position_id=side,
+            market_id='market1',
+            strategy='test',
+            side=side,
+            size=10.0,
+            entry_price=0.0
+        ))
+    
+    assert rm.check_stop_losses({'buy': 0.5, 'sell': 0.5}) == []
@@ -1,48 +1,28 @@
 """Tests for single-market arbitrage strategy"""
 
 import pytest
-from unittest.mock import Mock
+from types import MappingProxyType
 from src.strategies.single_arbitrage import SingleArbitrageStrategy
-from src.api.polymarket_client import PolymarketClient
-from src.risk.risk_manager import RiskManager
 
-
-@pytest.fixture
-def mock_polymarket_client():
-    """Create mock Polymarket client"""
-    client = Mock(spec=PolymarketClient)
-    client.paper_trading = True
-    
-    client.get_markets.return_value = [
-        {
-            'id': 'market1',
-            'question': 'Test market?',
-            'resolution_source': 'official'
-        }
-    ]
-    
-    # Mock arbitrage opportunity: YES=0.45, NO=0.50 (total=0.95)
-    client.get_best_price.side_effect = [
-        {'ask': 0.45},  # YES
-        {'ask': 0.50}   # NO
-    ]
-    
-    client.place_order.return_value = {
-        'order_id': 'order123',
-        'status': 'pending'
+_MARKETS = [
+    {
+        'id': 'market1',
+        'question': 'Test market?',
+        'resolution_source': 'official'
     }
-    
-    return client
+]
+# Arbitrage opportunity: YES=0.45, NO=0.50 (total=0.95)
+_YES_PRICE = MappingProxyType({'ask': 0.45})
+_NO_PRICE = MappingProxyType({'ask': 0.50})
 
 
 @pytest.fixture
-def mock_risk_manager():
-    """Create mock risk manager"""
-    rm = Mock(spec=RiskManager)
-    rm.check_trade_allowed.return_value = (True, None)
-    rm.position_tracker = Mock()
-    rm.position_tracker.positions = {}
-    return rm
+def mock_polymarket_client(make_polymarket_stub):
+    """Create mock Polymarket client"""
+    return make_polymarket_stub(
+        markets=_MARKETS,
+        get_best_price=lambda market_id, outcome='YES': _YES_PRICE if outcome == 'YES' else _NO_PRICE
+    )
 
 
 def test_single_arbitrage_scan(mock_polymarket_client, mock_risk_manager):
@@ -69,3 +49,24 @@ def test_single_arbitrage_scan(mock_polymarket_client, mock_risk_manager):
     assert opp['total_price'] < 1.0
     assert opp['profit_pct'] > 0
 
+
+
+def test_single_arbitrage_multi_choice_scan(make_polymarket_stub, mock_risk_manager):
+    """Test multi-choice markets whose outcome asks sum below 1 are reported"""
+    outcomes = [{'token_id': f'token{i}', 'name': f'Option {i}'} for i in range(3)]
+    client = make_polymarket_stub(
+        markets=[{'id': 'market2', 'question': 'Who wins?', 'outcomes': outcomes}],
+        price=MappingProxyType({'ask': 0.30})
+    )
+    strategy = SingleArbitrageStrategy(
+        name='single_arbitrage',
+        polymarket_client=client,
+        risk_manager=mock_risk_manager,
+        config={'enabled': True, 'max_total_price': 0.99, 'min_profit_pct': 1.0, 'require_clear_resolution': False}
+    )
+    
+    multi_choice = [opp for opp in strategy.scan_opportunities() if opp.get('multi_choice')]
+    
+    assert len(multi_choice) == 1
+    assert multi_choice[0]['total_price'] == pytest.approx(0.90)
+    assert multi_choice[0]['profit'] == pytest.approx(0.10)
@@ -0,0 +1,143 @@
+"""Tests for spread scalping strategy"""
+
+import pytest
+from types import MappingProxyType
+from src.strategies.spread_scalping import SpreadScalpingStrategy
+
+_MARKETS_RESPONSE = {
+    'markets': [
+        {
+            'condition_id': 'market1',
+            'enable_order_book': True,
+            'accepting_orders': True,
+            'closed': False,
+            'end_date_iso': '2099-12-31T23:59:59Z',
+            'tokens': [
+                {'token_id': 'token_yes', 'outcome': 'Yes'},
+                {'token_id': 'token_no', 'outcome': 'No'}
+            ]
+        }
+    ],
+    'next_cursor': None
+}
+# Likely outcome with a 5 cent spread
+_PRICE = MappingProxyType({
+    'bid': 0.75,
+    'ask': 0.80,
+    'spread': 0.05
+})
+
+
+@pytest.fixture
+def mock_polymarket_client(make_polymarket_stub):
+    """Create mock Polymarket client"""
+    return make_polymarket_stub(markets=_MARKETS_RESPONSE, price=_PRICE)
+
+
+def test_spread_scalping_scan(mock_polymarket_client, mock_risk_manager):
+    """Test entry signal detection on a wide-spread likely outcome"""
+    config = {
+        'enabled': True,
+        'min_spread_cents': 0.03,
+        'likely_outcome_threshold': 0.60
+    }
+
+    strategy = SpreadScalpingStrategy(
+        name='spread_scalping',
+        polymarket_client=mock_polymarket_client,
+        risk_manager=mock_risk_manager,
+        config=config
+    )
+
+    opportunities = strategy.scan_opportunities()
+
+    assert len(opportunities) == 1
+    opp = opportunities[0]
+    assert opp['type'] == 'entry'
+    assert opp['market_id'] == 'market1'
+    assert opp['bid'] == 0.75
+    assert opp['spread'] == pytest.approx(0.05)
+
+
+def test_spread_scalping_threshold_boundary(mock_polymarket_client, mock_risk_manager):
+    """Test that a spread exactly at the minimum is accepted"""
+    config = {
+        'enabled': True,
+        'min_spread_cents': 0.05,
+        'likely_outcome_threshold': 0.775
+    }
+
+    strategy = SpreadScalpingStrategy(
+        name='spread_scalping',
+        polymarket_client=mock_polymarket_client,
+        risk_manager=mock_risk_manager,
+        config=config
+    )
+
+    # 0.80 - 0.75 is 0.050000000000000044 in floats; the check must not depend on that
+    assert len(strategy.scan_opportunities()) == 1
+
+
+def _entry_market(market_id):
+    """Open market whose Yes outcome clears the default test thresholds"""
+    return {
+        'condition_id': market_id,
+        'enable_order_book': True,
+        'accepting_orders': True,
+        'closed': False,
+        'end_date_iso': '2099-12-31T23:59:59Z',
+        'tokens': [
+            {'token_id': f'{market_id}_yes', 'outcome': 'Yes'},
+            {'token_id': f'{market_id}_no', 'outcome': 'No'}
+        ]
+    }
+
+
+def test_spread_scalping_max_positions_with_collected_opportunities(make_polymarket_stub, mock_risk_manager):
+    """Test that the position cap holds when opportunities are collected before executing"""
+    client = make_polymarket_stub(
+        markets={'markets': [_entry_market(f'market{i}') for i in range(3)], 'next_cursor': None},
+        price=_PRICE
+    )
+    strategy = SpreadScalpingStrategy(
+        name='spread_scalping',
+        polymarket_client=client,
+        risk_manager=mock_risk_manager,
+        config={'enabled': True, 'min_spread_cents': 0.03, 'likely_outcome_threshold': 0.60, 'max_positions': 1}
+    )
+    
+    opportunities = strategy.scan_opportunities()
+    assert len(opportunities) == 3
+    
+    assert len(strategy.run(opportunities)) == 1
+    assert len(strategy.active_markets) == 1
+
+
+def test_bot_prescan_skips_streaming_strategies(mock_polymarket_client, mock_risk_manager):
+    """Test that the bot's concurrent prescan leaves streaming strategies to run() itself"""
+    from concurrent.futures import ThreadPoolExecutor
+    from types import SimpleNamespace
+    from src.bot import TradingBot
+    from src.strategies.base_strategy import BaseStrategy
+    
+    class ListStrategy(BaseStrategy):
+        def scan_opportunities(self):
+            return [{'market_id': 'market1'}]
+        
+        def execute_trade(self, opportunity):
+            return None
+    
+    strategies = {
+        'list': ListStrategy('list', mock_polymarket_client, mock_risk_manager, {}),
+        'spread_scalping': SpreadScalpingStrategy(
+            name='spread_scalping',
+            polymarket_client=mock_polymarket_client,
+            risk_manager=mock_risk_manager,
+            config={'enabled': True}
+        )
+    }
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = TradingBot._scan_strategies(SimpleNamespace(_scan_executor=executor), strategies)
+    
+    assert results == {'list': [{'market_id': 'market1'}]}